@@ -206,6 +206,10 @@ def main():
         parser.print_help()
         return
     
+    # 可选：设置 AETHERIUS_USE_UVLOOP=1 时使用 uvloop 事件循环
+    from aetherius.core.event_manager import install_uvloop
+    install_uvloop()
+    
     # 传统 CLI 命令 (console, cmd, stop, restart, status 等)
     # 这些命令使用现有的 CLI 系统
     if args.command in ['console', 'cmd', 'stop', 'restart', 'status']:
@@ -9,7 +9,7 @@ from typing import Any, Optional
 import yaml
 
 from ..core.config import get_config_manager
-from ..core.event_manager import get_event_manager
+from ..core.event_manager import EventListener, get_event_manager
 from .plugin import Plugin, PluginContext, PluginInfo, SimplePlugin
 
 logger = logging.getLogger(__name__)
@@ -35,6 +35,7 @@ class PluginManager:
         self._plugin_info: dict[str, PluginInfo] = {}
         self._enabled_plugins: set[str] = set()
         self._loaded_plugins: set[str] = set()
+        self._event_listeners: dict[str, list[EventListener]] = {}
 
         # Plugin data directories
         self.data_dir = Path("data/plugins")
@@ -268,6 +269,13 @@ class PluginManager:
             plugin.enabled = True
             self._enabled_plugins.add(plugin_name)
 
+            # Register the module's @on_event listeners while enabled
+            module = sys.modules.get(f"plugins.{plugin_name}")
+            if module is not None:
+                self._event_listeners[plugin_name] = (
+                    self.event_manager.register_module(module)
+                )
+
             logger.info(f"Enabled plugin: {plugin_name}")
             return True
 
@@ -294,6 +302,9 @@ class PluginManager:
             plugin.enabled = False
             self._enabled_plugins.remove(plugin_name)
 
+            for listener in self._event_listeners.pop(plugin_name, ()):
+                self.event_manager.unregister_listener(listener)
+
             logger.info(f"Disabled plugin: {plugin_name}")
             return True
 
@@ -183,6 +183,20 @@ def setup_event_handlers() -> None:
         elif "advancement" in event.message.lower():
             console.print(f"[gold]🏆[/gold] {event.message}")
 
+    # @on_event only tags the handlers; register them all in one batch
+    get_event_manager().register_decorated(
+        (
+            handle_player_join,
+            handle_player_leave,
+            handle_player_chat,
+            handle_player_death,
+            handle_server_started,
+            handle_server_stopped,
+            handle_server_crash,
+            handle_log_line,
+        )
+    )
+
 
 @server_app.command("start")
 def server_start(
@@ -4,10 +4,16 @@
 """
 
 import asyncio
+import functools
+import inspect
 import logging
 import os
-import readline
+import queue
+import selectors
+import subprocess
 import sys
+import threading
+import time
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
@@ -28,6 +34,35 @@ try:
 except ImportError:
     HAS_ENHANCED_CONSOLE = False
 
+# readline is unavailable on some platforms (e.g. Windows)
+try:
+    import readline
+except ImportError:
+    readline = None
+
+# Import prompt_toolkit for asyncio-friendly interactive input
+try:
+    from prompt_toolkit import PromptSession
+    from prompt_toolkit.completion import WordCompleter
+    from prompt_toolkit.formatted_text import ANSI
+    from prompt_toolkit.patch_stdout import patch_stdout
+
+    HAS_PROMPT_TOOLKIT = True
+except ImportError:
+    HAS_PROMPT_TOOLKIT = False
+
+# Import event system for player event display
+try:
+    from aetherius.core.event_manager import get_event_manager
+    from aetherius.core.events_base import (
+        PlayerChatEvent,
+        PlayerJoinEvent,
+        PlayerLeaveEvent,
+    )
+except ImportError:
+    get_event_manager = None
+    PlayerChatEvent = PlayerJoinEvent = PlayerLeaveEvent = None
+
 # 简单的颜色支持检测
 HAS_COLOR = (
     hasattr(sys.stdout, "isatty")
@@ -53,6 +88,41 @@ if not HAS_COLOR:
         RESET_ALL = ""
 
 
+# 服务器日志行模板 (时间戳, 消息)，导入时一次性构建
+_LOG_FMT_INFO = f"{Fore.GREEN}[%s] MC日志:{Style.RESET_ALL} %s\n"
+_LOG_FMT_WARN = f"{Fore.YELLOW}[%s] MC警告:{Style.RESET_ALL} %s\n"
+_LOG_FMT_ERROR = f"{Fore.RED}[%s] MC错误:{Style.RESET_ALL} %s\n"
+_LOG_FMT_OTHER = f"{Fore.CYAN}[%s] MC日志:{Style.RESET_ALL} %s\n"
+
+# 事件与命令回显模板
+_PLAYER_JOIN_FMT = f"{Fore.CYAN}[PLAYER]{Style.RESET_ALL} %s 加入了游戏\n"
+_PLAYER_LEAVE_FMT = f"{Fore.CYAN}[PLAYER]{Style.RESET_ALL} %s 离开了游戏\n"
+_PLAYER_CHAT_FMT = f"{Fore.BLUE}[CHAT]{Style.RESET_ALL} <%s> %s\n"
+_MC_SENT_FMT = f"{Fore.GREEN}→ Minecraft:{Style.RESET_ALL} /%s"
+_MC_PENDING_FMT = f"{Fore.YELLOW}→ Minecraft:{Style.RESET_ALL} /%s"
+_MC_OFFLINE_FMT = f"{Fore.RED}→ Minecraft (未运行):{Style.RESET_ALL} /%s"
+_MC_MOCK_FMT = f"{Fore.YELLOW}→ 模拟Minecraft:{Style.RESET_ALL} /%s"
+_MC_ERROR_FMT = f"{Fore.RED}✗ Minecraft错误:{Style.RESET_ALL} %s"
+_CHAT_SENT_FMT = f"{Fore.BLUE}💬 聊天:{Style.RESET_ALL} %s"
+_CHAT_MOCK_FMT = f"{Fore.BLUE}💬 模拟聊天:{Style.RESET_ALL} %s"
+_CHAT_ERROR_FMT = f"{Fore.RED}✗ 聊天错误:{Style.RESET_ALL} %s"
+
+
+# (整数秒, 格式化后的时间戳)，同一秒内的日志行复用同一个字符串
+_hms_cache: tuple[int, str] = (0, "")
+
+
+def _hms() -> str:
+    """当前时间的 HH:MM:SS 字符串，按秒缓存"""
+    global _hms_cache
+    sec = int(time.time())
+    cached_sec, text = _hms_cache
+    if sec != cached_sec:
+        text = time.strftime("%H:%M:%S", time.localtime(sec))
+        _hms_cache = (sec, text)
+    return text
+
+
 class CommandType(Enum):
     """命令类型 - 统一前缀识别系统"""
 
@@ -65,6 +135,183 @@ class CommandType(Enum):
     CHAT = ""  # 聊天消息
 
 
+# 命令前缀字符到命令类型的映射
+_PREFIX_MAP = {t.value: t for t in CommandType if t.value}
+
+# Tab补全候选命令
+_COMPLETIONS = (
+    "!help",
+    "!status",
+    "!server",
+    "!clear",
+    "!quit",
+    "!exit",
+    "#help",
+    "#list",
+    "$help",
+    "$list",
+    "@help",
+    "@list",
+    "/help",
+    "/list",
+    "/stop",
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _completion_matches(text: str) -> tuple[str, ...]:
+    """返回以 text 开头的候选命令"""
+    return tuple(c for c in _COMPLETIONS if c.startswith(text))
+
+
+def _completer(text: str, state: int) -> str | None:
+    """readline补全函数，只在内存中的固定命令集合内匹配"""
+    matches = _completion_matches(text)
+    return matches[state] if state < len(matches) else None
+
+
+# 启动横幅
+_STARTUP_BANNER = f"""{Fore.CYAN}
+╔═══════════════════════════════════════════════════════════════════╗
+║                                                                   ║
+║    █████╗ ███████╗████████╗██╗  ██╗███████╗██████╗ ██╗██╗   ██╗███║
+║   ██╔══██╗██╔════╝╚══██╔══╝██║  ██║██╔════╝██╔══██╗██║██║   ██║██╔║
+║   ███████║█████╗     ██║   ███████║█████╗  ██████╔╝██║██║   ██║███║
+║   ██╔══██║██╔══╝     ██║   ██╔══██║██╔══╝  ██╔══██╗██║██║   ██║╚══║
+║   ██║  ██║███████╗   ██║   ██║  ██║███████╗██║  ██║██║╚██████╔╝███║
+║   ╚═╝  ╚═╝╚══════╝   ╚═╝   ╚═╝  ╚═╝╚══════╝╚═╝  ╚═╝╚═╝ ╚═════╝ ╚══║
+║                                                                   ║
+║               高性能 Minecraft 服务器管理引擎                        ║
+║                                                                   ║
+╚═══════════════════════════════════════════════════════════════════╝{Style.RESET_ALL}
+
+{Fore.GREEN}✓ Aetherius Console Ready{Style.RESET_ALL}
+
+{Fore.YELLOW}统一前缀识别系统:{Style.RESET_ALL}
+  {Fore.WHITE}/ {Style.RESET_ALL} - MC指令 (直接发送至Minecraft服务器)
+  {Fore.WHITE}! {Style.RESET_ALL} - Aetherius系统指令
+  {Fore.WHITE}@ {Style.RESET_ALL} - 脚本指令 (执行自定义脚本)
+  {Fore.WHITE}# {Style.RESET_ALL} - 插件指令 (调用插件特定功能)
+  {Fore.WHITE}$ {Style.RESET_ALL} - 组件指令 (组件管理命令)
+  {Fore.WHITE}% {Style.RESET_ALL} - 管理指令 (管理相关命令)
+
+{Fore.CYAN}输入 !help 查看详细帮助{Style.RESET_ALL}
+"""
+
+
+# 插件命令帮助
+_PLUGIN_HELP_TEXT = f"""
+{Fore.MAGENTA}=== 插件管理命令帮助 ==={Style.RESET_ALL}
+
+{Fore.YELLOW}可用命令:{Style.RESET_ALL}
+  #help               显示此帮助信息
+  #list               列出所有插件
+  #enable <插件名>     启用指定插件
+  #disable <插件名>    禁用指定插件
+  #reload <插件名>     重载指定插件
+  #info <插件名>       显示插件详细信息
+
+{Fore.YELLOW}示例:{Style.RESET_ALL}
+  #list
+  #enable MyPlugin
+  #disable MyPlugin
+  #reload MyPlugin
+  #info MyPlugin
+"""
+
+
+# 组件命令帮助
+_COMPONENT_HELP_TEXT = f"""
+{Fore.MAGENTA}=== 组件管理命令帮助 ==={Style.RESET_ALL}
+
+{Fore.YELLOW}可用命令:{Style.RESET_ALL}
+  $help               显示此帮助信息
+  $list               列出所有组件
+  $scan               扫描并发现组件
+  $load <组件名>       加载指定组件
+  $enable <组件名>     启用指定组件
+  $disable <组件名>    禁用指定组件
+  $reload <组件名>     重载指定组件
+  $info <组件名>       显示组件详细信息
+
+{Fore.YELLOW}示例:{Style.RESET_ALL}
+  $list
+  $scan
+  $load TestComponent
+  $enable TestComponent
+  $disable TestComponent
+  $reload TestComponent
+  $info TestComponent
+"""
+
+
+# 控制台帮助
+_HELP_TEXT = f"""
+{Fore.CYAN}=== Aetherius 控制台帮助 ==={Style.RESET_ALL}
+
+{Fore.YELLOW}统一前缀识别系统:{Style.RESET_ALL}
+  {Fore.GREEN}/ {Style.RESET_ALL} MC指令          (例: /help, /stop, /list)
+  {Fore.BLUE}! {Style.RESET_ALL} Aetherius系统指令 (例: !status, !quit, !help)
+  {Fore.MAGENTA}@ {Style.RESET_ALL} 脚本指令        (例: @run, @list)
+  {Fore.YELLOW}# {Style.RESET_ALL} 插件指令        (例: #list, #enable <插件名>, #help)
+  {Fore.CYAN}$ {Style.RESET_ALL} 组件指令        (例: $list, $enable <组件名>, $help)
+  {Fore.RED}% {Style.RESET_ALL} 管理指令        (预留扩展)
+  {Fore.WHITE}  {Style.RESET_ALL} 聊天消息        (直接输入文本)
+
+{Fore.YELLOW}常用命令:{Style.RESET_ALL}
+  !help     显示此帮助
+  !status   显示控制台状态
+  !server   显示服务器状态
+  !clear    清屏
+  !quit     退出控制台
+
+{Fore.YELLOW}管理命令:{Style.RESET_ALL}
+  #help     显示插件管理帮助
+  #list     列出所有插件
+  $help     显示组件管理帮助
+  $list     列出所有组件
+  @help     显示脚本命令帮助
+  @list     列出可用脚本
+
+{Fore.YELLOW}退出方式:{Style.RESET_ALL}
+  !quit 或 !exit    正常退出
+  Ctrl+C           中断退出
+"""
+
+
+class _LineReader:
+    """非阻塞stdin行读取器 - 每次读取整块输入并按行切分，避免粘贴大量命令时卡顿"""
+
+    def __init__(self, fd: int):
+        self._fd = fd
+        self._buffer = bytearray()
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(fd, selectors.EVENT_READ)
+
+    def read_lines(self, timeout: float | None = None) -> list[str]:
+        """等待输入并返回所有完整的行，输入结束时抛出EOFError"""
+        if not self._selector.select(timeout):
+            return []
+
+        chunk = os.read(self._fd, 4096)
+        if not chunk:
+            # 输入结束，交出最后一行未换行的残留内容
+            if self._buffer:
+                rest = self._buffer.decode("utf-8", errors="replace")
+                self._buffer.clear()
+                return [rest]
+            raise EOFError
+
+        self._buffer += chunk
+        *lines, rest = self._buffer.split(b"\n")
+        self._buffer = bytearray(rest)
+        return [line.decode("utf-8", errors="replace").rstrip("\r") for line in lines]
+
+    def close(self):
+        """释放选择器"""
+        self._selector.close()
+
+
 class SimpleConsole:
     """简化的统一控制台"""
 
@@ -78,11 +325,44 @@ class SimpleConsole:
         self.enhanced_console: EnhancedConsoleInterface | None = None
         self._console_initialized = False
 
-        # 设置readline
-        try:
-            readline.parse_and_bind("tab: complete")
-        except Exception:
-            pass
+        # 命令类型分发表，未命中的类型按聊天消息处理
+        self._dispatch = {
+            CommandType.MINECRAFT: self._execute_minecraft_command,
+            CommandType.AETHERIUS: self._execute_aetherius_command,
+            CommandType.PLUGIN: self._execute_plugin_command,
+            CommandType.COMPONENT: self._execute_component_command,
+            CommandType.SCRIPT: self._execute_script_command,
+            CommandType.ADMIN: self._execute_admin_command,
+        }
+
+        # 设置readline (无prompt_toolkit时的输入回退)
+        if readline is not None:
+            try:
+                readline.set_completer(_completer)
+                # 前缀字符属于默认分隔符，只按空白切分才能补全整条命令
+                readline.set_completer_delims(" \t\n")
+                readline.parse_and_bind("tab: complete")
+            except Exception:
+                pass
+
+        # 共享的后台事件循环，所有异步命令都提交到这里执行
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(
+            target=self._loop.run_forever, name="aetherius-console-loop", daemon=True
+        )
+        self._loop_thread.start()
+
+        # 服务器命令队列，由共享事件循环上的单一消费者按序处理
+        self._cmd_queue: asyncio.Queue[str] = asyncio.Queue()
+        asyncio.run_coroutine_threadsafe(self._command_consumer(), self._loop)
+
+        # 日志与事件输出队列，由单独的输出线程批量写出
+        self._out_queue: queue.SimpleQueue[str | None] = queue.SimpleQueue()
+        self._emit = self._out_queue.put
+        self._output_thread = threading.Thread(
+            target=self._output_worker, name="aetherius-console-output", daemon=True
+        )
+        self._output_thread.start()
 
         # 初始化插件管理器
         self._init_plugin_manager()
@@ -144,10 +424,22 @@ class SimpleConsole:
 
     def _setup_server_monitoring(self):
         """设置服务器监听和事件订阅"""
+        # 一次性探测服务器管理器能力，避免每条命令重复hasattr
+        sm = self.server_manager
+        self._has_send = hasattr(sm, "send_command")
+        self._has_queue = hasattr(sm, "command_queue")
+        self._has_alive = hasattr(sm, "is_alive")
+        self._has_exec = hasattr(sm, "execute_command")
+        self._has_chat = hasattr(sm, "send_chat")
+        self._has_stdout = hasattr(sm, "set_stdout_handler")
+        self._send_is_coro = self._has_send and inspect.iscoroutinefunction(
+            sm.send_command
+        )
+
         if self.server_manager:
             try:
                 # 设置日志处理器
-                if hasattr(self.server_manager, "set_stdout_handler"):
+                if self._has_stdout:
                     self.server_manager.set_stdout_handler(self._handle_server_log)
 
                 # 启动日志文件监控
@@ -162,9 +454,6 @@ class SimpleConsole:
 
     def _start_log_file_monitoring(self):
         """启动日志文件监控，持续显示服务器日志"""
-        import os
-        import threading
-        import time
 
         def monitor_log_file():
             # 常见的日志文件路径
@@ -216,61 +505,74 @@ class SimpleConsole:
         log_monitor_thread = threading.Thread(target=monitor_log_file, daemon=True)
         log_monitor_thread.start()
 
-    def _handle_server_log(self, line: str):
-        """处理服务器日志行"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
+    def _output_worker(self):
+        """输出线程 - 逐条写出队列中的文本，队列清空时才刷新stdout"""
+        get = self._out_queue.get
+        empty = self._out_queue.empty
+        while True:
+            text = get()
+            if text is None:
+                sys.stdout.flush()
+                return
+            sys.stdout.write(text)
+            if empty():
+                sys.stdout.flush()
+
+    def _handle_server_log(
+        self,
+        line: str,
+        _hms=_hms,
+        _fmt_info=_LOG_FMT_INFO.__mod__,
+        _fmt_warn=_LOG_FMT_WARN.__mod__,
+        _fmt_error=_LOG_FMT_ERROR.__mod__,
+        _fmt_other=_LOG_FMT_OTHER.__mod__,
+    ):
+        """处理服务器日志行
+
+        日志输出是最热的路径，格式化函数通过默认参数预绑定，避免每行都进行
+        全局名称查找；格式化后的行交给输出线程批量写出。
+        """
+        emit = self._emit
+        timestamp = _hms()
         # 解析服务器日志格式，提取关键信息
         if "][" in line:
             # 标准MC服务器日志格式: [时间] [线程/级别]: 消息
-            try:
-                parts = line.split("]")
-                if len(parts) >= 3:
-                    level_part = parts[1].strip("[]")
-                    message = "]".join(parts[2:]).strip(": ")
-
-                    # 根据日志级别着色
-                    if "INFO" in level_part:
-                        print(
-                            f"{Fore.GREEN}[{timestamp}] MC日志:{Style.RESET_ALL} {message}"
-                        )
-                    elif "WARN" in level_part:
-                        print(
-                            f"{Fore.YELLOW}[{timestamp}] MC警告:{Style.RESET_ALL} {message}"
-                        )
-                    elif "ERROR" in level_part:
-                        print(
-                            f"{Fore.RED}[{timestamp}] MC错误:{Style.RESET_ALL} {message}"
-                        )
-                    else:
-                        print(
-                            f"{Fore.CYAN}[{timestamp}] MC日志:{Style.RESET_ALL} {message}"
-                        )
+            parts = line.split("]", 2)
+            if len(parts) == 3:
+                level_part = parts[1]
+                message = parts[2].strip(": ")
+
+                # 根据日志级别着色
+                if "INFO" in level_part:
+                    emit(_fmt_info((timestamp, message)))
+                elif "WARN" in level_part:
+                    emit(_fmt_warn((timestamp, message)))
+                elif "ERROR" in level_part:
+                    emit(_fmt_error((timestamp, message)))
                 else:
-                    print(f"{Fore.GREEN}[{timestamp}] MC日志:{Style.RESET_ALL} {line}")
-            except:
-                print(f"{Fore.GREEN}[{timestamp}] MC日志:{Style.RESET_ALL} {line}")
-        else:
-            print(f"{Fore.GREEN}[{timestamp}] MC日志:{Style.RESET_ALL} {line}")
+                    emit(_fmt_other((timestamp, message)))
+                return
+
+        emit(_fmt_info((timestamp, line)))
 
     def _setup_event_listeners(self):
         """设置事件监听器"""
-        try:
-            from ..core.event_manager import get_event_manager
-            from ..core.events import PlayerChatEvent, PlayerJoinEvent, PlayerLeaveEvent
+        if get_event_manager is None:
+            print(f"{Fore.YELLOW}⚠ 事件系统不可用，跳过事件监听{Style.RESET_ALL}")
+            return
 
+        try:
             event_manager = get_event_manager()
 
             # 注册事件监听器
             def on_player_join(event):
-                print(f"{Fore.CYAN}[PLAYER]{Style.RESET_ALL} {event.player_name} 加入了游戏")
+                self._emit(_PLAYER_JOIN_FMT % event.player_name)
 
             def on_player_leave(event):
-                print(f"{Fore.CYAN}[PLAYER]{Style.RESET_ALL} {event.player_name} 离开了游戏")
+                self._emit(_PLAYER_LEAVE_FMT % event.player_name)
 
             def on_player_chat(event):
-                print(
-                    f"{Fore.BLUE}[CHAT]{Style.RESET_ALL} <{event.player_name}> {event.message}"
-                )
+                self._emit(_PLAYER_CHAT_FMT % (event.player_name, event.message))
 
             # 注册监听器
             event_manager.register_listener(PlayerJoinEvent, on_player_join)
@@ -299,16 +601,10 @@ class SimpleConsole:
                 except:
                     pass
 
-                # 异步初始化增强控制台 - 使用管理器
-                def init_console():
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
+                # 异步初始化增强控制台 - 使用管理器，运行在共享事件循环上
+                def on_console_ready(future):
                     try:
-                        self.enhanced_console = loop.run_until_complete(
-                            get_managed_console_interface(
-                                self.server_manager, rcon_config
-                            )
-                        )
+                        self.enhanced_console = future.result()
                         if self.enhanced_console:
                             self._console_initialized = True
                             print(f"{Fore.GREEN}✓ 已初始化增强控制台接口 (管理器){Style.RESET_ALL}")
@@ -316,179 +612,126 @@ class SimpleConsole:
                             print(f"{Fore.YELLOW}⚠ 增强控制台初始化失败{Style.RESET_ALL}")
                     except Exception as e:
                         print(f"{Fore.YELLOW}⚠ 增强控制台初始化失败: {e}{Style.RESET_ALL}")
-                    finally:
-                        loop.close()
 
-                import threading
-
-                threading.Thread(target=init_console, daemon=True).start()
+                asyncio.run_coroutine_threadsafe(
+                    get_managed_console_interface(self.server_manager, rcon_config),
+                    self._loop,
+                ).add_done_callback(on_console_ready)
         except Exception as e:
             print(f"{Fore.YELLOW}⚠ 增强控制台设置失败: {e}{Style.RESET_ALL}")
 
     def _execute_async_command(self, command: str):
-        """执行异步命令并获取反馈 - 使用增强控制台接口"""
+        """执行异步命令并获取反馈 - 提交到共享事件循环的命令队列"""
         try:
             # 检查服务器是否正在运行
-            if (
-                hasattr(self.server_manager, "is_alive")
-                and not self.server_manager.is_alive
-            ):
+            if self._has_alive and not self.server_manager.is_alive:
                 print(f"{Fore.RED}  ✗ 服务器未运行{Style.RESET_ALL}")
                 return
 
-            # 优先使用增强控制台接口
-            if self._console_initialized and self.enhanced_console:
-                import asyncio
-                import threading
+            self._loop.call_soon_threadsafe(self._cmd_queue.put_nowait, command)
 
-                def execute_with_enhanced_console():
-                    try:
-
-                        async def run_enhanced_command():
-                            # 确定命令优先级
-                            priority = CommandPriority.NORMAL
-                            if command.startswith(("stop", "restart", "save-all")):
-                                priority = CommandPriority.HIGH
-                            elif command.startswith(("backup", "whitelist")):
-                                priority = CommandPriority.CRITICAL
-
-                            result = await self.enhanced_console.send_command(
-                                command, priority=priority, timeout=30.0
-                            )
-
-                            # 显示详细结果，添加前缀标识
-                            prefix = self._get_command_prefix(
-                                command, CommandType.MINECRAFT
-                            )
-                            if result.success:
-                                print(
-                                    f"{Fore.GREEN}  ✓ 命令执行成功 ({result.connection_type}){Style.RESET_ALL}"
-                                )
-                                if result.output:
-                                    # 解析并显示服务器输出，添加前缀
-                                    for line in result.output.strip().split("\n"):
-                                        if line.strip():
-                                            print(f"  {prefix}: {line.strip()}")
-                                print(
-                                    f"{Fore.CYAN}  执行时间: {result.execution_time:.3f}s{Style.RESET_ALL}"
-                                )
-                            else:
-                                print(
-                                    f"{Fore.RED}  ✗ 命令执行失败 ({result.connection_type}){Style.RESET_ALL}"
-                                )
-                                if result.error:
-                                    print(
-                                        f"{Fore.RED}  错误: {result.error}{Style.RESET_ALL}"
-                                    )
-
-                        # 创建新的事件循环执行
-                        loop = asyncio.new_event_loop()
-                        asyncio.set_event_loop(loop)
-                        try:
-                            loop.run_until_complete(run_enhanced_command())
-                        finally:
-                            loop.close()
+        except Exception as e:
+            print(f"{Fore.RED}  ✗ 异步执行错误: {e}{Style.RESET_ALL}")
 
+    async def _command_consumer(self):
+        """按提交顺序逐条处理服务器命令"""
+        while True:
+            command = await self._cmd_queue.get()
+            try:
+                # 优先使用增强控制台接口
+                if self._console_initialized and self.enhanced_console:
+                    try:
+                        await self._run_enhanced_command(command)
                     except Exception as e:
                         print(f"{Fore.RED}  ✗ 增强控制台执行错误: {e}{Style.RESET_ALL}")
                         # 回退到传统方法
-                        self._execute_fallback_command(command)
-
-                # 在后台线程执行
-                thread = threading.Thread(
-                    target=execute_with_enhanced_console, daemon=True
-                )
-                thread.start()
-
-            else:
-                # 回退到传统方法
-                self._execute_fallback_command(command)
+                        await self._run_fallback_command(command)
+                else:
+                    # 回退到传统方法
+                    await self._run_fallback_command(command)
+            except Exception as e:
+                print(f"{Fore.RED}  ✗ 异步执行错误: {e}{Style.RESET_ALL}")
+
+    def _run_on_loop(self, coro):
+        """在共享事件循环上运行协程并阻塞等待结果"""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    async def _cancel_pending_tasks(self):
+        """取消共享事件循环上的其余任务并等待其退出"""
+        current = asyncio.current_task()
+        tasks = [task for task in asyncio.all_tasks() if task is not current]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _run_enhanced_command(self, command: str):
+        """通过增强控制台接口执行命令"""
+        # 确定命令优先级
+        priority = CommandPriority.NORMAL
+        if command.startswith(("stop", "restart", "save-all")):
+            priority = CommandPriority.HIGH
+        elif command.startswith(("backup", "whitelist")):
+            priority = CommandPriority.CRITICAL
+
+        result = await self.enhanced_console.send_command(
+            command, priority=priority, timeout=30.0
+        )
 
-        except Exception as e:
-            print(f"{Fore.RED}  ✗ 异步执行错误: {e}{Style.RESET_ALL}")
+        # 显示详细结果，添加前缀标识
+        prefix = self._get_command_prefix(command, CommandType.MINECRAFT)
+        if result.success:
+            print(f"{Fore.GREEN}  ✓ 命令执行成功 ({result.connection_type}){Style.RESET_ALL}")
+            if result.output:
+                # 解析并显示服务器输出，添加前缀
+                for line in result.output.strip().split("\n"):
+                    if line.strip():
+                        print(f"  {prefix}: {line.strip()}")
+            print(f"{Fore.CYAN}  执行时间: {result.execution_time:.3f}s{Style.RESET_ALL}")
+        else:
+            print(f"{Fore.RED}  ✗ 命令执行失败 ({result.connection_type}){Style.RESET_ALL}")
+            if result.error:
+                print(f"{Fore.RED}  错误: {result.error}{Style.RESET_ALL}")
 
-    def _execute_fallback_command(self, command: str):
+    async def _run_fallback_command(self, command: str):
         """传统命令执行方法作为回退"""
         try:
             # 如果服务器有命令队列系统，尝试使用
-            if hasattr(self.server_manager, "command_queue"):
-                import asyncio
-                import threading
-
-                def execute_command():
-                    try:
-                        # 在新线程中运行异步命令
-                        async def run_command():
-                            try:
-                                command_queue = self.server_manager.command_queue
-                                command_id = command_queue.add_command(command)
-
-                                # 缩短超时时间，更快反馈
-                                result = await command_queue.wait_for_completion(
-                                    command_id, timeout=10.0
-                                )
-
-                                # 显示结果
-                                if result["status"] == "completed":
-                                    if result.get("success", False):
-                                        print(
-                                            f"{Fore.GREEN}  ✓ 命令执行成功 (队列){Style.RESET_ALL}"
-                                        )
-                                        if "output" in result and result["output"]:
-                                            print(
-                                                f"{Fore.BLUE}  输出: {result['output']}{Style.RESET_ALL}"
-                                            )
-                                    else:
-                                        print(f"{Fore.RED}  ✗ 命令执行失败{Style.RESET_ALL}")
-                                else:
-                                    print(f"{Fore.YELLOW}  ⚠ 命令超时{Style.RESET_ALL}")
-
-                            except Exception as e:
-                                print(f"{Fore.RED}  ✗ 命令执行错误: {e}{Style.RESET_ALL}")
-
-                        # 运行异步命令
-                        loop = asyncio.new_event_loop()
-                        asyncio.set_event_loop(loop)
-                        try:
-                            loop.run_until_complete(run_command())
-                        finally:
-                            loop.close()
-
-                    except Exception as e:
-                        print(f"{Fore.RED}  ✗ 队列执行错误: {e}{Style.RESET_ALL}")
-
-                # 在后台线程执行
-                thread = threading.Thread(target=execute_command, daemon=True)
-                thread.start()
-
-            # 如果没有队列，尝试直接发送
-            elif hasattr(self.server_manager, "send_command"):
-                import asyncio
-                import threading
+            if self._has_queue:
+                try:
+                    command_queue = self.server_manager.command_queue
+                    command_id = command_queue.add_command(command)
 
-                def direct_send():
-                    try:
+                    # 缩短超时时间，更快反馈
+                    result = await command_queue.wait_for_completion(
+                        command_id, timeout=10.0
+                    )
 
-                        async def send_now():
-                            success = await self.server_manager.send_command(command)
-                            if success:
+                    # 显示结果
+                    if result["status"] == "completed":
+                        if result.get("success", False):
+                            print(f"{Fore.GREEN}  ✓ 命令执行成功 (队列){Style.RESET_ALL}")
+                            if "output" in result and result["output"]:
                                 print(
-                                    f"{Fore.GREEN}  ✓ 命令已发送 (direct){Style.RESET_ALL}"
+                                    f"{Fore.BLUE}  输出: {result['output']}{Style.RESET_ALL}"
                                 )
-                            else:
-                                print(f"{Fore.RED}  ✗ 命令发送失败{Style.RESET_ALL}")
+                        else:
+                            print(f"{Fore.RED}  ✗ 命令执行失败{Style.RESET_ALL}")
+                    else:
+                        print(f"{Fore.YELLOW}  ⚠ 命令超时{Style.RESET_ALL}")
 
-                        loop = asyncio.new_event_loop()
-                        asyncio.set_event_loop(loop)
-                        try:
-                            loop.run_until_complete(send_now())
-                        finally:
-                            loop.close()
-                    except Exception:
-                        print(f"{Fore.YELLOW}  └─ 回退发送: {command}{Style.RESET_ALL}")
+                except Exception as e:
+                    print(f"{Fore.RED}  ✗ 命令执行错误: {e}{Style.RESET_ALL}")
 
-                thread = threading.Thread(target=direct_send, daemon=True)
-                thread.start()
+            # 如果没有队列，尝试直接发送
+            elif self._has_send:
+                try:
+                    success = await self.server_manager.send_command(command)
+                    if success:
+                        print(f"{Fore.GREEN}  ✓ 命令已发送 (direct){Style.RESET_ALL}")
+                    else:
+                        print(f"{Fore.RED}  ✗ 命令发送失败{Style.RESET_ALL}")
+                except Exception:
+                    print(f"{Fore.YELLOW}  └─ 回退发送: {command}{Style.RESET_ALL}")
 
             else:
                 print(f"{Fore.BLUE}  └─ 命令已记录 (模拟模式){Style.RESET_ALL}")
@@ -499,33 +742,7 @@ class SimpleConsole:
     def _print_startup(self):
         """打印启动信息和ASCII艺术横幅"""
         # ASCII艺术横幅
-        ascii_banner = f"""{Fore.CYAN}
-╔═══════════════════════════════════════════════════════════════════╗
-║                                                                   ║
-║    █████╗ ███████╗████████╗██╗  ██╗███████╗██████╗ ██╗██╗   ██╗███║
-║   ██╔══██╗██╔════╝╚══██╔══╝██║  ██║██╔════╝██╔══██╗██║██║   ██║██╔║
-║   ███████║█████╗     ██║   ███████║█████╗  ██████╔╝██║██║   ██║███║
-║   ██╔══██║██╔══╝     ██║   ██╔══██║██╔══╝  ██╔══██╗██║██║   ██║╚══║
-║   ██║  ██║███████╗   ██║   ██║  ██║███████╗██║  ██║██║╚██████╔╝███║
-║   ╚═╝  ╚═╝╚══════╝   ╚═╝   ╚═╝  ╚═╝╚══════╝╚═╝  ╚═╝╚═╝ ╚═════╝ ╚══║
-║                                                                   ║
-║               高性能 Minecraft 服务器管理引擎                        ║
-║                                                                   ║
-╚═══════════════════════════════════════════════════════════════════╝{Style.RESET_ALL}
-
-{Fore.GREEN}✓ Aetherius Console Ready{Style.RESET_ALL}
-
-{Fore.YELLOW}统一前缀识别系统:{Style.RESET_ALL}
-  {Fore.WHITE}/ {Style.RESET_ALL} - MC指令 (直接发送至Minecraft服务器)
-  {Fore.WHITE}! {Style.RESET_ALL} - Aetherius系统指令
-  {Fore.WHITE}@ {Style.RESET_ALL} - 脚本指令 (执行自定义脚本)
-  {Fore.WHITE}# {Style.RESET_ALL} - 插件指令 (调用插件特定功能)
-  {Fore.WHITE}$ {Style.RESET_ALL} - 组件指令 (组件管理命令)
-  {Fore.WHITE}% {Style.RESET_ALL} - 管理指令 (管理相关命令)
-
-{Fore.CYAN}输入 !help 查看详细帮助{Style.RESET_ALL}
-"""
-        print(ascii_banner)
+        print(_STARTUP_BANNER)
 
     def _get_command_prefix(self, command: str, cmd_type: CommandType) -> str:
         """获取命令前缀标识，统一前缀系统"""
@@ -544,42 +761,32 @@ class SimpleConsole:
         else:
             return "服务器响应"
 
-    def _parse_command(self, command: str):
-        """解析命令类型"""
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _parse_command(command: str):
+        """解析命令类型 (纯函数，重复输入的命令直接命中缓存)"""
         if not command:
             return CommandType.CHAT, ""
 
-        first_char = command[0]
-        for cmd_type in CommandType:
-            if first_char == cmd_type.value:
-                return cmd_type, command[1:].strip()
-
-        return CommandType.CHAT, command
+        cmd_type = _PREFIX_MAP.get(command[0], CommandType.CHAT)
+        if cmd_type is CommandType.CHAT:
+            return CommandType.CHAT, command
+        return cmd_type, command[1:].strip()
 
     def _execute_minecraft_command(self, command: str):
         """执行Minecraft命令"""
         if self.server_manager:
             try:
                 # 检查服务器管理器的正确方法
-                if hasattr(self.server_manager, "send_command"):
+                if self._has_send:
                     # ServerProcessWrapper使用异步send_command方法
-                    import inspect
-
-                    # 检查方法是否为协程函数
-                    if inspect.iscoroutinefunction(self.server_manager.send_command):
+                    if self._send_is_coro:
                         # 对于异步方法，先检查服务器状态
-                        if (
-                            hasattr(self.server_manager, "is_alive")
-                            and not self.server_manager.is_alive
-                        ):
-                            print(
-                                f"{Fore.RED}→ Minecraft (未运行):{Style.RESET_ALL} /{command}"
-                            )
+                        if self._has_alive and not self.server_manager.is_alive:
+                            print(_MC_OFFLINE_FMT % command)
                             print(f"{Fore.RED}  ✗ 服务器未启动{Style.RESET_ALL}")
                         else:
-                            print(
-                                f"{Fore.YELLOW}→ Minecraft:{Style.RESET_ALL} /{command}"
-                            )
+                            print(_MC_PENDING_FMT % command)
 
                             # 使用队列方法获取命令反馈
                             self._execute_async_command(command)
@@ -588,27 +795,25 @@ class SimpleConsole:
                         try:
                             success = self.server_manager.send_command(command)
                             if success:
-                                print(
-                                    f"{Fore.GREEN}→ Minecraft:{Style.RESET_ALL} /{command}"
-                                )
+                                print(_MC_SENT_FMT % command)
                             else:
                                 print(f"{Fore.RED}✗ Minecraft:{Style.RESET_ALL} 命令发送失败")
                         except Exception as e:
-                            print(f"{Fore.RED}✗ Minecraft错误:{Style.RESET_ALL} {e}")
+                            print(_MC_ERROR_FMT % e)
 
-                elif hasattr(self.server_manager, "execute_command"):
+                elif self._has_exec:
                     # 同步方法 (MockServerManager等)
                     result = self.server_manager.execute_command(command)
-                    print(f"{Fore.GREEN}→ Minecraft:{Style.RESET_ALL} /{command}")
+                    print(_MC_SENT_FMT % command)
 
                 else:
                     # 未知接口，显示为模拟
-                    print(f"{Fore.YELLOW}→ 模拟Minecraft:{Style.RESET_ALL} /{command}")
+                    print(_MC_MOCK_FMT % command)
 
             except Exception as e:
-                print(f"{Fore.RED}✗ Minecraft错误:{Style.RESET_ALL} {e}")
+                print(_MC_ERROR_FMT % e)
         else:
-            print(f"{Fore.YELLOW}→ 模拟Minecraft:{Style.RESET_ALL} /{command}")
+            print(_MC_MOCK_FMT % command)
 
     def _execute_aetherius_command(self, command: str):
         """执行Aetherius命令"""
@@ -624,7 +829,12 @@ class SimpleConsole:
             self._show_status()
 
         elif command == "clear":
-            os.system("clear" if os.name == "posix" else "cls")
+            if HAS_COLOR:
+                # 终端支持转义序列时直接清屏，无需启动子进程
+                sys.stdout.write("\x1b[2J\x1b[H")
+                sys.stdout.flush()
+            else:
+                os.system("clear" if os.name == "posix" else "cls")
             self._print_startup()
 
         elif command == "server":
@@ -661,25 +871,7 @@ class SimpleConsole:
 
     def _show_plugin_help(self):
         """显示插件命令帮助"""
-        help_text = f"""
-{Fore.MAGENTA}=== 插件管理命令帮助 ==={Style.RESET_ALL}
-
-{Fore.YELLOW}可用命令:{Style.RESET_ALL}
-  #help               显示此帮助信息
-  #list               列出所有插件
-  #enable <插件名>     启用指定插件
-  #disable <插件名>    禁用指定插件
-  #reload <插件名>     重载指定插件
-  #info <插件名>       显示插件详细信息
-
-{Fore.YELLOW}示例:{Style.RESET_ALL}
-  #list
-  #enable MyPlugin
-  #disable MyPlugin
-  #reload MyPlugin
-  #info MyPlugin
-"""
-        print(help_text)
+        print(_PLUGIN_HELP_TEXT)
 
     def _list_plugins(self):
         """列出所有插件"""
@@ -736,45 +928,28 @@ class SimpleConsole:
             return
 
         try:
-            plugin_manager = self._get_plugin_manager()
-            if not plugin_manager:
-                print(f"{Fore.RED}插件管理器不可用{Style.RESET_ALL}")
-                return
-
-            if hasattr(plugin_manager, "enable_plugin"):
-                # 如果是异步方法
-                import asyncio
-                import inspect
-
-                if inspect.iscoroutinefunction(plugin_manager.enable_plugin):
-
-                    def run_async():
-                        try:
-                            # 创建新的事件循环
-                            loop = asyncio.new_event_loop()
-                            asyncio.set_event_loop(loop)
-                            try:
-                                result = loop.run_until_complete(
-                                    plugin_manager.enable_plugin(plugin_name)
-                                )
-                                if result:
-                                    print(
-                                        f"{Fore.GREEN}✓ 插件 {plugin_name} 已启用{Style.RESET_ALL}"
-                                    )
-                                else:
-                                    print(
-                                        f"{Fore.RED}✗ 插件 {plugin_name} 启用失败{Style.RESET_ALL}"
-                                    )
-                            finally:
-                                loop.close()
-                        except Exception as e:
-                            print(f"{Fore.RED}✗ 启用插件失败: {e}{Style.RESET_ALL}")
-
-                    import threading
+            plugin_manager = self._get_plugin_manager()
+            if not plugin_manager:
+                print(f"{Fore.RED}插件管理器不可用{Style.RESET_ALL}")
+                return
 
-                    thread = threading.Thread(target=run_async, daemon=True)
-                    thread.start()
-                    thread.join()  # 等待完成
+            if hasattr(plugin_manager, "enable_plugin"):
+                # 如果是异步方法
+                if inspect.iscoroutinefunction(plugin_manager.enable_plugin):
+                    try:
+                        result = self._run_on_loop(
+                            plugin_manager.enable_plugin(plugin_name)
+                        )
+                        if result:
+                            print(
+                                f"{Fore.GREEN}✓ 插件 {plugin_name} 已启用{Style.RESET_ALL}"
+                            )
+                        else:
+                            print(
+                                f"{Fore.RED}✗ 插件 {plugin_name} 启用失败{Style.RESET_ALL}"
+                            )
+                    except Exception as e:
+                        print(f"{Fore.RED}✗ 启用插件失败: {e}{Style.RESET_ALL}")
                 else:
                     # 同步方法
                     result = plugin_manager.enable_plugin(plugin_name)
@@ -802,38 +977,21 @@ class SimpleConsole:
 
             if hasattr(plugin_manager, "disable_plugin"):
                 # 如果是异步方法
-                import asyncio
-                import inspect
-
                 if inspect.iscoroutinefunction(plugin_manager.disable_plugin):
-
-                    def run_async():
-                        try:
-                            # 创建新的事件循环
-                            loop = asyncio.new_event_loop()
-                            asyncio.set_event_loop(loop)
-                            try:
-                                result = loop.run_until_complete(
-                                    plugin_manager.disable_plugin(plugin_name)
-                                )
-                                if result:
-                                    print(
-                                        f"{Fore.GREEN}✓ 插件 {plugin_name} 已禁用{Style.RESET_ALL}"
-                                    )
-                                else:
-                                    print(
-                                        f"{Fore.RED}✗ 插件 {plugin_name} 禁用失败{Style.RESET_ALL}"
-                                    )
-                            finally:
-                                loop.close()
-                        except Exception as e:
-                            print(f"{Fore.RED}✗ 禁用插件失败: {e}{Style.RESET_ALL}")
-
-                    import threading
-
-                    thread = threading.Thread(target=run_async, daemon=True)
-                    thread.start()
-                    thread.join()  # 等待完成
+                    try:
+                        result = self._run_on_loop(
+                            plugin_manager.disable_plugin(plugin_name)
+                        )
+                        if result:
+                            print(
+                                f"{Fore.GREEN}✓ 插件 {plugin_name} 已禁用{Style.RESET_ALL}"
+                            )
+                        else:
+                            print(
+                                f"{Fore.RED}✗ 插件 {plugin_name} 禁用失败{Style.RESET_ALL}"
+                            )
+                    except Exception as e:
+                        print(f"{Fore.RED}✗ 禁用插件失败: {e}{Style.RESET_ALL}")
                 else:
                     # 同步方法
                     result = plugin_manager.disable_plugin(plugin_name)
@@ -861,38 +1019,21 @@ class SimpleConsole:
 
             if hasattr(plugin_manager, "reload_plugin"):
                 # 如果是异步方法
-                import asyncio
-                import inspect
-
                 if inspect.iscoroutinefunction(plugin_manager.reload_plugin):
-
-                    def run_async():
-                        try:
-                            # 创建新的事件循环
-                            loop = asyncio.new_event_loop()
-                            asyncio.set_event_loop(loop)
-                            try:
-                                result = loop.run_until_complete(
-                                    plugin_manager.reload_plugin(plugin_name)
-                                )
-                                if result:
-                                    print(
-                                        f"{Fore.GREEN}✓ 插件 {plugin_name} 已重载{Style.RESET_ALL}"
-                                    )
-                                else:
-                                    print(
-                                        f"{Fore.RED}✗ 插件 {plugin_name} 重载失败{Style.RESET_ALL}"
-                                    )
-                            finally:
-                                loop.close()
-                        except Exception as e:
-                            print(f"{Fore.RED}✗ 重载插件失败: {e}{Style.RESET_ALL}")
-
-                    import threading
-
-                    thread = threading.Thread(target=run_async, daemon=True)
-                    thread.start()
-                    thread.join()  # 等待完成
+                    try:
+                        result = self._run_on_loop(
+                            plugin_manager.reload_plugin(plugin_name)
+                        )
+                        if result:
+                            print(
+                                f"{Fore.GREEN}✓ 插件 {plugin_name} 已重载{Style.RESET_ALL}"
+                            )
+                        else:
+                            print(
+                                f"{Fore.RED}✗ 插件 {plugin_name} 重载失败{Style.RESET_ALL}"
+                            )
+                    except Exception as e:
+                        print(f"{Fore.RED}✗ 重载插件失败: {e}{Style.RESET_ALL}")
                 else:
                     # 同步方法
                     result = plugin_manager.reload_plugin(plugin_name)
@@ -997,29 +1138,7 @@ class SimpleConsole:
 
     def _show_component_help(self):
         """显示组件命令帮助"""
-        help_text = f"""
-{Fore.MAGENTA}=== 组件管理命令帮助 ==={Style.RESET_ALL}
-
-{Fore.YELLOW}可用命令:{Style.RESET_ALL}
-  $help               显示此帮助信息
-  $list               列出所有组件
-  $scan               扫描并发现组件
-  $load <组件名>       加载指定组件
-  $enable <组件名>     启用指定组件
-  $disable <组件名>    禁用指定组件
-  $reload <组件名>     重载指定组件
-  $info <组件名>       显示组件详细信息
-
-{Fore.YELLOW}示例:{Style.RESET_ALL}
-  $list
-  $scan
-  $load TestComponent
-  $enable TestComponent
-  $disable TestComponent
-  $reload TestComponent
-  $info TestComponent
-"""
-        print(help_text)
+        print(_COMPONENT_HELP_TEXT)
 
     def _list_components(self):
         """列出所有组件"""
@@ -1066,34 +1185,18 @@ class SimpleConsole:
             if hasattr(component_manager, "scan_components"):
                 print(f"{Fore.CYAN}正在扫描组件...{Style.RESET_ALL}")
                 # 处理异步方法
-                import asyncio
-                import inspect
-
                 if inspect.iscoroutinefunction(component_manager.scan_components):
-
-                    def run_async():
-                        try:
-                            loop = asyncio.new_event_loop()
-                            asyncio.set_event_loop(loop)
-                            try:
-                                discovered = loop.run_until_complete(
-                                    component_manager.scan_components()
-                                )
-                                print(
-                                    f"{Fore.GREEN}✓ 发现 {len(discovered)} 个组件{Style.RESET_ALL}"
-                                )
-                                for component_name in discovered:
-                                    print(f"  - {component_name}")
-                            finally:
-                                loop.close()
-                        except Exception as e:
-                            print(f"{Fore.RED}✗ 扫描失败: {e}{Style.RESET_ALL}")
-
-                    import threading
-
-                    thread = threading.Thread(target=run_async, daemon=True)
-                    thread.start()
-                    thread.join()
+                    try:
+                        discovered = self._run_on_loop(
+                            component_manager.scan_components()
+                        )
+                        print(
+                            f"{Fore.GREEN}✓ 发现 {len(discovered)} 个组件{Style.RESET_ALL}"
+                        )
+                        for component_name in discovered:
+                            print(f"  - {component_name}")
+                    except Exception as e:
+                        print(f"{Fore.RED}✗ 扫描失败: {e}{Style.RESET_ALL}")
                 else:
                     discovered = component_manager.scan_components()
                     print(f"{Fore.GREEN}✓ 发现 {len(discovered)} 个组件{Style.RESET_ALL}")
@@ -1119,38 +1222,21 @@ class SimpleConsole:
 
             if hasattr(component_manager, "load_component"):
                 # 如果是异步方法
-                import asyncio
-                import inspect
-
                 if inspect.iscoroutinefunction(component_manager.load_component):
-
-                    def run_async():
-                        try:
-                            # 创建新的事件循环
-                            loop = asyncio.new_event_loop()
-                            asyncio.set_event_loop(loop)
-                            try:
-                                result = loop.run_until_complete(
-                                    component_manager.load_component(component_name)
-                                )
-                                if result:
-                                    print(
-                                        f"{Fore.GREEN}✓ 组件 {component_name} 已加载{Style.RESET_ALL}"
-                                    )
-                                else:
-                                    print(
-                                        f"{Fore.RED}✗ 组件 {component_name} 加载失败{Style.RESET_ALL}"
-                                    )
-                            finally:
-                                loop.close()
-                        except Exception as e:
-                            print(f"{Fore.RED}✗ 加载组件失败: {e}{Style.RESET_ALL}")
-
-                    import threading
-
-                    thread = threading.Thread(target=run_async, daemon=True)
-                    thread.start()
-                    thread.join()  # 等待完成
+                    try:
+                        result = self._run_on_loop(
+                            component_manager.load_component(component_name)
+                        )
+                        if result:
+                            print(
+                                f"{Fore.GREEN}✓ 组件 {component_name} 已加载{Style.RESET_ALL}"
+                            )
+                        else:
+                            print(
+                                f"{Fore.RED}✗ 组件 {component_name} 加载失败{Style.RESET_ALL}"
+                            )
+                    except Exception as e:
+                        print(f"{Fore.RED}✗ 加载组件失败: {e}{Style.RESET_ALL}")
                 else:
                     # 同步方法
                     result = component_manager.load_component(component_name)
@@ -1238,9 +1324,6 @@ class SimpleConsole:
 
     def _start_component_with_script(self, component_name: str, script_path: Path):
         """使用标准启动脚本启动组件"""
-        import subprocess
-        import threading
-        import time
 
         def run_component():
             try:
@@ -1432,38 +1515,21 @@ class SimpleConsole:
 
             if hasattr(component_manager, "enable_component"):
                 # 如果是异步方法
-                import asyncio
-                import inspect
-
                 if inspect.iscoroutinefunction(component_manager.enable_component):
-
-                    def run_async():
-                        try:
-                            # 创建新的事件循环
-                            loop = asyncio.new_event_loop()
-                            asyncio.set_event_loop(loop)
-                            try:
-                                result = loop.run_until_complete(
-                                    component_manager.enable_component(component_name)
-                                )
-                                if result:
-                                    print(
-                                        f"{Fore.GREEN}✓ 组件 {component_name} 已启用{Style.RESET_ALL}"
-                                    )
-                                else:
-                                    print(
-                                        f"{Fore.RED}✗ 组件 {component_name} 启用失败{Style.RESET_ALL}"
-                                    )
-                            finally:
-                                loop.close()
-                        except Exception as e:
-                            print(f"{Fore.RED}✗ 启用组件失败: {e}{Style.RESET_ALL}")
-
-                    import threading
-
-                    thread = threading.Thread(target=run_async, daemon=True)
-                    thread.start()
-                    thread.join()  # 等待完成
+                    try:
+                        result = self._run_on_loop(
+                            component_manager.enable_component(component_name)
+                        )
+                        if result:
+                            print(
+                                f"{Fore.GREEN}✓ 组件 {component_name} 已启用{Style.RESET_ALL}"
+                            )
+                        else:
+                            print(
+                                f"{Fore.RED}✗ 组件 {component_name} 启用失败{Style.RESET_ALL}"
+                            )
+                    except Exception as e:
+                        print(f"{Fore.RED}✗ 启用组件失败: {e}{Style.RESET_ALL}")
                 else:
                     # 同步方法
                     result = component_manager.enable_component(component_name)
@@ -1491,38 +1557,21 @@ class SimpleConsole:
 
             if hasattr(component_manager, "disable_component"):
                 # 如果是异步方法
-                import asyncio
-                import inspect
-
                 if inspect.iscoroutinefunction(component_manager.disable_component):
-
-                    def run_async():
-                        try:
-                            # 创建新的事件循环
-                            loop = asyncio.new_event_loop()
-                            asyncio.set_event_loop(loop)
-                            try:
-                                result = loop.run_until_complete(
-                                    component_manager.disable_component(component_name)
-                                )
-                                if result:
-                                    print(
-                                        f"{Fore.GREEN}✓ 组件 {component_name} 已禁用{Style.RESET_ALL}"
-                                    )
-                                else:
-                                    print(
-                                        f"{Fore.RED}✗ 组件 {component_name} 禁用失败{Style.RESET_ALL}"
-                                    )
-                            finally:
-                                loop.close()
-                        except Exception as e:
-                            print(f"{Fore.RED}✗ 禁用组件失败: {e}{Style.RESET_ALL}")
-
-                    import threading
-
-                    thread = threading.Thread(target=run_async, daemon=True)
-                    thread.start()
-                    thread.join()  # 等待完成
+                    try:
+                        result = self._run_on_loop(
+                            component_manager.disable_component(component_name)
+                        )
+                        if result:
+                            print(
+                                f"{Fore.GREEN}✓ 组件 {component_name} 已禁用{Style.RESET_ALL}"
+                            )
+                        else:
+                            print(
+                                f"{Fore.RED}✗ 组件 {component_name} 禁用失败{Style.RESET_ALL}"
+                            )
+                    except Exception as e:
+                        print(f"{Fore.RED}✗ 禁用组件失败: {e}{Style.RESET_ALL}")
                 else:
                     # 同步方法
                     result = component_manager.disable_component(component_name)
@@ -1550,38 +1599,21 @@ class SimpleConsole:
 
             if hasattr(component_manager, "reload_component"):
                 # 如果是异步方法
-                import asyncio
-                import inspect
-
                 if inspect.iscoroutinefunction(component_manager.reload_component):
-
-                    def run_async():
-                        try:
-                            # 创建新的事件循环
-                            loop = asyncio.new_event_loop()
-                            asyncio.set_event_loop(loop)
-                            try:
-                                result = loop.run_until_complete(
-                                    component_manager.reload_component(component_name)
-                                )
-                                if result:
-                                    print(
-                                        f"{Fore.GREEN}✓ 组件 {component_name} 已重载{Style.RESET_ALL}"
-                                    )
-                                else:
-                                    print(
-                                        f"{Fore.RED}✗ 组件 {component_name} 重载失败{Style.RESET_ALL}"
-                                    )
-                            finally:
-                                loop.close()
-                        except Exception as e:
-                            print(f"{Fore.RED}✗ 重载组件失败: {e}{Style.RESET_ALL}")
-
-                    import threading
-
-                    thread = threading.Thread(target=run_async, daemon=True)
-                    thread.start()
-                    thread.join()  # 等待完成
+                    try:
+                        result = self._run_on_loop(
+                            component_manager.reload_component(component_name)
+                        )
+                        if result:
+                            print(
+                                f"{Fore.GREEN}✓ 组件 {component_name} 已重载{Style.RESET_ALL}"
+                            )
+                        else:
+                            print(
+                                f"{Fore.RED}✗ 组件 {component_name} 重载失败{Style.RESET_ALL}"
+                            )
+                    except Exception as e:
+                        print(f"{Fore.RED}✗ 重载组件失败: {e}{Style.RESET_ALL}")
                 else:
                     # 同步方法
                     result = component_manager.reload_component(component_name)
@@ -1674,13 +1706,11 @@ class SimpleConsole:
         if self.server_manager:
             try:
                 # 聊天命令通常是通过/say命令发送
-                if hasattr(self.server_manager, "send_command"):
-                    import inspect
-
+                if self._has_send:
                     # 检查是否为协程函数
-                    if inspect.iscoroutinefunction(self.server_manager.send_command):
+                    if self._send_is_coro:
                         # 对于异步方法，使用队列获取反馈
-                        print(f"{Fore.BLUE}💬 聊天:{Style.RESET_ALL} {message}")
+                        print(_CHAT_SENT_FMT % message)
 
                         # 使用队列方法获取反馈
                         self._execute_async_command(f"say {message}")
@@ -1689,63 +1719,32 @@ class SimpleConsole:
                         try:
                             success = self.server_manager.send_command(f"say {message}")
                             if success:
-                                print(f"{Fore.BLUE}💬 聊天:{Style.RESET_ALL} {message}")
+                                print(_CHAT_SENT_FMT % message)
                             else:
                                 print(f"{Fore.RED}✗ 聊天:{Style.RESET_ALL} 发送失败")
                         except Exception as e:
-                            print(f"{Fore.RED}✗ 聊天错误:{Style.RESET_ALL} {e}")
+                            print(_CHAT_ERROR_FMT % e)
 
-                elif hasattr(self.server_manager, "send_chat"):
+                elif self._has_chat:
                     self.server_manager.send_chat(message)
-                    print(f"{Fore.BLUE}💬 聊天:{Style.RESET_ALL} {message}")
+                    print(_CHAT_SENT_FMT % message)
 
-                elif hasattr(self.server_manager, "execute_command"):
+                elif self._has_exec:
                     # 通过execute_command发送say命令
                     self.server_manager.execute_command(f"say {message}")
-                    print(f"{Fore.BLUE}💬 聊天:{Style.RESET_ALL} {message}")
+                    print(_CHAT_SENT_FMT % message)
 
                 else:
                     print(f"{Fore.YELLOW}💬 模拟聊天:{Style.RESET_ALL} {message}")
 
             except Exception as e:
-                print(f"{Fore.RED}✗ 聊天错误:{Style.RESET_ALL} {e}")
+                print(_CHAT_ERROR_FMT % e)
         else:
-            print(f"{Fore.BLUE}💬 模拟聊天:{Style.RESET_ALL} {message}")
+            print(_CHAT_MOCK_FMT % message)
 
     def _show_help(self):
         """显示帮助信息"""
-        help_text = f"""
-{Fore.CYAN}=== Aetherius 控制台帮助 ==={Style.RESET_ALL}
-
-{Fore.YELLOW}统一前缀识别系统:{Style.RESET_ALL}
-  {Fore.GREEN}/ {Style.RESET_ALL} MC指令          (例: /help, /stop, /list)
-  {Fore.BLUE}! {Style.RESET_ALL} Aetherius系统指令 (例: !status, !quit, !help)
-  {Fore.MAGENTA}@ {Style.RESET_ALL} 脚本指令        (例: @run, @list)
-  {Fore.YELLOW}# {Style.RESET_ALL} 插件指令        (例: #list, #enable <插件名>, #help)
-  {Fore.CYAN}$ {Style.RESET_ALL} 组件指令        (例: $list, $enable <组件名>, $help)
-  {Fore.RED}% {Style.RESET_ALL} 管理指令        (预留扩展)
-  {Fore.WHITE}  {Style.RESET_ALL} 聊天消息        (直接输入文本)
-
-{Fore.YELLOW}常用命令:{Style.RESET_ALL}
-  !help     显示此帮助
-  !status   显示控制台状态
-  !server   显示服务器状态
-  !clear    清屏
-  !quit     退出控制台
-
-{Fore.YELLOW}管理命令:{Style.RESET_ALL}
-  #help     显示插件管理帮助
-  #list     列出所有插件
-  $help     显示组件管理帮助
-  $list     列出所有组件
-  @help     显示脚本命令帮助
-  @list     列出可用脚本
-
-{Fore.YELLOW}退出方式:{Style.RESET_ALL}
-  !quit 或 !exit    正常退出
-  Ctrl+C           中断退出
-"""
-        print(help_text)
+        print(_HELP_TEXT)
 
     def _show_status(self):
         """显示状态信息"""
@@ -1767,7 +1766,7 @@ class SimpleConsole:
             return
 
         # 检查服务器是否运行
-        if hasattr(self.server_manager, "is_alive"):
+        if self._has_alive:
             is_running = self.server_manager.is_alive
             status_icon = (
                 f"{Fore.GREEN}✓{Style.RESET_ALL}"
@@ -1780,13 +1779,15 @@ class SimpleConsole:
             print(f"服务器状态: {Fore.YELLOW}未知{Style.RESET_ALL}")
 
         # 检查可用功能
-        features = []
-        if hasattr(self.server_manager, "send_command"):
-            features.append("命令发送")
-        if hasattr(self.server_manager, "command_queue"):
-            features.append("命令队列")
-        if hasattr(self.server_manager, "set_stdout_handler"):
-            features.append("日志流")
+        features = [
+            name
+            for name, available in (
+                ("命令发送", self._has_send),
+                ("命令队列", self._has_queue),
+                ("日志流", self._has_stdout),
+            )
+            if available
+        ]
 
         if features:
             print(f"可用功能: {', '.join(features)}")
@@ -1794,18 +1795,12 @@ class SimpleConsole:
             print(f"{Fore.YELLOW}⚠ 功能检测失败{Style.RESET_ALL}")
 
         # 显示连接类型
-        if hasattr(self.server_manager, "__class__"):
-            class_name = self.server_manager.__class__.__name__
-            print(f"连接类型: {class_name}")
+        print(f"连接类型: {type(self.server_manager).__name__}")
 
         print()
 
     def execute_command(self, command: str):
-        """执行命令"""
-        if not command.strip():
-            return
-
-        command = command.strip()
+        """执行命令 (command 应为已去除首尾空白的非空字符串)"""
         self.commands_executed += 1
 
         # 解析命令类型
@@ -1813,18 +1808,9 @@ class SimpleConsole:
 
         try:
             # 根据类型执行命令
-            if cmd_type == CommandType.MINECRAFT:
-                self._execute_minecraft_command(content)
-            elif cmd_type == CommandType.AETHERIUS:
-                self._execute_aetherius_command(content)
-            elif cmd_type == CommandType.PLUGIN:
-                self._execute_plugin_command(content)
-            elif cmd_type == CommandType.COMPONENT:
-                self._execute_component_command(content)
-            elif cmd_type == CommandType.SCRIPT:
-                self._execute_script_command(content)
-            elif cmd_type == CommandType.ADMIN:
-                self._execute_admin_command(content)
+            handler = self._dispatch.get(cmd_type)
+            if handler:
+                handler(content)
             else:
                 self._execute_chat_command(command)
 
@@ -1836,10 +1822,28 @@ class SimpleConsole:
         self.is_running = True
 
         try:
+            if HAS_PROMPT_TOOLKIT and sys.stdin.isatty() and sys.stdout.isatty():
+                self._run_prompt_session()
+            else:
+                self._run_line_input()
+
+        except Exception as e:
+            print(f"{Fore.RED}控制台错误: {e}{Style.RESET_ALL}")
+        finally:
+            self.is_running = False
+            self.cleanup()
+
+    async def run_async(self):
+        """基于prompt_toolkit的交互主循环，日志输出不会打断正在输入的命令"""
+        session = PromptSession(
+            completer=WordCompleter(list(_COMPLETIONS), sentence=True)
+        )
+        prompt = ANSI(f"{Fore.GREEN}Aetherius> {Style.RESET_ALL}")
+
+        with patch_stdout():
             while self.is_running:
                 try:
-                    # 获取用户输入
-                    command = input(f"{Fore.GREEN}Aetherius> {Style.RESET_ALL}")
+                    command = (await session.prompt_async(prompt)).strip()
 
                     # 执行命令
                     if command:
@@ -1851,41 +1855,94 @@ class SimpleConsole:
                 except Exception as e:
                     print(f"{Fore.RED}输入错误: {e}{Style.RESET_ALL}")
 
-        except Exception as e:
-            print(f"{Fore.RED}控制台错误: {e}{Style.RESET_ALL}")
+    def _run_prompt_session(self):
+        """在独立的事件循环中运行prompt_toolkit会话"""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            asyncio.run(self.run_async())
+            return
+
+        # 调用方已处于事件循环中(如start_console)，在独立线程中运行会话
+        thread = threading.Thread(
+            target=asyncio.run,
+            args=(self.run_async(),),
+            name="aetherius-console-prompt",
+        )
+        thread.start()
+        thread.join()
+
+    def _run_line_input(self):
+        """基于input()/stdin的主循环，用于无prompt_toolkit或非交互输入"""
+        prompt = f"{Fore.GREEN}Aetherius> {Style.RESET_ALL}"
+
+        # 非交互输入(管道/脚本)按块读取；交互终端保留readline行编辑
+        reader = None
+        if os.name == "posix" and not sys.stdin.isatty():
+            try:
+                reader = _LineReader(sys.stdin.fileno())
+            except (OSError, ValueError):
+                reader = None
+
+        try:
+            while self.is_running:
+                try:
+                    if reader:
+                        sys.stdout.write(prompt)
+                        sys.stdout.flush()
+                        for line in reader.read_lines():
+                            command = line.strip()
+                            if command:
+                                self.execute_command(command)
+                            if not self.is_running:
+                                break
+                        continue
+
+                    # 获取用户输入
+                    command = input(prompt).strip()
+
+                    # 执行命令
+                    if command:
+                        self.execute_command(command)
+
+                except (KeyboardInterrupt, EOFError):
+                    print(f"\n{Fore.YELLOW}再见!{Style.RESET_ALL}")
+                    break
+                except Exception as e:
+                    print(f"{Fore.RED}输入错误: {e}{Style.RESET_ALL}")
         finally:
-            self.is_running = False
-            self.cleanup()
+            if reader:
+                reader.close()
 
     def cleanup(self):
         """清理控制台资源"""
         try:
             # 清理增强控制台接口
             if HAS_ENHANCED_CONSOLE and self.enhanced_console:
-                import asyncio
-                import threading
-
-                def cleanup_console():
-                    try:
-                        loop = asyncio.new_event_loop()
-                        asyncio.set_event_loop(loop)
-                        try:
-                            loop.run_until_complete(
-                                close_managed_console_interface(self.server_manager)
-                            )
-                            print(f"{Fore.GREEN}✓ 已清理增强控制台接口{Style.RESET_ALL}")
-                        finally:
-                            loop.close()
-                    except Exception as e:
-                        print(f"{Fore.YELLOW}⚠ 清理增强控制台失败: {e}{Style.RESET_ALL}")
-
-                thread = threading.Thread(target=cleanup_console, daemon=True)
-                thread.start()
-                thread.join(timeout=5.0)  # 最多等待5秒
+                try:
+                    asyncio.run_coroutine_threadsafe(
+                        close_managed_console_interface(self.server_manager), self._loop
+                    ).result(timeout=5.0)  # 最多等待5秒
+                    print(f"{Fore.GREEN}✓ 已清理增强控制台接口{Style.RESET_ALL}")
+                except Exception as e:
+                    print(f"{Fore.YELLOW}⚠ 清理增强控制台失败: {e}{Style.RESET_ALL}")
 
             self.enhanced_console = None
             self._console_initialized = False
 
+            # 停止命令消费者和共享事件循环
+            try:
+                asyncio.run_coroutine_threadsafe(
+                    self._cancel_pending_tasks(), self._loop
+                ).result(timeout=2.0)
+            except Exception:
+                pass
+            self._loop.call_soon_threadsafe(self._loop.stop)
+
+            # 写出剩余的日志输出
+            self._emit(None)
+            self._output_thread.join(timeout=1.0)
+
         except Exception as e:
             print(f"{Fore.YELLOW}⚠ 控制台清理失败: {e}{Style.RESET_ALL}")
 
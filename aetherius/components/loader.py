@@ -1,6 +1,5 @@
 """Component loader and manager for Aetherius components."""
 
-import inspect
 from pathlib import Path
 from typing import Any, Optional, TYPE_CHECKING
 
@@ -71,11 +70,12 @@ class ComponentManager(AssetManager):
             if hasattr(module, info.main_class):
                 component_class = getattr(module, info.main_class)
         else:
-            for name, obj in inspect.getmembers(module):
+            # Walk the module namespace directly; getmembers getattr()s and sorts every name
+            for obj in vars(module).values():
                 if (
-                    inspect.isclass(obj)
+                    isinstance(obj, type)
+                    and obj is not Component
                     and issubclass(obj, Component)
-                    and obj != Component
                 ):
                     component_class = obj
                     break
@@ -1,28 +1,78 @@
 """Core modules for Aetherius engine."""
 
-# Core event system
-from .event_manager import EventManager, fire_event, get_event_manager, on_event
-from .events_base import *
+import importlib
 
-# Core server components  
-from .log_parser import LogParser
+# Exports are resolved lazily (PEP 562) so that importing a light submodule
+# such as ``aetherius.core.config`` does not pull in the event system.
+# Other components should be imported directly when needed.
+_LAZY_EXPORTS = {
+    # Core event system
+    "EventManager": "aetherius.core.event_manager",
+    "get_event_manager": "aetherius.core.event_manager",
+    "on_event": "aetherius.core.event_manager",
+    "fire_event": "aetherius.core.event_manager",
+    # Core server components
+    "LogParser": "aetherius.core.log_parser",
+}
 
-# Import only what's absolutely necessary to avoid circular imports
-# Other components should be imported directly when needed
+# All event classes from events_base.py
+_EVENT_NAMES = [
+    "BaseEvent",
+    "ServerLifecycleEvent",
+    "ServerStartingEvent",
+    "ServerStartedEvent",
+    "ServerStoppingEvent",
+    "ServerStoppedEvent",
+    "ServerCrashEvent",
+    "ServerLogEvent",
+    "ServerLogBatchEvent",
+    "ServerStateChangedEvent",
+    "PlayerEvent",
+    "PlayerJoinEvent",
+    "PlayerLeaveEvent",
+    "PlayerChatEvent",
+    "PlayerDeathEvent",
+    "PlayerAdvancementEvent",
+    "SystemEvent",
+    "CoreReadyEvent",
+    "LogLineEvent",
+    "UnknownLogEvent",
+    "PerformanceEvent",
+    "TickTimeEvent",
+    "LagSpikeEvent",
+    "ErrorEvent",
+    "PluginErrorEvent",
+    "ConfigurationErrorEvent",
+]
 
 __all__ = [
     # Core event system
     "EventManager",
-    "get_event_manager", 
+    "get_event_manager",
     "on_event",
     "fire_event",
     "LogParser",
-    # All event classes from events.py
+    *_EVENT_NAMES,
 ]
 
-# Add all event classes to __all__ dynamically
-import sys
-_current_module = sys.modules[__name__]
-for name in dir(_current_module):
-    if name.endswith('Event') and not name.startswith('_'):
-        __all__.append(name)
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is not None:
+        value = getattr(importlib.import_module(module_name), name)
+    elif not name.startswith("_"):
+        # Mirrors the former ``from .events_base import *``
+        events_base = importlib.import_module("aetherius.core.events_base")
+        try:
+            value = getattr(events_base, name)
+        except AttributeError:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -2,20 +2,100 @@
 Abstract base class for managing loadable assets (plugins, components, etc.).
 """
 
+import ast
 import asyncio
+import atexit
+import functools
 import importlib
 import importlib.util
 import inspect
 import logging
+import os
 import sys
 from abc import ABC, abstractmethod
+from collections import deque
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Type, Union, TYPE_CHECKING
+from types import ModuleType
+from typing import Any, Dict, List, Optional, Set, Tuple, Type, Union, TYPE_CHECKING
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
+from .event_manager import EventListener, get_event_manager
 
 if TYPE_CHECKING:
     from ..api.core import AetheriusCoreAPI
 
 
+# Executed asset modules keyed by entry file path, tagged with the file's mtime
+_MODULE_CACHE: Dict[str, Tuple[int, ModuleType]] = {}
+
+# Directories already created by this process
+_DIR_CACHE: Set[Path] = set()
+
+
+def _ensure_dir(path: Path) -> None:
+    """Create a directory (and parents) once per process."""
+    if path in _DIR_CACHE:
+        return
+    path.mkdir(parents=True, exist_ok=True)
+    _DIR_CACHE.add(path)
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_declared_depends(
+    path: str, mtime_ns: int, asset_type_name: str
+) -> Tuple[str, ...]:
+    """
+    Parse the declared dependencies of an asset entry file.
+
+    ``mtime_ns`` is only part of the cache key, so edited files are re-parsed.
+    """
+    asset_path = Path(path)
+    info: Any = {}
+
+    if asset_path.suffix == ".py":
+        info_var = f"{asset_type_name.upper()}_INFO"
+        try:
+            tree = ast.parse(asset_path.read_bytes(), filename=path)
+        except (OSError, SyntaxError, ValueError):
+            tree = None
+        for node in tree.body if tree else ():
+            if not (isinstance(node, ast.Assign) and any(
+                isinstance(target, ast.Name) and target.id == info_var for target in node.targets
+            )):
+                continue
+            value = node.value
+            if isinstance(value, ast.Dict):
+                items = zip(value.keys, value.values)
+            elif isinstance(value, ast.Call):
+                items = ((ast.Constant(kw.arg), kw.value) for kw in value.keywords if kw.arg)
+            else:
+                items = ()
+            for key_node, value_node in items:
+                try:
+                    info[ast.literal_eval(key_node)] = ast.literal_eval(value_node)
+                except ValueError:
+                    continue
+
+    if not info and (asset_path.name == "__init__.py" or asset_path.suffix == ".yaml"):
+        info_file = asset_path if asset_path.suffix == ".yaml" else asset_path.parent / f"{asset_type_name}.yaml"
+        try:
+            with open(info_file, encoding="utf-8") as f:
+                info = yaml.load(f, Loader=_YamlLoader) or {}
+        except (OSError, yaml.YAMLError):
+            info = {}
+
+    if not isinstance(info, dict):
+        return ()
+    depends = info.get("depends") or ()
+    return tuple(str(dep) for dep in depends)
+
+
 class AssetManager(ABC):
     """
     Abstract base class for managing loadable assets like plugins or components.
@@ -23,6 +103,9 @@ class AssetManager(ABC):
     and managing the lifecycle of assets.
     """
 
+    # Seconds to wait for further state changes before writing the state file
+    STATE_FLUSH_DELAY = 0.25
+
     def __init__(self, core_api: 'AetheriusCoreAPI', asset_type_name: str, base_dir_name: str):
         """
         Initialize the asset manager.
@@ -39,10 +122,21 @@ class AssetManager(ABC):
         self._assets: Dict[str, Any] = {}
         self._asset_info: Dict[str, Any] = {}
         self._load_order: List[str] = []
+        # Names reserved by loads in progress, so concurrent loads of the same name can't both run
+        self._loading_assets: Set[str] = set()
         self._enabled_assets: Dict[str, Any] = {}
+        # @on_event listeners registered from each enabled asset's module
+        self._event_listeners: Dict[str, List[EventListener]] = {}
+
+        # State writes are coalesced: bursts of load/enable/disable calls only
+        # mark the state dirty and a single delayed flush writes it out.
+        self._state_dirty = False
+        self._state_flush_handle: Optional[asyncio.TimerHandle] = None
+        self._state_flush_loop: Optional[asyncio.AbstractEventLoop] = None
+        atexit.register(self.flush_state)
 
         # Ensure base directory exists
-        self.base_dir.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(self.base_dir)
 
     @abstractmethod
     def _get_asset_base_class(self) -> Type:
@@ -77,22 +171,29 @@ class AssetManager(ABC):
     async def discover_assets(self) -> List[Path]:
         """Discover all asset files/directories in the base directory."""
         asset_paths = []
-        # Look for .py files directly in the base directory
-        for py_file in self.base_dir.glob("*.py"):
-            if not py_file.name.startswith("_"):
-                asset_paths.append(py_file)
+        asset_dirs = []
+        # A single scandir pass; DirEntry caches the file type, so telling
+        # files from directories costs no extra stat calls.
+        with os.scandir(self.base_dir) as entries:
+            for entry in entries:
+                if entry.name.startswith("_"):
+                    continue
+                # Look for .py files directly in the base directory
+                if entry.name.endswith(".py") and entry.is_file():
+                    asset_paths.append(Path(entry.path))
+                elif entry.is_dir():
+                    asset_dirs.append(Path(entry.path))
         
         # Look for asset directories with __init__.py or info file
-        for asset_dir in self.base_dir.iterdir():
-            if asset_dir.is_dir() and not asset_dir.name.startswith("_"):
-                # Check for __init__.py (Python package)
-                init_file = asset_dir / "__init__.py"
-                if init_file.exists():
-                    asset_paths.append(init_file)
-                # Or check for a specific info file (e.g., plugin.yaml, component.yaml)
-                elif (asset_dir / f"{self.asset_type_name}.yaml").exists():
-                    asset_paths.append(asset_dir / f"{self.asset_type_name}.yaml")
-        
+        for asset_dir in asset_dirs:
+            # Check for __init__.py (Python package)
+            init_file = asset_dir / "__init__.py"
+            if init_file.exists():
+                asset_paths.append(init_file)
+            # Or check for a specific info file (e.g., plugin.yaml, component.yaml)
+            elif (asset_dir / f"{self.asset_type_name}.yaml").exists():
+                asset_paths.append(asset_dir / f"{self.asset_type_name}.yaml")
+    
         self.logger.info(f"Discovered {len(asset_paths)} potential {self.asset_type_name}s")
         return asset_paths
 
@@ -104,45 +205,68 @@ class AssetManager(ABC):
             return 0
 
         loaded_count = 0
-        asset_paths = await self.discover_assets()
-
-        # Sort assets by dependency order (placeholder for now)
-        sorted_assets = self._sort_by_dependencies(asset_paths)
-
-        for asset_path in sorted_assets:
-            try:
-                if await self._load_asset(asset_path):
+        asset_paths = self._drop_unsatisfiable(await self.discover_assets())
+
+        # Load each dependency layer concurrently; later layers only start
+        # once everything they may depend on has finished loading.
+        for layer in self._layer_by_dependencies(asset_paths):
+            results = await asyncio.gather(
+                *(self._load_asset(asset_path) for asset_path in layer),
+                return_exceptions=True
+            )
+            for asset_path, result in zip(layer, results):
+                if isinstance(result, BaseException):
+                    self.logger.error(f"Failed to load {self.asset_type_name} from {asset_path}: {result}")
+                elif result:
                     loaded_count += 1
-            except Exception as e:
-                self.logger.error(f"Failed to load {self.asset_type_name} from {asset_path}: {e}")
 
-        self._get_state_manager().save()
+        self._mark_state_dirty()
         return loaded_count
 
+    @staticmethod
+    def _asset_name_from_path(asset_path: Path) -> str:
+        """Derive the asset name from its entry file path."""
+        if asset_path.name == "__init__.py" or asset_path.suffix == ".yaml":
+            return asset_path.parent.name # For packages and component.yaml/plugin.yaml in a folder
+        return asset_path.stem
+
     async def _load_asset(self, asset_path: Path) -> bool:
         """Load a single asset from a file or directory."""
-        asset_name = asset_path.stem
-        if asset_path.name == "__init__.py":
-            asset_name = asset_path.parent.name
-        elif asset_path.suffix == ".yaml":
-            asset_name = asset_path.parent.name # For component.yaml/plugin.yaml in a folder
+        asset_name = self._asset_name_from_path(asset_path)
 
         if asset_name in self._assets:
             self.logger.warning(f"{self.asset_type_name.capitalize()} {asset_name} is already loaded")
             return False
+        if asset_name in self._loading_assets:
+            self.logger.warning(f"{self.asset_type_name.capitalize()} {asset_name} is already being loaded")
+            return False
 
+        module_name = f"aetherius.{self.asset_type_name}s.{asset_name}"
+        loaded = False
+        self._loading_assets.add(asset_name)
         try:
-            # Load the asset module
-            spec = importlib.util.spec_from_file_location(
-                f"{self.asset_type_name}_{asset_name}", asset_path
-            )
-            if spec is None or spec.loader is None:
-                self.logger.error(f"Failed to create spec for {self.asset_type_name} {asset_name}")
-                return False
-
-            module = importlib.util.module_from_spec(spec)
-            sys.modules[f"aetherius.{self.asset_type_name}s.{asset_name}"] = module
-            spec.loader.exec_module(module)
+            # Reuse the already executed module if its file is unchanged
+            module_key = str(asset_path)
+            mtime_ns = asset_path.stat().st_mtime_ns
+            cached = _MODULE_CACHE.get(module_key)
+            if cached is not None and cached[0] == mtime_ns:
+                module = cached[1]
+                sys.modules[module_name] = module
+            else:
+                # Load the asset module
+                spec = importlib.util.spec_from_file_location(
+                    f"{self.asset_type_name}_{asset_name}", asset_path
+                )
+                if spec is None or spec.loader is None:
+                    self.logger.error(f"Failed to create spec for {self.asset_type_name} {asset_name}")
+                    return False
+
+                module = importlib.util.module_from_spec(spec)
+                sys.modules[module_name] = module
+                # Module execution is blocking disk I/O; run it off the event loop
+                # so assets in the same dependency layer load concurrently.
+                await asyncio.to_thread(spec.loader.exec_module, module)
+                _MODULE_CACHE[module_key] = (mtime_ns, module)
 
             # Get asset info
             asset_info = self._extract_asset_info(module, asset_name)
@@ -164,7 +288,8 @@ class AssetManager(ABC):
 
             # Set up asset context
             data_folder = self.base_dir / asset_name / "data"
-            data_folder.mkdir(parents=True, exist_ok=True)
+            if data_folder not in _DIR_CACHE:
+                await asyncio.to_thread(_ensure_dir, data_folder)
             asset_context = self._get_asset_context_class()(
                 core_api=self.core_api,
                 data_folder=data_folder,
@@ -184,12 +309,19 @@ class AssetManager(ABC):
             self._get_state_manager().add_loaded(asset_name, asset_info)
 
             self.logger.info(f"Loaded {self.asset_type_name}: {asset_name} v{asset_info.version}")
+            loaded = True
             return True
 
         except Exception as e:
             self.logger.error(f"Error loading {self.asset_type_name} {asset_name}: {e}", exc_info=True)
             return False
 
+        finally:
+            self._loading_assets.discard(asset_name)
+            # Don't leave half-loaded modules registered in sys.modules
+            if not loaded:
+                sys.modules.pop(module_name, None)
+
     def _check_dependencies(self, asset_info: Any) -> List[str]:
         """Check if asset dependencies are satisfied."""
         missing = []
@@ -198,10 +330,153 @@ class AssetManager(ABC):
                 missing.append(dep)
         return missing
 
+    def _read_declared_depends(self, asset_path: Path) -> List[str]:
+        """
+        Read an asset's declared dependencies without executing it.
+
+        Looks at the ``<TYPE>_INFO`` literal in the module source, then at the
+        ``<type>.yaml`` info file next to it. Dependencies name other assets
+        by their path-derived name (see _asset_name_from_path), the same key
+        _check_dependencies uses.
+        """
+        try:
+            mtime_ns = asset_path.stat().st_mtime_ns
+        except OSError:
+            return []
+        if asset_path.name == "__init__.py":
+            # The sidecar info file can change independently of the package
+            try:
+                info_file = asset_path.parent / f"{self.asset_type_name}.yaml"
+                mtime_ns = max(mtime_ns, info_file.stat().st_mtime_ns)
+            except OSError:
+                pass
+
+        return list(_parse_declared_depends(str(asset_path), mtime_ns, self.asset_type_name))
+
+    def _drop_unsatisfiable(self, asset_paths: List[Path]) -> List[Path]:
+        """
+        Filter out assets whose declared dependencies can never be met.
+
+        Works on the declared info only, so assets that would fail the
+        dependency check are rejected without executing any of their code.
+        Dependents of a rejected asset are rejected as well. Assets are keyed
+        by the same path-derived name that _check_dependencies looks up; of
+        several paths sharing a name only the first discovered one is kept.
+        """
+        declared: Dict[str, Tuple[Path, List[str]]] = {}
+        for asset_path in asset_paths:
+            name = self._asset_name_from_path(asset_path)
+            if name in declared:
+                self.logger.error(
+                    f"Duplicate {self.asset_type_name} name {name}: "
+                    f"ignoring {asset_path}, already provided by {declared[name][0]}"
+                )
+                continue
+            declared[name] = (asset_path, self._read_declared_depends(asset_path))
+
+        available = set(declared) | set(self._assets)
+        pending = list(declared)
+        while pending:
+            rejected = []
+            for name in pending:
+                missing = [dep for dep in declared[name][1] if dep not in available]
+                if missing:
+                    self.logger.error(
+                        f"{self.asset_type_name.capitalize()} {name} missing dependencies: {missing}"
+                    )
+                    rejected.append(name)
+            for name in rejected:
+                del declared[name]
+                available.discard(name)
+            # Only assets that depended on a just-rejected one can be affected
+            pending = [
+                name for name, (_, depends) in declared.items()
+                if any(dep in rejected for dep in depends)
+            ]
+
+        return [asset_path for asset_path, _ in declared.values()]
+
+    def _build_dependency_graph(
+        self, asset_paths: List[Path]
+    ) -> Tuple[Dict[str, Path], Dict[str, List[str]]]:
+        """
+        Map asset names to paths and to their in-set dependencies.
+
+        Names are path-derived, matching _check_dependencies; the paths are
+        expected to be unique per name (see _drop_unsatisfiable).
+        """
+        by_name: Dict[str, Path] = {}
+        declared: Dict[str, List[str]] = {}
+        for asset_path in sorted(asset_paths, key=self._asset_name_from_path):
+            name = self._asset_name_from_path(asset_path)
+            by_name[name] = asset_path
+            declared[name] = self._read_declared_depends(asset_path)
+
+        # Dependencies outside the discovered set are left to _check_dependencies
+        graph = {
+            name: sorted({dep for dep in depends if dep in by_name and dep != name})
+            for name, depends in declared.items()
+        }
+        return by_name, graph
+
+    def _dependency_order(self, graph: Dict[str, List[str]]) -> List[str]:
+        """
+        Topologically order asset names with Kahn's algorithm in O(V+E).
+
+        Cycles are logged and broken greedily by releasing the remaining node
+        with the fewest unmet dependencies.
+        """
+        indegree = {name: len(depends) for name, depends in graph.items()}
+        children: Dict[str, List[str]] = {name: [] for name in graph}
+        for name, depends in graph.items():
+            for dep in depends:
+                children[dep].append(name)
+
+        order: List[str] = []
+        ready = deque(name for name, degree in indegree.items() if degree == 0)
+        while len(order) < len(graph):
+            if not ready:
+                remaining = [name for name, degree in indegree.items() if degree > 0]
+                self.logger.warning(
+                    f"Dependency cycle among {self.asset_type_name}s: {', '.join(remaining)}"
+                )
+                forced = min(remaining, key=lambda name: (indegree[name], name))
+                indegree[forced] = 0
+                ready.append(forced)
+
+            name = ready.popleft()
+            order.append(name)
+            for child in children[name]:
+                if indegree[child] > 0:
+                    indegree[child] -= 1
+                    if indegree[child] == 0:
+                        ready.append(child)
+        return order
+
     def _sort_by_dependencies(self, asset_paths: List[Path]) -> List[Path]:
-        """Sort asset paths by dependency order (placeholder for now)."""
-        # TODO: Implement proper topological sort based on asset_info.depends
-        return sorted(asset_paths, key=lambda p: p.name)
+        """Sort asset paths so every asset comes after its dependencies."""
+        by_name, graph = self._build_dependency_graph(asset_paths)
+        return [by_name[name] for name in self._dependency_order(graph)]
+
+    def _layer_by_dependencies(self, asset_paths: List[Path]) -> List[List[Path]]:
+        """
+        Group asset paths into dependency layers.
+
+        Every asset in a layer only depends on assets from earlier layers, so
+        the members of one layer can be loaded concurrently.
+        """
+        by_name, graph = self._build_dependency_graph(asset_paths)
+
+        depth: Dict[str, int] = {}
+        layers: List[List[Path]] = []
+        for name in self._dependency_order(graph):
+            # Dependencies not yet placed only occur on a broken cycle
+            level = max((depth[dep] + 1 for dep in graph[name] if dep in depth), default=0)
+            depth[name] = level
+            if level == len(layers):
+                layers.append([])
+            layers[level].append(by_name[name])
+        return layers
 
     async def enable_asset(self, name: str) -> bool:
         """Enable a loaded asset."""
@@ -219,8 +494,13 @@ class AssetManager(ABC):
             await asset.on_enable()
             asset.enabled = True
             self._enabled_assets[name] = asset
+
+            # Decorated listeners only take effect while the asset is enabled
+            module = sys.modules.get(f"aetherius.{self.asset_type_name}s.{name}")
+            if module is not None:
+                self._event_listeners[name] = get_event_manager().register_module(module)
             self._get_state_manager().add_enabled(name)
-            self._get_state_manager().save()
+            self._mark_state_dirty()
             self.logger.info(f"Enabled {self.asset_type_name}: {name}")
             return True
         except Exception as e:
@@ -239,8 +519,12 @@ class AssetManager(ABC):
             await asset.on_disable()
             asset.enabled = False
             del self._enabled_assets[name]
+
+            event_manager = get_event_manager()
+            for listener in self._event_listeners.pop(name, ()):
+                event_manager.unregister_listener(listener)
             self._get_state_manager().remove_enabled(name)
-            self._get_state_manager().save()
+            self._mark_state_dirty()
             self.logger.info(f"Disabled {self.asset_type_name}: {name}")
             return True
         except Exception as e:
@@ -272,9 +556,13 @@ class AssetManager(ABC):
             self._get_state_manager().remove_loaded(name)
 
             # Remove from sys.modules
-            module_name = f"aetherius.{self.asset_type_name}s.{name}"
-            if module_name in sys.modules:
-                del sys.modules[module_name]
+            module = sys.modules.pop(f"aetherius.{self.asset_type_name}s.{name}", None)
+
+            # Release the executed module as well: a later load must run the
+            # module code again so its module-level state starts fresh
+            module_file = getattr(module, "__file__", None)
+            if module_file:
+                _MODULE_CACHE.pop(module_file, None)
 
             self.logger.info(f"Unloaded {self.asset_type_name}: {name}")
             return True
@@ -306,11 +594,14 @@ class AssetManager(ABC):
                 self.logger.error(f"Could not find original path for {self.asset_type_name} {name} to reload.")
                 return False
 
+            # An explicit reload always re-executes the module code
+            _MODULE_CACHE.pop(str(asset_path), None)
+
             success = await self._load_asset(asset_path)
             if success and was_enabled:
                 await self.enable_asset(name)
 
-            self._get_state_manager().save()
+            self._mark_state_dirty()
             self.logger.info(f"Reloaded {self.asset_type_name}: {name}")
             return success
 
@@ -339,6 +630,37 @@ class AssetManager(ABC):
         # Unload in reverse order of loading
         for asset_name in reversed(self._load_order):
             await self.unload_asset(asset_name)
+        self.flush_state()
+
+    def _mark_state_dirty(self) -> None:
+        """Mark the persistent state as changed and schedule a coalesced flush."""
+        self._state_dirty = True
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.flush_state()
+            return
+
+        if self._state_flush_handle is not None:
+            if self._state_flush_loop is loop:
+                return
+            # Scheduled on a loop that has since gone away; it will never fire
+            self._state_flush_handle.cancel()
+            self._state_flush_handle = None
+
+        self._state_flush_loop = loop
+        self._state_flush_handle = loop.call_later(self.STATE_FLUSH_DELAY, self.flush_state)
+
+    def flush_state(self) -> None:
+        """Write pending state changes to disk immediately."""
+        if self._state_flush_handle is not None:
+            self._state_flush_handle.cancel()
+            self._state_flush_handle = None
+            self._state_flush_loop = None
+
+        if self._state_dirty:
+            self._state_dirty = False
+            self._get_state_manager().save()
 
     def is_loaded(self, name: str) -> bool:
         """Check if an asset is loaded."""
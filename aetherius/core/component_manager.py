@@ -7,9 +7,9 @@ Aetherius组件管理器
 """
 
 import importlib.util
-import inspect
 import json
 import logging
+import os
 import sys
 from pathlib import Path
 from typing import Any, Optional
@@ -17,6 +17,7 @@ from typing import Any, Optional
 import yaml
 
 from .component import Component, ComponentInfo, WebComponent
+from .event_manager import EventListener, get_event_manager
 
 logger = logging.getLogger(__name__)
 
@@ -53,6 +54,8 @@ class ComponentManager:
         self._loaded_components: set[str] = set()
         self._enabled_components: set[str] = set()
         self._failed_components: dict[str, str] = {}
+        # 组件启用期间注册的 @on_event 监听器
+        self._event_listeners: dict[str, list[EventListener]] = {}
 
         logger.info("Component manager initialized")
 
@@ -65,9 +68,11 @@ class ComponentManager:
         """
         discovered = []
 
-        for component_dir in self.components_dir.iterdir():
-            if not component_dir.is_dir():
-                continue
+        # scandir 的 DirEntry 缓存了文件类型，判断目录无需额外 stat
+        with os.scandir(self.components_dir) as entries:
+            component_dirs = [Path(entry.path) for entry in entries if entry.is_dir()]
+
+        for component_dir in component_dirs:
 
             # 检查必要文件
             init_file = component_dir / "__init__.py"
@@ -278,18 +283,19 @@ class ComponentManager:
 
             # 2. 查找Component子类
             if not component_class:
-                for name, obj in inspect.getmembers(module):
+                for obj in vars(module).values():
                     if (
-                        inspect.isclass(obj)
+                        isinstance(obj, type)
+                        and obj is not Component
+                        and obj is not WebComponent
                         and issubclass(obj, Component)
-                        and obj != Component
-                        and obj != WebComponent
                     ):
                         component_class = obj
                         break
 
             if not component_class:
                 logger.error(f"No Component class found in {component_name}")
+                sys.modules.pop(f"component_{component_name}", None)
                 return False
 
             # 创建组件实例
@@ -328,6 +334,7 @@ class ComponentManager:
         except Exception as e:
             logger.error(f"Error loading component {component_name}: {e}")
             self._failed_components[component_name] = str(e)
+            sys.modules.pop(f"component_{component_name}", None)
             return False
 
     def _load_component_config(
@@ -424,6 +431,13 @@ class ComponentManager:
             await component.on_enable()
             self._enabled_components.add(component_name)
 
+            # 组件模块中标记的监听器只在启用期间生效
+            module = sys.modules.get(f"component_{component_name}")
+            if module is not None:
+                self._event_listeners[component_name] = (
+                    get_event_manager().register_module(module)
+                )
+
             logger.info(f"Enabled component: {component_name}")
 
             # 发送组件启用事件
@@ -459,6 +473,10 @@ class ComponentManager:
             await component.on_disable()
             self._enabled_components.remove(component_name)
 
+            event_manager = get_event_manager()
+            for listener in self._event_listeners.pop(component_name, ()):
+                event_manager.unregister_listener(listener)
+
             logger.info(f"Disabled component: {component_name}")
 
             # 发送组件禁用事件
@@ -503,6 +521,8 @@ class ComponentManager:
             del self.component_info[component_name]
             del self.component_paths[component_name]
             self._loaded_components.remove(component_name)
+            # 移除模块引用，避免反复重载时 sys.modules 持有旧代码
+            sys.modules.pop(f"component_{component_name}", None)
 
             if component_name in self._web_components:
                 del self._web_components[component_name]
@@ -599,6 +619,17 @@ class ComponentManager:
         """列出Web组件"""
         return list(self._web_components.keys())
 
+    def get_component_stats(self) -> dict[str, int]:
+        """
+        获取组件数量统计（O(1)，不构建组件列表，适合频繁轮询）
+
+        Returns:
+            包含 total/enabled/disabled 的计数字典
+        """
+        total = len(self._loaded_components)
+        enabled = len(self._enabled_components)
+        return {"total": total, "enabled": enabled, "disabled": total - enabled}
+
     def get_component_status(self) -> dict[str, Any]:
         """
         获取组件系统状态
@@ -14,7 +14,9 @@ from abc import ABC, abstractmethod
 from enum import Enum
 from dataclasses import dataclass, field
 from pathlib import Path
+from datetime import datetime
 import asyncio
+import time
 
 T = TypeVar('T')
 
@@ -45,7 +47,18 @@ class ConfigChange:
     new_value: Any
     source: str
     priority: ConfigPriority
-    timestamp: float = field(default_factory=lambda: __import__('time').time())
+    timestamp: float = field(default_factory=time.time)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """转换为字典格式（时间戳仅在此时格式化为 ISO 字符串）"""
+        return {
+            "key": self.key,
+            "old_value": self.old_value,
+            "new_value": self.new_value,
+            "source": self.source,
+            "priority": self.priority.value,
+            "timestamp": datetime.fromtimestamp(self.timestamp).isoformat(),
+        }
 
 
 class IConfigSource(Protocol):
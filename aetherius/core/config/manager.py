@@ -4,106 +4,220 @@
 提供功能完整的配置管理实现
 """
 
+import atexit
+import hashlib
+import inspect
 import os
 import re
+import shutil
 import threading
+import time
 import json
 import yaml
-from typing import Any, Dict, List, Optional, Union, Callable, Pattern, Set
+from typing import Any, Deque, Dict, List, Mapping, Optional, Tuple, Union, Callable, Pattern, Set
 from pathlib import Path
-from collections import defaultdict
+from types import MappingProxyType
+from collections import defaultdict, deque
 from dataclasses import dataclass, field
 import logging
 import asyncio
 from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
+
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:  # 未编译 libyaml 时回退到纯 Python 实现
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 from .interfaces import (
     IConfigManager, IConfigSource, IConfigValidator, IConfigWatcher,
     IConfigEncryption, IConfigTemplate, ConfigPriority, ConfigFormat,
     ConfigChange, ConfigDescriptor, ConfigError, ConfigValidationError
 )
+from .sources import _clone_tree
 
 logger = logging.getLogger(__name__)
 
 
+# 区分“未缓存”与缓存值为 None 的哨兵
+_MISSING = object()
+
+
+def _fingerprint(data: Any) -> str:
+    """计算配置数据的内容指纹（按键排序，与键顺序、格式和注释无关）"""
+    if HAS_ORJSON:
+        # orjson 在原生代码中按键排序序列化，比逐值 repr 快得多；无法序列化的数据回退到流式哈希
+        try:
+            serialized = orjson.dumps(data, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+        else:
+            return hashlib.blake2b(serialized, digest_size=16).hexdigest()
+    
+    hasher = hashlib.blake2b(digest_size=16)
+    _feed_fingerprint(hasher, data)
+    return hasher.hexdigest()
+
+
+def _feed_fingerprint(hasher, value: Any):
+    """按规范顺序把配置值写入哈希器"""
+    if isinstance(value, dict):
+        hasher.update(b'{')
+        for key in sorted(value, key=str):
+            hasher.update(repr(key).encode())
+            hasher.update(b':')
+            _feed_fingerprint(hasher, value[key])
+            hasher.update(b',')
+        hasher.update(b'}')
+    elif isinstance(value, (list, tuple)):
+        hasher.update(b'[')
+        for item in value:
+            _feed_fingerprint(hasher, item)
+            hasher.update(b',')
+        hasher.update(b']')
+    else:
+        hasher.update(repr(value).encode())
+
+
+@lru_cache(maxsize=2048)
+def _split_key(key: str) -> tuple:
+    """拆分点分隔的配置键（缓存结果，避免热路径上重复 split）"""
+    return tuple(key.split('.'))
+
+
 class ConfigManager(IConfigManager):
     """配置管理器实现"""
     
+    # 连续写入的合并窗口（秒）：窗口内第一次写入立即保存，其余在窗口结束时合并保存
+    SAVE_DEBOUNCE_DELAY = 0.15
+    
     def __init__(self, 
                  enable_watching: bool = True,
                  encryption: Optional[IConfigEncryption] = None,
                  template_engine: Optional[IConfigTemplate] = None):
         self._sources: List[IConfigSource] = []
         self._validators: Dict[Pattern, IConfigValidator] = {}
+        # 键 -> 生效的验证器（无则为 None），一次字典查找代替逐个匹配正则，add_validator 时失效
+        self._validator_index: Dict[str, Optional[IConfigValidator]] = {}
         self._watchers: Dict[Pattern, List[IConfigWatcher]] = defaultdict(list)
+        # 键 -> 匹配的监听器，首次通知时按模式解析，add_watcher 时失效
+        self._watcher_cache: Dict[str, Tuple[IConfigWatcher, ...]] = {}
         self._config_cache: Dict[str, Any] = {}
+        # 各配置源的加载结果及合并结果缓存，在 set/delete/reload/add_source 时失效
+        self._source_data: Optional[List[Dict[str, Any]]] = None
+        self._merged_config: Optional[Dict[str, Any]] = None
+        # 配置结构版本号，每次变更递增；派生缓存以版本号标记，比较整数即可判断是否过期
+        self._version = 0
+        self._saved_version = 0
+        # 已构建的配置段及键列表，(版本号, 结果)
+        self._section_cache: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+        self._keys_cache: Optional[Tuple[int, List[str]]] = None
+        # 已解析配置值的快照，供 get() 无锁读取；任何变更都会发布新的空快照
+        self._resolved: Dict[str, Any] = {}
         self._descriptors: Dict[str, ConfigDescriptor] = {}
         self._lock = threading.RLock()
         self._enable_watching = enable_watching
         self._encryption = encryption
         self._template_engine = template_engine
         self._watch_tasks: Set[asyncio.Task] = set()
+        # 合并窗口内待保存的配置源：id(source) -> (source, 窗口内累计的变更)
+        self._pending_saves: Dict[int, Tuple[IConfigSource, Dict[str, Any]]] = {}
+        self._save_handle: Optional[asyncio.TimerHandle] = None
+        self._save_loop: Optional[asyncio.AbstractEventLoop] = None
+        # 事件循环退出时合并窗口不会再结束，进程退出前写出遗留的变更
+        atexit.register(self.flush)
         
         # 配置变更历史
-        self._change_history: List[ConfigChange] = []
+        # 环形缓冲区，超出上限时 O(1) 淘汰最旧的记录
         self._max_history_size = 1000
+        self._change_history: Deque[ConfigChange] = deque(maxlen=self._max_history_size)
+        # 按配置段（键的第一段）索引的变更历史，按段查询时只访问该段的记录
+        self._history_by_section: Dict[str, Deque[ConfigChange]] = defaultdict(
+            lambda: deque(maxlen=self._max_history_size)
+        )
     
     def get(self, key: str, default: Any = None) -> Any:
         """获取配置值"""
+        # 无锁快速路径：读取已发布的解析结果快照（引用读取是原子的）
+        resolved = self._resolved
+        if key in resolved:
+            return resolved[key]
+        
         with self._lock:
-            # 检查缓存
-            if key in self._config_cache:
-                value = self._config_cache[key]
-            else:
-                value = self._load_value(key)
-                if value is not None:
-                    self._config_cache[key] = value
-            
-            if value is None:
-                return default
-            
-            # 解密敏感配置
-            if self._encryption and isinstance(value, str):
-                if self._encryption.is_encrypted(value):
-                    try:
-                        value = self._encryption.decrypt(value)
-                    except Exception as e:
-                        logger.warning(f"Failed to decrypt config {key}: {e}")
-                        return default
-            
-            # 模板渲染
-            if self._template_engine and isinstance(value, str):
+            value, _ = self._resolve_value(key)
+            return default if value is _MISSING else value
+    
+    def _resolve_value(self, key: str) -> Tuple[Any, bool]:
+        """解析配置值，返回 (值, 是否可缓存)；无值或解密失败时值为 _MISSING（调用方需持有 self._lock）"""
+        # 检查缓存
+        if key in self._config_cache:
+            value = self._config_cache[key]
+        else:
+            value = self._load_value(key)
+            if value is not None:
+                self._config_cache[key] = value
+        
+        if value is None:
+            return _MISSING, True
+        
+        # 解密或模板渲染得到的值不进入快照（不常驻明文，且模板上下文会变化）
+        cacheable = True
+        
+        # 解密敏感配置
+        if self._encryption and isinstance(value, str):
+            if self._encryption.is_encrypted(value):
+                cacheable = False
                 try:
-                    value = self._template_engine.render(value, self._config_cache)
+                    value = self._encryption.decrypt(value)
                 except Exception as e:
-                    logger.warning(f"Failed to render template for {key}: {e}")
+                    logger.warning(f"Failed to decrypt config {key}: {e}")
+                    return _MISSING, False
             
-            # 验证
-            validated_value = self._validate_value(key, value)
-            if validated_value != value:
-                self._config_cache[key] = validated_value
-                value = validated_value
-            
-            return value
+        # 模板渲染
+        if self._template_engine and isinstance(value, str):
+            cacheable = False
+            try:
+                value = self._template_engine.render(value, self._config_cache)
+            except Exception as e:
+                logger.warning(f"Failed to render template for {key}: {e}")
+        
+        # 验证
+        validated_value = self._validate_value(key, value)
+        if validated_value != value:
+            self._config_cache[key] = validated_value
+            value = validated_value
+        
+        if cacheable:
+            # 持锁写入当前快照；写操作会整体替换快照而不是原地修改
+            self._resolved[key] = value
+        
+        return value, cacheable
     
     def set(self, key: str, value: Any, priority: ConfigPriority = ConfigPriority.RUNTIME):
         """设置配置值"""
         with self._lock:
             old_value = self._config_cache.get(key)
             
-            # 验证新值
-            validated_value = self._validate_value(key, value)
-            
-            # 加密敏感配置
-            if self._encryption and self._is_sensitive(key) and isinstance(validated_value, str):
-                if not self._encryption.is_encrypted(validated_value):
-                    validated_value = self._encryption.encrypt(validated_value)
+            # 验证新值并加密敏感配置
+            validated_value = self._prepare_value(key, value)
             
             # 更新缓存
             self._config_cache[key] = validated_value
             
             # 尝试保存到可写的配置源
-            self._save_to_source(key, validated_value, priority)
+            saved = self._save_to_source({key: validated_value}, priority)
+            # 配置源数据已就地更新，只需重新合并
+            self._merged_config = None
+            self._bump_version()
+            if saved:
+                self._saved_version = self._version
             
             # 记录变更
             change = ConfigChange(
@@ -114,13 +228,55 @@ class ConfigManager(IConfigManager):
                 priority=priority
             )
             self._add_change_history(change)
+        
+        # 释放锁后再通知监听器，慢回调不会阻塞其他线程读取配置
+        self._notify_watchers(change)
+    
+    def set_many(self, values: Mapping[str, Any], priority: ConfigPriority = ConfigPriority.RUNTIME):
+        """批量设置配置值
+
+        先验证全部值，任一验证失败则不做任何修改；全部应用后每个配置源只保存一次，
+        最后统一通知监听器。
+        """
+        with self._lock:
+            validated = {key: self._prepare_value(key, value) for key, value in values.items()}
+            if not validated:
+                return
+            
+            old_values = {key: self._config_cache.get(key) for key in validated}
+            self._config_cache.update(validated)
+            
+            saved = self._save_to_source(validated, priority)
+            self._merged_config = None
+            self._bump_version()
+            if saved:
+                self._saved_version = self._version
             
-            # 通知监听器
-            self._notify_watchers(change)
+            changes = []
+            for key, new_value in validated.items():
+                change = ConfigChange(
+                    key=key,
+                    old_value=old_values[key],
+                    new_value=new_value,
+                    source="runtime",
+                    priority=priority
+                )
+                self._add_change_history(change)
+                changes.append(change)
+        
+        self._notify_watchers(*changes)
     
     def has(self, key: str) -> bool:
         """检查配置是否存在"""
-        return self.get(key) is not None
+        # 只探测是否存在，不做解密、模板渲染和验证
+        if key in self._resolved:
+            return True
+        
+        with self._lock:
+            value = self._config_cache.get(key, _MISSING)
+            if value is _MISSING:
+                value = self._load_value(key)
+            return value is not None
     
     def delete(self, key: str) -> bool:
         """删除配置"""
@@ -128,6 +284,7 @@ class ConfigManager(IConfigManager):
             if key in self._config_cache:
                 old_value = self._config_cache[key]
                 del self._config_cache[key]
+                self._bump_version()
                 
                 # 记录变更
                 change = ConfigChange(
@@ -138,38 +295,78 @@ class ConfigManager(IConfigManager):
                     priority=ConfigPriority.RUNTIME
                 )
                 self._add_change_history(change)
-                self._notify_watchers(change)
-                
-                return True
-            return False
+            else:
+                return False
+        
+        self._notify_watchers(change)
+        return True
     
     def get_section(self, section: str) -> Dict[str, Any]:
         """获取配置段"""
-        section_config = {}
-        prefix = f"{section}."
-        
-        # 从所有源加载
-        all_config = self._load_all_config()
-        
-        for key, value in all_config.items():
-            if key.startswith(prefix):
-                section_key = key[len(prefix):]
-                section_config[section_key] = self.get(key)
+        return dict(self._build_section(section))
+    
+    def get_keys(self, prefix: Optional[str] = None) -> List[str]:
+        """获取所有配置键（点分隔的叶子键），可按前缀过滤"""
+        cached = self._keys_cache
+        if cached is not None and cached[0] == self._version:
+            keys = cached[1]
+        else:
+            with self._lock:
+                all_config = self._load_all_config()
+                leaf_keys = {key for key, value in all_config.items() if not isinstance(value, dict)}
+                keys = sorted(leaf_keys | set(self._config_cache))
+                self._keys_cache = (self._version, keys)
         
-        return section_config
+        if prefix:
+            return [key for key in keys if key.startswith(prefix)]
+        return list(keys)
+    
+    def get_section_view(self, section: str) -> Mapping[str, Any]:
+        """获取配置段的只读视图（不复制；配置变更后需重新获取）"""
+        return MappingProxyType(self._build_section(section))
+    
+    def _build_section(self, section: str) -> Dict[str, Any]:
+        """构建配置段并缓存至下次配置变更（含解密或模板渲染值的配置段不缓存）"""
+        with self._lock:
+            cached = self._section_cache.get(section)
+            if cached is not None and cached[0] == self._version:
+                return cached[1]
+            
+            section_config = {}
+            prefix = f"{section}."
+            cacheable = True
+            
+            # 从所有源加载
+            all_config = self._load_all_config()
+            
+            for key in all_config:
+                if key.startswith(prefix):
+                    value, value_cacheable = self._resolve_value(key)
+                    section_config[key[len(prefix):]] = None if value is _MISSING else value
+                    cacheable = cacheable and value_cacheable
+            
+            if cacheable:
+                self._section_cache[section] = (self._version, section_config)
+            return section_config
     
     def reload(self):
         """重新加载配置"""
         with self._lock:
             logger.info("Reloading configuration...")
+            # 先写出合并窗口内的变更，避免被重新加载覆盖
+            self.flush()
             
             old_config = self._config_cache.copy()
             self._config_cache.clear()
+            self._invalidate_source_cache()
             
             # 重新加载所有源
             new_config = self._load_all_config()
+            # 内存中的配置与配置源重新一致
+            self._saved_version = self._version
             
             # 检测变更
+            changes = []
             all_keys = set(old_config.keys()) | set(new_config.keys())
             for key in all_keys:
                 old_value = old_config.get(key)
@@ -184,9 +381,11 @@ class ConfigManager(IConfigManager):
                         priority=ConfigPriority.FILE
                     )
                     self._add_change_history(change)
-                    self._notify_watchers(change)
+                    changes.append(change)
             
             logger.info(f"Configuration reloaded. {len(all_keys)} keys processed.")
+        
+        self._notify_watchers(*changes)
     
     def add_source(self, source: IConfigSource):
         """添加配置源"""
@@ -194,6 +393,10 @@ class ConfigManager(IConfigManager):
             self._sources.append(source)
             # 按优先级排序
             self._sources.sort(key=lambda s: s.priority.value)
+            clean = not self.has_unsaved_changes()
+            self._invalidate_source_cache()
+            if clean:
+                self._saved_version = self._version
             
             # 如果启用监听且源支持，则设置监听
             if self._enable_watching and hasattr(source, 'watch'):
@@ -207,13 +410,19 @@ class ConfigManager(IConfigManager):
     def add_validator(self, key_pattern: str, validator: IConfigValidator):
         """添加验证器"""
         pattern = re.compile(key_pattern)
-        self._validators[pattern] = validator
+        with self._lock:
+            self._validators[pattern] = validator
+            self._validator_index = {}
+            # 只影响解析快照和配置段缓存，不产生需要保存的变更
+            self._resolved = {}
+            self._section_cache = {}
         logger.info(f"Added validator for pattern: {key_pattern}")
     
     def add_watcher(self, key_pattern: str, watcher: IConfigWatcher):
         """添加监听器"""
         pattern = re.compile(key_pattern)
         self._watchers[pattern].append(watcher)
+        self._watcher_cache = {}
         logger.info(f"Added watcher for pattern: {key_pattern}")
     
     def export(self, format: ConfigFormat, file_path: Optional[Path] = None) -> str:
@@ -221,7 +430,7 @@ class ConfigManager(IConfigManager):
         all_config = self._load_all_config()
         
         if format == ConfigFormat.YAML:
-            content = yaml.dump(all_config, default_flow_style=False, allow_unicode=True)
+            content = yaml.dump(all_config, Dumper=_YamlDumper, default_flow_style=False, allow_unicode=True)
         elif format == ConfigFormat.JSON:
             content = json.dumps(all_config, indent=2, ensure_ascii=False)
         else:
@@ -264,51 +473,128 @@ class ConfigManager(IConfigManager):
         
         return errors
     
-    def get_change_history(self, limit: Optional[int] = None) -> List[ConfigChange]:
-        """获取配置变更历史"""
+    def get_change_history(self, limit: Optional[int] = None,
+                           section: Optional[str] = None) -> List[ConfigChange]:
+        """获取配置变更历史，可按配置段过滤"""
         with self._lock:
+            if section is None:
+                history = self._change_history
+            else:
+                history = self._history_by_section.get(section)
+                if history is None:
+                    return []
+            
             if limit:
-                return self._change_history[-limit:]
-            return self._change_history.copy()
+                # 从尾部取最近的 limit 条，无需复制整个缓冲区
+                recent = list(islice(reversed(history), limit))
+                recent.reverse()
+                return recent
+            return list(history)
+    
+    def get_version(self) -> int:
+        """获取配置结构版本号（每次变更递增）"""
+        return self._version
+    
+    def has_unsaved_changes(self) -> bool:
+        """检查是否存在未写回配置源的变更"""
+        with self._lock:
+            self._save_window_open()
+            return bool(self._pending_saves) or self._version != self._saved_version
+    
+    def flush(self):
+        """立即写出合并窗口内尚未保存的配置"""
+        with self._lock:
+            if self._save_handle is not None:
+                self._save_handle.cancel()
+                self._save_handle = None
+            self._flush_pending_saves()
     
     def _load_value(self, key: str) -> Any:
         """从配置源加载值"""
         # 按优先级从高到低查找
-        for source in reversed(self._sources):
-            try:
-                config = source.load()
-                if key in config:
-                    return config[key]
-                
-                # 支持嵌套键查找 (e.g., "database.host")
-                value = self._get_nested_value(config, key)
-                if value is not None:
-                    return value
-            except Exception as e:
-                logger.warning(f"Error loading from source {source.name}: {e}")
+        for config in reversed(self._load_sources()):
+            if key in config:
+                return config[key]
+            
+            # 支持嵌套键查找 (e.g., "database.host")
+            value = self._get_nested_value(config, key)
+            if value is not None:
+                return value
         
         return None
     
-    def _load_all_config(self) -> Dict[str, Any]:
-        """加载所有配置"""
-        merged_config = {}
+    def _load_sources(self) -> List[Dict[str, Any]]:
+        """加载各配置源（按优先级从低到高），结果缓存至下次失效"""
+        source_data = self._source_data
+        if source_data is None:
+            source_data = []
+            for source in self._sources:
+                try:
+                    source_data.append(source.load())
+                except Exception as e:
+                    logger.warning(f"Error loading from source {source.name}: {e}")
+                    source_data.append({})
+            self._source_data = source_data
+        return source_data
+    
+    async def preload(self):
+        """并发加载所有配置源并填充缓存
         
-        # 按优先级从低到高合并
-        for source in self._sources:
+        各配置源的文件读取和解析互不依赖，放到线程中并发执行，启动耗时取决于
+        最慢的配置源而不是所有配置源之和。
+        """
+        with self._lock:
+            sources = list(self._sources)
+            version = self._version
+        
+        async def load_one(source: IConfigSource) -> Dict[str, Any]:
             try:
-                config = source.load()
-                self._merge_config(merged_config, config)
+                if hasattr(source, 'load_async'):
+                    return await source.load_async() or {}
+                return await asyncio.to_thread(source.load)
             except Exception as e:
                 logger.warning(f"Error loading from source {source.name}: {e}")
+                return {}
+        
+        source_data = list(await asyncio.gather(*(load_one(source) for source in sources)))
+        
+        with self._lock:
+            # 加载期间配置源或配置发生变更时放弃结果，下次访问时按需重新加载
+            if self._version != version or self._sources != sources:
+                return
+            self._source_data = source_data
+            self._merged_config = None
+        
+        logger.debug(f"Preloaded {len(sources)} config sources")
+
+    def _load_all_config(self) -> Dict[str, Any]:
+        """加载所有配置"""
+        merged_config = self._merged_config
+        if merged_config is None:
+            merged_config = {}
+            # 按优先级从低到高合并
+            for config in self._load_sources():
+                self._merge_config(merged_config, config)
+            self._merged_config = merged_config
         
         return merged_config
     
+    def _invalidate_source_cache(self):
+        """使配置源缓存失效"""
+        self._source_data = None
+        self._merged_config = None
+        self._bump_version()
+    
+    def _bump_version(self):
+        """递增配置版本号，使配置段、键列表和解析快照失效（调用方需持有 self._lock）"""
+        self._version += 1
+        self._resolved = {}
+    
     def _get_nested_value(self, config: Dict[str, Any], key: str) -> Any:
         """获取嵌套配置值"""
-        keys = key.split('.')
         current = config
         
-        for k in keys:
+        for k in _split_key(key):
             if isinstance(current, dict) and k in current:
                 current = current[k]
             else:
@@ -334,28 +620,130 @@ class ConfigManager(IConfigManager):
     
     def _validate_value(self, key: str, value: Any) -> Any:
         """验证配置值"""
-        for pattern, validator in self._validators.items():
-            if pattern.match(key):
-                try:
-                    return validator.validate(key, value, self._config_cache)
-                except Exception as e:
-                    raise ConfigValidationError(f"Validation failed for {key}: {e}")
+        index = self._validator_index
+        validator = index.get(key, _MISSING)
+        if validator is _MISSING:
+            # 与逐个匹配时一致：第一个匹配的模式生效
+            validator = next(
+                (v for pattern, v in tuple(self._validators.items()) if pattern.match(key)),
+                None
+            )
+            index[key] = validator
+        
+        if validator is None:
+            return value
+        
+        try:
+            return validator.validate(key, value, self._config_cache)
+        except Exception as e:
+            raise ConfigValidationError(f"Validation failed for {key}: {e}")
+    
+    def _prepare_value(self, key: str, value: Any) -> Any:
+        """验证待写入的值并加密敏感配置"""
+        validated_value = self._validate_value(key, value)
+        
+        if self._encryption and self._is_sensitive(key) and isinstance(validated_value, str):
+            if not self._encryption.is_encrypted(validated_value):
+                validated_value = self._encryption.encrypt(validated_value)
         
-        return value
+        return validated_value
     
-    def _save_to_source(self, key: str, value: Any, priority: ConfigPriority):
-        """保存到配置源"""
-        # 查找可写的配置源
+    def _save_to_source(self, updates: Mapping[str, Any], priority: ConfigPriority) -> bool:
+        """保存到配置源，写入成功或已排入合并窗口时返回 True"""
         for source in self._sources:
             if source.is_writable() and source.priority == priority:
-                try:
-                    config = source.load()
-                    config[key] = value
-                    source.save(config)
-                    logger.debug(f"Saved {key} to source {source.name}")
-                    return
-                except Exception as e:
-                    logger.warning(f"Failed to save to source {source.name}: {e}")
+                # 先处理已失效的合并窗口，其写出可能重新加载配置源
+                window_open = self._save_window_open()
+                config = self._current_source_data(source)
+                if config is None:
+                    return False
+                config.update(updates)
+                
+                if window_open:
+                    # 合并窗口内的写入推迟到窗口结束时统一保存
+                    self._pending_saves.setdefault(id(source), (source, {}))[1].update(updates)
+                    return True
+                
+                if not self._write_source(source, config):
+                    return False
+                logger.debug(f"Saved {len(updates)} key(s) to source {source.name}")
+                self._open_save_window()
+                return True
+        return False
+    
+    def _current_source_data(self, source: IConfigSource) -> Optional[Dict[str, Any]]:
+        """获取配置源的已加载数据（调用方需持有 self._lock）
+
+        数据仍与配置源一致时直接返回，可就地修改，避免重新读取整个配置源；
+        配置源在加载后被外部修改（或无法判断）时先重新加载，以免保存时覆盖外部修改。
+        重新加载失败时返回 None。
+        """
+        source_data = self._load_sources()
+        index = next(i for i, s in enumerate(self._sources) if s is source)
+        is_modified = getattr(source, 'is_modified', None)
+        if is_modified is not None and not is_modified():
+            return source_data[index]
+        
+        try:
+            config = source.load()
+        except Exception as e:
+            logger.warning(f"Error loading from source {source.name}: {e}")
+            return None
+        source_data[index] = config
+        self._merged_config = None
+        # 外部修改使派生缓存失效，但内存与配置源之间并无未保存的差异
+        clean = self._version == self._saved_version
+        self._bump_version()
+        if clean:
+            self._saved_version = self._version
+        return config
+    
+    def _write_source(self, source: IConfigSource, config: Dict[str, Any]) -> bool:
+        """写出单个配置源"""
+        try:
+            return bool(source.save(config))
+        except Exception as e:
+            logger.warning(f"Failed to save to source {source.name}: {e}")
+            return False
+    
+    def _open_save_window(self):
+        """开启写入合并窗口；没有运行中的事件循环时每次写入都立即保存"""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._save_loop = loop
+        self._save_handle = loop.call_later(self.SAVE_DEBOUNCE_DELAY, self._close_save_window)
+    
+    def _save_window_open(self) -> bool:
+        """检查合并窗口是否仍会按时结束；事件循环已停止或关闭时先写出遗留的变更（调用方需持有 self._lock）"""
+        if self._save_handle is None:
+            return False
+        loop = self._save_loop
+        if loop is not None and not loop.is_closed() and loop.is_running():
+            return True
+        self._save_handle = None
+        self._flush_pending_saves()
+        return False
+    
+    def _close_save_window(self):
+        """合并窗口结束，写出窗口内的变更"""
+        with self._lock:
+            self._save_handle = None
+            self._flush_pending_saves()
+    
+    def _flush_pending_saves(self):
+        """写出待保存的配置源，失败的保留到下次 flush（调用方需持有 self._lock）"""
+        pending, self._pending_saves = self._pending_saves, {}
+        for source_id, (source, updates) in pending.items():
+            config = self._current_source_data(source)
+            if config is not None:
+                # 配置源在窗口内被外部修改时数据已重新加载，需要重新应用窗口内的变更
+                config.update(updates)
+                if self._write_source(source, config):
+                    logger.debug(f"Saved pending changes to source {source.name}")
+                    continue
+            self._pending_saves.setdefault(source_id, (source, updates))
     
     def _is_sensitive(self, key: str) -> bool:
         """检查配置是否敏感"""
@@ -368,23 +756,59 @@ class ConfigManager(IConfigManager):
         key_lower = key.lower()
         return any(pattern in key_lower for pattern in sensitive_patterns)
     
-    def _notify_watchers(self, change: ConfigChange):
-        """通知配置监听器"""
-        for pattern, watchers in self._watchers.items():
-            if pattern.match(change.key):
-                for watcher in watchers:
-                    try:
-                        watcher.on_config_changed(change)
-                    except Exception as e:
-                        logger.error(f"Error in config watcher: {e}")
+    def _notify_watchers(self, *changes: ConfigChange):
+        """通知配置监听器（调用方不得持有 self._lock）"""
+        pending = []
+        for change in changes:
+            for watcher in self._get_watchers(change.key):
+                try:
+                    result = watcher.on_config_changed(change)
+                    if inspect.isawaitable(result):
+                        pending.append(result)
+                except Exception as e:
+                    logger.error(f"Error in config watcher: {e}")
+        
+        if pending:
+            self._schedule_watchers(pending)
+    
+    def _get_watchers(self, key: str) -> Tuple[IConfigWatcher, ...]:
+        """获取匹配键的监听器（按键缓存，避免每次变更都逐个匹配正则）"""
+        cache = self._watcher_cache
+        watchers = cache.get(key)
+        if watchers is None:
+            watchers = tuple(
+                watcher
+                for pattern, pattern_watchers in tuple(self._watchers.items())
+                if pattern.match(key)
+                for watcher in tuple(pattern_watchers)
+            )
+            cache[key] = watchers
+        return watchers
+    
+    def _schedule_watchers(self, awaitables: List[Any]):
+        """调度一批异步监听器：有运行中的事件循环时作为一个任务执行，否则同步运行"""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            asyncio.run(self._run_watchers(awaitables))
+            return
+        
+        task = loop.create_task(self._run_watchers(awaitables))
+        self._watch_tasks.add(task)
+        task.add_done_callback(self._watch_tasks.discard)
+    
+    @staticmethod
+    async def _run_watchers(awaitables: List[Any]):
+        """并发执行异步监听器并记录异常，耗时取决于最慢的监听器"""
+        results = await asyncio.gather(*awaitables, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Error in config watcher: {result}")
     
     def _add_change_history(self, change: ConfigChange):
         """添加变更历史"""
         self._change_history.append(change)
-        
-        # 限制历史记录大小
-        if len(self._change_history) > self._max_history_size:
-            self._change_history = self._change_history[-self._max_history_size:]
+        self._history_by_section[_split_key(change.key)[0]].append(change)
     
     def _on_source_changed(self, source_config: Dict[str, Any]):
         """配置源变更回调"""
@@ -395,6 +819,50 @@ class ConfigManager(IConfigManager):
             logger.error(f"Error during config reload: {e}")
 
 
+class _FilePoller:
+    """所有文件配置源共用的轮询器：一个任务按间隔检查全部已注册的文件"""
+    
+    def __init__(self, interval: float = 1.0):
+        self.interval = interval
+        self._sources: Dict[int, "FileConfigSource"] = {}
+        self._task: Optional[asyncio.Task] = None
+    
+    def register(self, source: "FileConfigSource"):
+        """注册文件配置源，按需启动轮询任务"""
+        self._sources[id(source)] = source
+        if self._task is None or self._task.done():
+            loop = asyncio.get_event_loop()
+            self._task = loop.create_task(self._run())
+    
+    def unregister(self, source: "FileConfigSource"):
+        """取消注册；没有文件需要监听时轮询任务自行退出"""
+        self._sources.pop(id(source), None)
+    
+    async def _run(self):
+        """轮询任务"""
+        while self._sources:
+            try:
+                for source in tuple(self._sources.values()):
+                    try:
+                        source._poll()
+                    except Exception as e:
+                        logger.error(f"Error in file watcher: {e}")
+                
+                await asyncio.sleep(self.interval)  # 检查间隔
+            
+            except asyncio.CancelledError:
+                break
+
+
+_file_poller = _FilePoller()
+
+# JSON 缓存文件的格式版本，缓存内容或校验方式变化时递增，旧缓存自动失效
+_JSON_CACHE_VERSION = 1
+
+# 备份文件名中的时间戳（time.time_ns() 的十进制表示）
+_BACKUP_TIMESTAMP = re.compile(r"\d{19}")
+
+
 class FileConfigSource(IConfigSource):
     """文件配置源"""
     
@@ -403,14 +871,31 @@ class FileConfigSource(IConfigSource):
                  format: ConfigFormat,
                  priority: ConfigPriority = ConfigPriority.FILE,
                  writable: bool = True,
-                 watch: bool = True):
+                 watch: bool = True,
+                 backup_count: int = 0,
+                 backup_dir: Optional[Path] = None,
+                 json_cache: bool = False):
         self.file_path = file_path
         self.format = format
         self._priority = priority
         self._writable = writable
         self._watch = watch
+        # 保存前保留的历史版本数量（0 表示不备份），备份以硬链接方式创建
+        self._backup_count = backup_count
+        self._backup_dir = backup_dir or file_path.parent / "backups"
+        # YAML 文件旁的 JSON 缓存（<文件名>.cache.json），冷启动时跳过较慢的 YAML 解析
+        self._json_cache = json_cache and format == ConfigFormat.YAML
+        self._json_cache_path = file_path.with_suffix(f"{file_path.suffix}.cache.json")
         self._watch_callback: Optional[Callable] = None
-        self._watch_task: Optional[asyncio.Task] = None
+        # 轮询状态：上次看到的修改时间和内容指纹
+        self._last_mtime: Optional[float] = None
+        self._last_fingerprint: Optional[str] = None
+        # 解析结果缓存，文件 (mtime_ns, size) 不变时直接复用
+        self._parsed: Optional[tuple] = None
+        # 上次写入的 (文件签名, 内容)，内容与文件均未变化时跳过写入
+        self._last_saved: Optional[tuple] = None
+        # 上次 load/save 时的文件签名，此后签名变化说明文件被外部修改
+        self._synced_signature: Optional[tuple] = None
     
     @property
     def priority(self) -> ConfigPriority:
@@ -422,18 +907,41 @@ class FileConfigSource(IConfigSource):
     
     def load(self) -> Dict[str, Any]:
         """加载配置文件"""
-        if not self.file_path.exists():
+        try:
+            stat = self.file_path.stat()
+        except FileNotFoundError:
+            self._synced_signature = None
             return {}
         
         try:
+            signature = (stat.st_mtime_ns, stat.st_size)
+            # 调用方会就地修改返回的配置（如 _save_to_source），返回副本以免污染缓存
+            if self._parsed is not None and self._parsed[0] == signature:
+                self._synced_signature = signature
+                return _clone_tree(self._parsed[1])
+            
+            if self._json_cache:
+                data = self._read_json_cache(signature)
+                if data is not None:
+                    self._parsed = (signature, data)
+                    self._synced_signature = signature
+                    return _clone_tree(data)
+            
             content = self.file_path.read_text(encoding='utf-8')
             
             if self.format == ConfigFormat.YAML:
-                return yaml.safe_load(content) or {}
+                data = yaml.load(content, Loader=_YamlLoader) or {}
             elif self.format == ConfigFormat.JSON:
-                return json.loads(content) or {}
+                data = json.loads(content) or {}
             else:
                 raise ValueError(f"Unsupported format: {self.format}")
+            
+            if self._json_cache:
+                self._write_json_cache(signature, data)
+            
+            self._parsed = (signature, data)
+            self._synced_signature = signature
+            return _clone_tree(data)
         
         except Exception as e:
             logger.error(f"Failed to load config from {self.file_path}: {e}")
@@ -446,20 +954,37 @@ class FileConfigSource(IConfigSource):
         
         try:
             if self.format == ConfigFormat.YAML:
-                content = yaml.dump(config, default_flow_style=False, allow_unicode=True)
+                content = yaml.dump(config, Dumper=_YamlDumper, default_flow_style=False, allow_unicode=True)
             elif self.format == ConfigFormat.JSON:
                 content = json.dumps(config, indent=2, ensure_ascii=False)
             else:
                 raise ValueError(f"Unsupported format: {self.format}")
             
+            if self._last_saved is not None and self._last_saved[1] == content:
+                try:
+                    stat = self.file_path.stat()
+                    if self._last_saved[0] == (stat.st_mtime_ns, stat.st_size):
+                        return True
+                except FileNotFoundError:
+                    pass
+            
             # 确保目录存在
-            self.file_path.parent.mkdir(parents=True, exist_ok=True)
+            if self._last_saved is None:
+                self.file_path.parent.mkdir(parents=True, exist_ok=True)
             
             # 原子写入
             temp_file = self.file_path.with_suffix(f"{self.file_path.suffix}.tmp")
             temp_file.write_text(content, encoding='utf-8')
+            if self._backup_count > 0:
+                self._backup_current()
             temp_file.replace(self.file_path)
             
+            stat = self.file_path.stat()
+            self._last_saved = ((stat.st_mtime_ns, stat.st_size), content)
+            self._synced_signature = self._last_saved[0]
+            if self._json_cache:
+                self._write_json_cache(self._last_saved[0], config)
+            
             logger.debug(f"Saved config to {self.file_path}")
             return True
         
@@ -467,6 +992,75 @@ class FileConfigSource(IConfigSource):
             logger.error(f"Failed to save config to {self.file_path}: {e}")
             return False
     
+    def _read_json_cache(self, signature: tuple) -> Optional[Dict[str, Any]]:
+        """读取与 YAML 文件签名一致的 JSON 缓存，不存在或已过期时返回 None"""
+        try:
+            raw = self._json_cache_path.read_bytes()
+        except FileNotFoundError:
+            return None
+        
+        try:
+            cache = orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
+        except ValueError:
+            return None
+        
+        if (isinstance(cache, dict)
+                and cache.get("version") == _JSON_CACHE_VERSION
+                and (cache.get("source_mtime_ns"), cache.get("source_size")) == signature):
+            return cache.get("data")
+        return None
+    
+    def _write_json_cache(self, signature: tuple, data: Dict[str, Any]):
+        """写入 JSON 缓存；无法无损表示为 JSON 的数据（非字符串键、日期等）不缓存"""
+        cache = {
+            "version": _JSON_CACHE_VERSION,
+            "source_mtime_ns": signature[0],
+            "source_size": signature[1],
+            "data": data,
+        }
+        try:
+            raw = orjson.dumps(cache) if HAS_ORJSON else json.dumps(cache).encode('utf-8')
+            if json.loads(raw)["data"] != data:
+                self._json_cache_path.unlink(missing_ok=True)
+                return
+            
+            temp_file = self._json_cache_path.with_suffix(".tmp")
+            temp_file.write_bytes(raw)
+            temp_file.replace(self._json_cache_path)
+        except (TypeError, ValueError, OSError) as e:
+            logger.debug(f"Skipped JSON cache for {self.file_path}: {e}")
+    
+    def _backup_current(self):
+        """备份当前配置文件并轮换旧备份
+
+        新内容通过 replace 写入新的 inode，旧文件的硬链接即为完整备份，
+        无需复制数据；配置文件本身始终存在。不支持硬链接时回退为复制。
+        """
+        if not self.file_path.exists():
+            return
+        
+        try:
+            self._backup_dir.mkdir(parents=True, exist_ok=True)
+            stem = self.file_path.stem
+            backup_path = self._backup_dir / f"{stem}_{time.time_ns()}{self.file_path.suffix}"
+            try:
+                os.link(self.file_path, backup_path)
+            except OSError:
+                shutil.copy2(self.file_path, backup_path)
+            
+            # 备份目录由同目录下的配置文件共用，glob 会同时匹配 server_local 等同前缀文件的备份，
+            # 只保留 “<stem>_<19 位时间戳><suffix>” 的名称；时间戳定长递增，按名称排序即按时间排序
+            prefix_len = len(stem) + 1
+            suffix_len = len(self.file_path.suffix)
+            backups = sorted(
+                path for path in self._backup_dir.glob(f"{stem}_*{self.file_path.suffix}")
+                if _BACKUP_TIMESTAMP.fullmatch(path.name[prefix_len:len(path.name) - suffix_len])
+            )
+            for old_backup in backups[:-self._backup_count]:
+                old_backup.unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning(f"Failed to back up config {self.file_path}: {e}")
+    
     def watch(self, callback: Callable[[Dict[str, Any]], None]) -> bool:
         """监听文件变化"""
         if not self._watch:
@@ -474,39 +1068,51 @@ class FileConfigSource(IConfigSource):
         
         self._watch_callback = callback
         
-        # 启动文件监听任务
-        if self._watch_task is None or self._watch_task.done():
-            loop = asyncio.get_event_loop()
-            self._watch_task = loop.create_task(self._watch_file())
+        # 加入共用的轮询任务，而不是每个文件各开一个任务
+        _file_poller.register(self)
         
         return True
     
+    def unwatch(self):
+        """停止监听文件变化"""
+        _file_poller.unregister(self)
+        self._watch_callback = None
+    
     def is_writable(self) -> bool:
         return self._writable
     
-    async def _watch_file(self):
-        """文件监听任务"""
-        import time
-        
-        last_mtime = 0
+    def is_modified(self) -> bool:
+        """检查文件在上次 load/save 之后是否被外部修改"""
+        try:
+            stat = self.file_path.stat()
+        except FileNotFoundError:
+            return self._synced_signature is not None
+        return (stat.st_mtime_ns, stat.st_size) != self._synced_signature
+    
+    def _poll(self):
+        """检查一次文件变化（由共用轮询器调用）"""
+        try:
+            stat = self.file_path.stat()
+        except FileNotFoundError:
+            return
         
-        while True:
-            try:
-                if self.file_path.exists():
-                    current_mtime = self.file_path.stat().st_mtime
-                    if current_mtime != last_mtime:
-                        last_mtime = current_mtime
-                        if self._watch_callback:
-                            config = self.load()
-                            self._watch_callback(config)
-                
-                await asyncio.sleep(1)  # 检查间隔
+        current_mtime = stat.st_mtime
+        if current_mtime != self._last_mtime:
+            self._last_mtime = current_mtime
             
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                logger.error(f"Error in file watcher: {e}")
-                await asyncio.sleep(5)
+            # 自身 save() 写入的文件（签名与写入后记录的一致）无需重载，内存中已是最新配置；
+            # 清空指纹，之后的外部修改无论内容如何都会触发重载
+            if self._last_saved is not None and self._last_saved[0] == (stat.st_mtime_ns, stat.st_size):
+                self._last_fingerprint = None
+                return
+            
+            if self._watch_callback:
+                config = self.load()
+                # 仅格式/注释变化或重复写入相同内容时不触发重载
+                fingerprint = _fingerprint(config)
+                if fingerprint != self._last_fingerprint:
+                    self._last_fingerprint = fingerprint
+                    self._watch_callback(config)
 
 
 class EnvironmentConfigSource(IConfigSource):
@@ -11,22 +11,46 @@
 
 import os
 import json
+import hashlib
 import yaml
 import asyncio
 import logging
-from typing import Any, Dict, Optional, Callable, List, Set
+from typing import Any, Dict, Optional, Callable, List, Set, Tuple
 from pathlib import Path
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime
 import fnmatch
 import threading
 from concurrent.futures import ThreadPoolExecutor
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # 未编译 libyaml 时回退到纯 Python 实现
+    from yaml import SafeLoader as _YamlLoader
+
 from .interfaces import IConfigSource, ConfigPriority, ConfigChange
 
 logger = logging.getLogger(__name__)
 
+# 文件解析结果的 LRU 缓存：路径 -> (mtime_ns, size, 内容摘要, 数据)
+_PARSE_CACHE: "OrderedDict[str, Tuple[int, int, bytes, Dict[str, Any]]]" = OrderedDict()
+_MAX_PARSE_CACHE = 100
+
+
+def _clone_tree(value: Any) -> Any:
+    """复制解析得到的配置树
+
+    YAML/JSON 解析结果只包含 dict、list 和不可变的标量，只需复制容器、
+    共享叶子值，比通用的 deepcopy（memo 字典与逐对象分派）快得多。
+    """
+    if isinstance(value, dict):
+        return {key: _clone_tree(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_clone_tree(item) for item in value]
+    return value
+
 
 @dataclass
 class WatcherConfig:
@@ -46,7 +70,8 @@ class BaseConfigSource(IConfigSource):
         self._name = name
         self._data: Dict[str, Any] = {}
         self._last_modified: Optional[datetime] = None
-        self._change_callbacks: List[Callable[[ConfigChange], None]] = []
+        # 以回调本身为键的有序字典：O(1) 增删，且绑定方法按相等性去重
+        self._change_callbacks: Dict[Callable[[ConfigChange], None], None] = {}
         self._is_loaded = False
         
     @property
@@ -62,16 +87,16 @@ class BaseConfigSource(IConfigSource):
         
     def add_change_callback(self, callback: Callable[[ConfigChange], None]):
         """添加变更回调"""
-        self._change_callbacks.append(callback)
+        self._change_callbacks[callback] = None
         
     def remove_change_callback(self, callback: Callable[[ConfigChange], None]):
         """移除变更回调"""
-        if callback in self._change_callbacks:
-            self._change_callbacks.remove(callback)
+        self._change_callbacks.pop(callback, None)
             
     def _notify_change(self, change: ConfigChange):
         """通知配置变更"""
-        for callback in self._change_callbacks:
+        # 先取快照，回调可在执行中安全地注销自身
+        for callback in tuple(self._change_callbacks):
             try:
                 callback(change)
             except Exception as e:
@@ -167,20 +192,42 @@ class FileConfigSource(BaseConfigSource):
     def load(self) -> Dict[str, Any]:
         """加载配置文件"""
         try:
-            if not self.file_path.exists():
+            try:
+                stat = self.file_path.stat()
+            except FileNotFoundError:
                 logger.warning(f"Config file not found: {self.file_path}")
                 return {}
+            
+            # 文件未变化时直接使用缓存的解析结果
+            cache_key = str(self.file_path)
+            cached = _PARSE_CACHE.get(cache_key)
+            if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+                _PARSE_CACHE.move_to_end(cache_key)
+                data = _clone_tree(cached[3])
+            else:
+                raw = self.file_path.read_bytes()
+                digest = hashlib.blake2b(raw, digest_size=16).digest()
                 
-            with open(self.file_path, 'r', encoding=self.encoding) as f:
-                if self._format == 'yaml':
-                    data = yaml.safe_load(f) or {}
-                elif self._format == 'json':
-                    data = json.load(f)
+                if cached is not None and cached[2] == digest:
+                    # 仅修改时间变化（touch、编辑器保存未改内容），复用解析结果
+                    data = cached[3]
                 else:
-                    logger.warning(f"Unsupported format: {self._format}")
-                    return {}
+                    text = raw.decode(self.encoding)
+                    if self._format == 'yaml':
+                        data = yaml.load(text, Loader=_YamlLoader) or {}
+                    elif self._format == 'json':
+                        data = json.loads(text)
+                    else:
+                        logger.warning(f"Unsupported format: {self._format}")
+                        return {}
+                
+                _PARSE_CACHE[cache_key] = (stat.st_mtime_ns, stat.st_size, digest, data)
+                data = _clone_tree(data)
+                _PARSE_CACHE.move_to_end(cache_key)
+                while len(_PARSE_CACHE) > _MAX_PARSE_CACHE:
+                    _PARSE_CACHE.popitem(last=False)
                     
-            self._last_modified = datetime.fromtimestamp(self.file_path.stat().st_mtime)
+            self._last_modified = datetime.fromtimestamp(stat.st_mtime)
             self._is_loaded = True
             
             logger.debug(f"Loaded config from {self.file_path}: {len(data)} keys")
@@ -407,11 +454,11 @@ class RemoteConfigSource(BaseConfigSource):
                                 data = await response.json()
                             elif 'application/yaml' in content_type or 'text/yaml' in content_type:
                                 text = await response.text()
-                                data = yaml.safe_load(text)
+                                data = yaml.load(text, Loader=_YamlLoader)
                             else:
                                 text = await response.text()
                                 try:
-                                    data = yaml.safe_load(text)
+                                    data = yaml.load(text, Loader=_YamlLoader)
                                 except:
                                     data = json.loads(text)
                                     
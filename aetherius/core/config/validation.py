@@ -6,8 +6,9 @@
 
 import re
 import json
+import functools
 import ipaddress
-from typing import Any, Dict, List, Optional, Union, Callable, Type
+from typing import Any, Dict, List, Optional, Pattern, Union, Callable, Type
 from pathlib import Path
 from dataclasses import dataclass
 from enum import Enum
@@ -18,6 +19,11 @@ from .interfaces import IConfigValidator, IConfigTemplate, ConfigValidationError
 logger = logging.getLogger(__name__)
 
 
+def _passthrough(value: Any, context: Optional[Dict[str, Any]]) -> Any:
+    """无对应处理函数的规则不做验证"""
+    return value
+
+
 class ValidationType(Enum):
     """验证类型枚举"""
     TYPE = "type"
@@ -54,25 +60,83 @@ class SchemaValidator(IConfigValidator):
             'list': list,
             'dict': dict,
         }
+        self._rule_handlers: Dict[ValidationType, Callable[[Any, Dict[str, Any]], Any]] = {
+            ValidationType.RANGE: self._validate_range,
+            ValidationType.REGEX: self._validate_regex,
+            ValidationType.ENUM: self._validate_enum,
+            ValidationType.LENGTH: self._validate_length,
+            ValidationType.IP_ADDRESS: self._validate_ip_address,
+            ValidationType.URL: self._validate_url,
+            ValidationType.FILE_PATH: self._validate_file_path,
+            ValidationType.EMAIL: self._validate_email,
+        }
+        # 按键缓存编译好的验证步骤，schema 查找和规则解析只做一次
+        # （修改 self.schema 后需调用 clear_cache）
+        self._compiled: Dict[str, Optional[List[Callable[[Any, Optional[Dict[str, Any]]], Any]]]] = {}
     
     def validate(self, key: str, value: Any, context: Optional[Dict[str, Any]] = None) -> Any:
         """验证配置值"""
+        steps = self._compiled.get(key)
+        if steps is None:
+            if key in self._compiled:
+                return value  # 无schema则不验证
+            steps = self._compiled[key] = self._compile(key)
+            if steps is None:
+                return value
+        
+        for step in steps:
+            value = step(value, context)
+        
+        return value
+    
+    def clear_cache(self):
+        """清除编译缓存（schema 变更后调用）"""
+        self._compiled.clear()
+    
+    def _compile(self, key: str) -> Optional[List[Callable[[Any, Optional[Dict[str, Any]]], Any]]]:
+        """把键对应的 schema 编译为依次执行的验证步骤"""
         key_schema = self._get_key_schema(key)
         if not key_schema:
-            return value  # 无schema则不验证
+            return None
+        
+        steps = []
         
         # 类型验证和转换
         if 'type' in key_schema:
             expected_type = key_schema['type']
-            value = self._convert_type(value, expected_type)
+            steps.append(lambda value, context: self._convert_type(value, expected_type))
         
-        # 应用验证规则
+        # 验证规则
         if 'rules' in key_schema:
             for rule_def in key_schema['rules']:
-                rule = ValidationRule(**rule_def)
-                value = self._apply_rule(key, value, rule, context)
+                steps.append(self._compile_rule(key, ValidationRule(**rule_def)))
         
-        return value
+        return steps
+    
+    def _compile_rule(self, key: str, rule: ValidationRule) -> Callable[[Any, Optional[Dict[str, Any]]], Any]:
+        """把单条验证规则编译为闭包，规则分派和参数提取在编译时完成"""
+        params = rule.parameters
+        pass_context = rule.type == ValidationType.CUSTOM
+        if pass_context:
+            check = functools.partial(self._validate_custom, params=params)
+        else:
+            check = self._bind_rule(rule)
+            if check is None:
+                handler = self._rule_handlers.get(rule.type)
+                if handler is None:
+                    return _passthrough
+                check = functools.partial(handler, params=params)
+        
+        def apply(value: Any, context: Optional[Dict[str, Any]]) -> Any:
+            if value is None and rule.optional:
+                return value
+            try:
+                return check(value, context=context) if pass_context else check(value)
+            except Exception as e:
+                message = rule.message or str(e)
+                raise ConfigValidationError(f"Validation failed for {key}: {message}")
+        
+        return apply
     
     def get_schema(self) -> Dict[str, Any]:
         """获取配置模式"""
@@ -121,42 +185,36 @@ class SchemaValidator(IConfigValidator):
             return bool(value)
         raise ValueError(f"Cannot convert {value} to bool")
     
+    def _bind_rule(self, rule: ValidationRule) -> Optional[Callable[[Any], Any]]:
+        """把常用规则的参数预先取出（正则预编译）并绑定到检查函数，调用时不再查字典
+
+        无法预先绑定的规则返回 None，由 _rule_handlers 中按参数字典处理的函数执行。
+        """
+        params = rule.parameters
+        if rule.type == ValidationType.RANGE:
+            return functools.partial(self._check_range, min_val=params.get('min'), max_val=params.get('max'))
+        if rule.type == ValidationType.REGEX and params.get('pattern'):
+            try:
+                regex = re.compile(params['pattern'])
+            except re.error:
+                return None  # 无效的正则由 _validate_regex 在验证时报告
+            return functools.partial(self._check_regex, regex=regex)
+        if rule.type == ValidationType.ENUM:
+            return functools.partial(self._check_enum, allowed_values=params.get('values', []))
+        if rule.type == ValidationType.LENGTH:
+            return functools.partial(self._check_length, min_len=params.get('min'), max_len=params.get('max'))
+        return None
+    
     def _apply_rule(self, key: str, value: Any, rule: ValidationRule, context: Optional[Dict[str, Any]]) -> Any:
         """应用验证规则"""
-        if value is None and rule.optional:
-            return value
-        
-        try:
-            if rule.type == ValidationType.RANGE:
-                return self._validate_range(value, rule.parameters)
-            elif rule.type == ValidationType.REGEX:
-                return self._validate_regex(value, rule.parameters)
-            elif rule.type == ValidationType.ENUM:
-                return self._validate_enum(value, rule.parameters)
-            elif rule.type == ValidationType.LENGTH:
-                return self._validate_length(value, rule.parameters)
-            elif rule.type == ValidationType.IP_ADDRESS:
-                return self._validate_ip_address(value, rule.parameters)
-            elif rule.type == ValidationType.URL:
-                return self._validate_url(value, rule.parameters)
-            elif rule.type == ValidationType.FILE_PATH:
-                return self._validate_file_path(value, rule.parameters)
-            elif rule.type == ValidationType.EMAIL:
-                return self._validate_email(value, rule.parameters)
-            elif rule.type == ValidationType.CUSTOM:
-                return self._validate_custom(value, rule.parameters, context)
-            else:
-                return value
-        
-        except Exception as e:
-            message = rule.message or str(e)
-            raise ConfigValidationError(f"Validation failed for {key}: {message}")
+        return self._compile_rule(key, rule)(value, context)
     
     def _validate_range(self, value: Any, params: Dict[str, Any]) -> Any:
         """范围验证"""
-        min_val = params.get('min')
-        max_val = params.get('max')
-        
+        return self._check_range(value, params.get('min'), params.get('max'))
+    
+    def _check_range(self, value: Any, min_val: Any = None, max_val: Any = None) -> Any:
+        """范围检查（参数已取出）"""
         if min_val is not None and value < min_val:
             raise ValueError(f"Value {value} is less than minimum {min_val}")
         
@@ -171,17 +229,24 @@ class SchemaValidator(IConfigValidator):
         if not pattern:
             raise ValueError("Regex pattern is required")
         
+        return self._check_regex(value, re.compile(pattern))
+    
+    def _check_regex(self, value: Any, regex: Pattern[str]) -> Any:
+        """正则检查（正则已编译）"""
         if not isinstance(value, str):
             value = str(value)
         
-        if not re.match(pattern, value):
-            raise ValueError(f"Value '{value}' does not match pattern '{pattern}'")
+        if not regex.match(value):
+            raise ValueError(f"Value '{value}' does not match pattern '{regex.pattern}'")
         
         return value
     
     def _validate_enum(self, value: Any, params: Dict[str, Any]) -> Any:
         """枚举验证"""
-        allowed_values = params.get('values', [])
+        return self._check_enum(value, params.get('values', []))
+    
+    def _check_enum(self, value: Any, allowed_values: Any) -> Any:
+        """枚举检查（参数已取出）"""
         if value not in allowed_values:
             raise ValueError(f"Value '{value}' not in allowed values: {allowed_values}")
         
@@ -189,9 +254,10 @@ class SchemaValidator(IConfigValidator):
     
     def _validate_length(self, value: Any, params: Dict[str, Any]) -> Any:
         """长度验证"""
-        min_len = params.get('min')
-        max_len = params.get('max')
-        
+        return self._check_length(value, params.get('min'), params.get('max'))
+    
+    def _check_length(self, value: Any, min_len: Optional[int] = None, max_len: Optional[int] = None) -> Any:
+        """长度检查（参数已取出）"""
         if hasattr(value, '__len__'):
             length = len(value)
             
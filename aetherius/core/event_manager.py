@@ -1,10 +1,17 @@
 """Event management system for Aetherius."""
 
 import asyncio
+import bisect
+import functools
 import logging
+import os
+import weakref
+from array import array
 from collections import defaultdict, deque
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from datetime import datetime
+from itertools import groupby
+from operator import attrgetter
 from typing import Any, Optional, TypeVar
 
 from .events_base import BaseEvent, EventPriority
@@ -14,9 +21,62 @@ logger = logging.getLogger(__name__)
 T = TypeVar("T", bound=BaseEvent)
 
 
+def _priority_key(listener: "EventListener") -> int:
+    """Insertion key keeping listener lists highest priority first."""
+    return -listener.priority.value
+
+
+# C-level sort key for chain building (used with reverse=True)
+_priority_value = attrgetter("priority.value")
+
+
+@functools.cache
+def _dispatch_bases(event_type: type[BaseEvent]) -> tuple[type[BaseEvent], ...]:
+    """
+    Event types whose listeners receive events of ``event_type``.
+
+    The event type itself followed by its BaseEvent ancestors (excluding
+    BaseEvent), in MRO order. Class hierarchies are static, so the result is
+    computed once per class and survives listener-chain invalidation.
+    """
+    if event_type is BaseEvent:
+        # Only the global tier applies
+        return ()
+    return (event_type,) + tuple(
+        base_type
+        for base_type in event_type.__mro__[1:]
+        if issubclass(base_type, BaseEvent) and base_type is not BaseEvent
+    )
+
+
+# Coroutine-function checks memoised per code object. The result is not
+# stored on the function itself: functools.wraps copies a function's __dict__
+# into its wrappers, which would hand them the wrapped function's answer.
+_async_by_code: "weakref.WeakKeyDictionary[Any, bool]" = weakref.WeakKeyDictionary()
+
+
+def _is_async_callback(callback: Callable[..., Any]) -> bool:
+    """
+    Check whether a callback is a coroutine function.
+
+    The result is memoised per code object so that re-registering the same
+    function (e.g. on plugin reload) skips the inspection.
+    """
+    # Bound methods share the code object of their underlying function
+    code = getattr(getattr(callback, "__func__", callback), "__code__", None)
+    if code is None:
+        return asyncio.iscoroutinefunction(callback)  # builtins, partials, ...
+    is_async = _async_by_code.get(code)
+    if is_async is None:
+        is_async = _async_by_code[code] = asyncio.iscoroutinefunction(callback)
+    return is_async
+
+
 class EventListener:
     """Represents an event listener with metadata."""
 
+    __slots__ = ("callback", "event_type", "priority", "ignore_cancelled", "is_async")
+
     def __init__(
         self,
         callback: Callable[[BaseEvent], Any],
@@ -28,11 +88,11 @@ class EventListener:
         self.event_type = event_type
         self.priority = priority
         self.ignore_cancelled = ignore_cancelled
-        self.is_async = asyncio.iscoroutinefunction(callback)
+        self.is_async = _is_async_callback(callback)
 
     async def call(self, event: BaseEvent) -> Any:
         """Call the listener with the given event."""
-        if event.is_cancelled() and not self.ignore_cancelled:
+        if event.cancelled and not self.ignore_cancelled:
             return None
 
         try:
@@ -62,8 +122,19 @@ class EventManager:
         # 原有初始化
         self._listeners: dict[type[BaseEvent], list[EventListener]] = defaultdict(list)
         self._global_listeners: list[EventListener] = []
-        self._event_stats: dict[str, int] = defaultdict(int)
+        # id(listener) -> the list that holds it, so unregistering does not
+        # scan every event type
+        self._listener_owners: dict[int, list[EventListener]] = {}
+        # Fire counts: one uint64 slot per event type, aggregated by name on read
+        self._stat_slots: dict[type[BaseEvent], int] = {}
+        self._stat_names: list[str] = []
+        self._event_counts = array("Q")
         self._running = True
+        # Priority-sorted listener chain per concrete event type, rebuilt lazily
+        # after any (un)registration
+        self._dispatch_cache: dict[type[BaseEvent], tuple[EventListener, ...]] = {}
+        # Whether every listener in the cached chain is synchronous
+        self._sync_chains: dict[type[BaseEvent], bool] = {}
 
         # Web组件扩展
         self._event_history: deque = deque(maxlen=1000)  # 事件历史记录
@@ -96,22 +167,25 @@ class EventManager:
         """
         listener = EventListener(callback, event_type, priority, ignore_cancelled)
 
-        # Insert listener in priority order (highest first)
-        listeners = self._listeners[event_type]
-        inserted = False
-
-        for i, existing_listener in enumerate(listeners):
-            if listener.priority.value > existing_listener.priority.value:
-                listeners.insert(i, listener)
-                inserted = True
-                break
-
-        if not inserted:
-            listeners.append(listener)
-
-        logger.debug(
-            f"Registered event listener for {event_type.__name__} with priority {priority.name}"
-        )
+        # BaseEvent listeners receive every event: they belong to the global
+        # tier, which _build_chain appends once (BaseEvent is never in
+        # _dispatch_bases, so a _listeners[BaseEvent] entry would never fire)
+        if event_type is BaseEvent:
+            listeners = self._global_listeners
+        else:
+            listeners = self._listeners[event_type]
+
+        # Insert listener in priority order (highest first, FIFO among equals)
+        bisect.insort(listeners, listener, key=_priority_key)
+        self._listener_owners[id(listener)] = listeners
+        self._invalidate_dispatch_cache()
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Registered event listener for %s with priority %s",
+                event_type.__name__,
+                priority.name,
+            )
         return listener
 
     def unregister_listener(self, listener: EventListener) -> bool:
@@ -124,18 +198,20 @@ class EventManager:
         Returns:
             bool: True if the listener was found and removed
         """
-        for event_type, listeners in self._listeners.items():
-            if listener in listeners:
-                listeners.remove(listener)
-                logger.debug(f"Unregistered event listener for {event_type.__name__}")
-                return True
+        listeners = self._listener_owners.pop(id(listener), None)
+        if listeners is None:
+            return False
 
-        if listener in self._global_listeners:
-            self._global_listeners.remove(listener)
-            logger.debug("Unregistered global event listener")
-            return True
+        listeners.remove(listener)
+        self._invalidate_dispatch_cache()
 
-        return False
+        if listeners is self._global_listeners:
+            logger.debug("Unregistered global event listener")
+        elif logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Unregistered event listener for %s", listener.event_type.__name__
+            )
+        return True
 
     def register_global_listener(
         self,
@@ -157,19 +233,75 @@ class EventManager:
         listener = EventListener(callback, BaseEvent, priority, ignore_cancelled)
 
         # Insert in priority order
-        inserted = False
-        for i, existing_listener in enumerate(self._global_listeners):
-            if listener.priority.value > existing_listener.priority.value:
-                self._global_listeners.insert(i, listener)
-                inserted = True
-                break
-
-        if not inserted:
-            self._global_listeners.append(listener)
+        bisect.insort(self._global_listeners, listener, key=_priority_key)
+        self._listener_owners[id(listener)] = self._global_listeners
+        self._invalidate_dispatch_cache()
 
-        logger.debug(f"Registered global event listener with priority {priority.name}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Registered global event listener with priority %s", priority.name
+            )
         return listener
 
+    def register_decorated(self, callbacks: Iterable[Any]) -> list[EventListener]:
+        """
+        Register every callable tagged by @on_event or @on_any_event.
+
+        Untagged objects are skipped. The dispatch cache is invalidated once
+        for the whole batch.
+
+        Args:
+            callbacks: Objects to scan, typically module or local namespace values
+
+        Returns:
+            List[EventListener]: The created listener objects
+        """
+        registered: list[EventListener] = []
+        for callback in callbacks:
+            if getattr(callback, "_event_listener", False) is True:
+                listener = EventListener(
+                    callback,
+                    callback._event_type,
+                    callback._event_priority,
+                    callback._ignore_cancelled,
+                )
+                if listener.event_type is BaseEvent:
+                    listeners = self._global_listeners
+                else:
+                    listeners = self._listeners[listener.event_type]
+            elif getattr(callback, "_global_event_listener", False) is True:
+                listener = EventListener(
+                    callback,
+                    BaseEvent,
+                    callback._event_priority,
+                    callback._ignore_cancelled,
+                )
+                listeners = self._global_listeners
+            else:
+                continue
+
+            bisect.insort(listeners, listener, key=_priority_key)
+            self._listener_owners[id(listener)] = listeners
+            registered.append(listener)
+
+        if registered:
+            self._invalidate_dispatch_cache()
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Registered %d decorated event listeners", len(registered))
+        return registered
+
+    def register_module(self, module: Any) -> list[EventListener]:
+        """
+        Register the decorated listeners defined at the top level of a module.
+
+        Args:
+            module: The module (e.g. a plugin entry module) to scan
+
+        Returns:
+            List[EventListener]: The created listener objects
+        """
+        return self.register_decorated(list(vars(module).values()))
+
     async def fire_event(self, event: BaseEvent) -> BaseEvent:
         """
         Fire an event to all registered listeners.
@@ -184,46 +316,241 @@ class EventManager:
             return event
 
         event_type = type(event)
-        event_name = event_type.__name__
 
-        logger.debug(f"Firing event: {event_name}")
-        self._event_stats[event_name] += 1
+        slot = self._stat_slots.get(event_type)
+        if slot is None:
+            slot = self._add_stat_slot(event_type)
+        self._event_counts[slot] += 1
 
-        # Collect all applicable listeners
-        applicable_listeners: list[EventListener] = []
+        chain = self._dispatch_cache.get(event_type)
+        if chain is None:
+            chain = self._build_chain(event_type)
+        if not chain:
+            # Nothing subscribed to this event type
+            return event
+
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("Firing event: %s", event_type.__name__)
+
+        if self._sync_chains[event_type]:
+            # No awaits needed: run the chain with direct calls
+            self._dispatch_sync(event, chain)
+            return event
+
+        # Call all listeners (inlined EventListener.call to avoid an extra
+        # coroutine per listener). The ``cancelled`` field is read directly
+        # rather than via is_cancelled() to save a call per listener; it is
+        # re-read after each listener since any of them may cancel.
+        for listener in chain:
+            if not (event.cancelled and not listener.ignore_cancelled):
+                callback = listener.callback
+                try:
+                    if listener.is_async:
+                        await callback(event)
+                        # shutdown() can only run from another task while
+                        # this one is suspended, so re-check after awaits only
+                        if not self._running:
+                            break
+                    else:
+                        callback(event)
+                except Exception as e:
+                    logger.error(
+                        f"Error in event listener {callback.__name__}: {e}",
+                        exc_info=True,
+                    )
 
-        # Add specific event type listeners
-        applicable_listeners.extend(self._listeners.get(event_type, []))
+            # If event was cancelled, stop processing lower priority listeners
+            # unless they specifically ignore cancellation
+            if event.cancelled and not listener.ignore_cancelled:
+                if debug:
+                    logger.debug(
+                        "Event %s was cancelled, stopping propagation",
+                        event_type.__name__,
+                    )
+                break
+
+        return event
 
-        # Add listeners for parent event types
-        for base_type in event_type.__mro__[1:]:  # Skip the event type itself
-            if issubclass(base_type, BaseEvent) and base_type != BaseEvent:
-                applicable_listeners.extend(self._listeners.get(base_type, []))
+    def _build_chain(self, event_type: type[BaseEvent]) -> tuple[EventListener, ...]:
+        """Collect and priority-sort the listeners applicable to an event type."""
+        applicable_listeners: list[EventListener] = []
 
-        # Add global listeners
+        # Listeners for the event type and its parent event types (from the
+        # precomputed bases, no per-dispatch MRO walk), then the global tier
+        listeners = self._listeners
+        for base_type in _dispatch_bases(event_type):
+            applicable_listeners.extend(listeners.get(base_type, ()))
         applicable_listeners.extend(self._global_listeners)
 
-        # Sort by priority (highest first)
-        applicable_listeners.sort(key=lambda l: l.priority.value, reverse=True)
+        # Freeze in priority order (highest first); the tuple is shared by
+        # every dispatch until the registrations change
+        applicable_listeners.sort(key=_priority_value, reverse=True)
+        chain = tuple(applicable_listeners)
+        self._dispatch_cache[event_type] = chain
+        self._sync_chains[event_type] = not any(l.is_async for l in chain)
+        return chain
 
-        # Call all listeners
-        for listener in applicable_listeners:
-            if not self._running:
-                break
+    def _invalidate_dispatch_cache(self) -> None:
+        """Drop cached listener chains after the registrations changed."""
+        self._dispatch_cache.clear()
+        self._sync_chains.clear()
 
-            try:
-                await listener.call(event)
-            except Exception as e:
-                logger.error(f"Error calling event listener: {e}", exc_info=True)
+    def has_listeners(self, event_type: type[BaseEvent]) -> bool:
+        """
+        Check whether firing an event type would reach any listener.
 
-            # If event was cancelled, stop processing lower priority listeners
-            # unless they specifically ignore cancellation
-            if event.is_cancelled() and not listener.ignore_cancelled:
-                logger.debug(f"Event {event_name} was cancelled, stopping propagation")
-                break
+        Lets producers skip building events nobody listens to.
 
+        Args:
+            event_type: The event type to check
+
+        Returns:
+            bool: True if at least one listener applies
+        """
+        chain = self._dispatch_cache.get(event_type)
+        if chain is None:
+            chain = self._build_chain(event_type)
+        return bool(chain)
+
+    def can_fire_sync(self, event_type: type[BaseEvent]) -> bool:
+        """
+        Check whether events of a type can be fired with fire_event_sync.
+
+        Args:
+            event_type: The event type to check
+
+        Returns:
+            bool: True if no applicable listener is a coroutine function
+        """
+        all_sync = self._sync_chains.get(event_type)
+        if all_sync is None:
+            self._build_chain(event_type)
+            all_sync = self._sync_chains[event_type]
+        return all_sync
+
+    def fire_event_sync(self, event: BaseEvent) -> BaseEvent:
+        """
+        Fire an event synchronously, without creating a coroutine.
+
+        Only valid when every applicable listener is synchronous (see
+        can_fire_sync); otherwise use fire_event.
+
+        Args:
+            event: The event to fire
+
+        Returns:
+            BaseEvent: The event object (potentially modified by listeners)
+
+        Raises:
+            RuntimeError: If an applicable listener is asynchronous
+        """
+        if not self._running:
+            return event
+
+        event_type = type(event)
+        if not self.can_fire_sync(event_type):
+            raise RuntimeError(
+                f"{event_type.__name__} has async listeners, use fire_event instead"
+            )
+
+        slot = self._stat_slots.get(event_type)
+        if slot is None:
+            slot = self._add_stat_slot(event_type)
+        self._event_counts[slot] += 1
+
+        self._dispatch_sync(event, self._dispatch_cache[event_type])
         return event
 
+    async def fire_events(self, events: Iterable[BaseEvent]) -> list[BaseEvent]:
+        """
+        Fire a batch of events, in order.
+
+        Consecutive events of the same type share one chain lookup and one
+        stats update. Runs whose listeners are all synchronous are dispatched
+        without awaiting, so a batch of such events suspends at most once.
+
+        Args:
+            events: The events to fire
+
+        Returns:
+            List[BaseEvent]: The event objects (potentially modified by listeners)
+        """
+        events = list(events)
+        if not self._running:
+            return events
+
+        for event_type, group in groupby(events, type):
+            group = list(group)
+
+            slot = self._stat_slots.get(event_type)
+            if slot is None:
+                slot = self._add_stat_slot(event_type)
+            self._event_counts[slot] += len(group)
+
+            chain = self._dispatch_cache.get(event_type)
+            if chain is None:
+                chain = self._build_chain(event_type)
+            if not chain:
+                continue
+
+            if self._sync_chains[event_type]:
+                for event in group:
+                    self._dispatch_sync(event, chain)
+            else:
+                for event in group:
+                    await self._dispatch(event, chain)
+
+        return events
+
+    async def _dispatch(
+        self, event: BaseEvent, chain: tuple[EventListener, ...]
+    ) -> None:
+        """Run a listener chain that may contain async listeners."""
+        for listener in chain:
+            if not (event.cancelled and not listener.ignore_cancelled):
+                callback = listener.callback
+                try:
+                    if listener.is_async:
+                        await callback(event)
+                        # shutdown() can only run from another task while
+                        # this one is suspended, so re-check after awaits only
+                        if not self._running:
+                            break
+                    else:
+                        callback(event)
+                except Exception as e:
+                    logger.error(
+                        f"Error in event listener {callback.__name__}: {e}",
+                        exc_info=True,
+                    )
+
+            if event.cancelled and not listener.ignore_cancelled:
+                break
+
+    def _dispatch_sync(
+        self, event: BaseEvent, chain: tuple[EventListener, ...]
+    ) -> None:
+        """Run a listener chain made only of synchronous listeners."""
+        for listener in chain:
+            if not (event.cancelled and not listener.ignore_cancelled):
+                callback = listener.callback
+                try:
+                    callback(event)
+                except Exception as e:
+                    logger.error(
+                        f"Error in event listener {callback.__name__}: {e}",
+                        exc_info=True,
+                    )
+
+            if event.cancelled and not listener.ignore_cancelled:
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "Event %s was cancelled, stopping propagation",
+                        type(event).__name__,
+                    )
+                break
+
     def get_listeners(
         self, event_type: Optional[type[BaseEvent]] = None
     ) -> list[EventListener]:
@@ -243,19 +570,41 @@ class EventManager:
                 all_listeners.extend(listeners)
             all_listeners.extend(self._global_listeners)
             return all_listeners
+        elif event_type is BaseEvent:
+            return self._global_listeners.copy()
         else:
             return self._listeners.get(event_type, []).copy()
 
+    def _add_stat_slot(self, event_type: type[BaseEvent]) -> int:
+        """Allocate a counter slot for an event type seen for the first time."""
+        slot = len(self._event_counts)
+        self._event_counts.append(0)
+        self._stat_names.append(event_type.__name__)
+        self._stat_slots[event_type] = slot
+        return slot
+
     def get_event_stats(self) -> dict[str, int]:
         """Get statistics about fired events."""
-        return dict(self._event_stats)
+        stats: dict[str, int] = {}
+        for name, count in zip(self._stat_names, self._event_counts):
+            if count:
+                stats[name] = stats.get(name, 0) + count
+        return stats
 
     def clear_stats(self) -> None:
         """Clear event statistics."""
-        self._event_stats.clear()
+        self._stat_slots.clear()
+        self._stat_names.clear()
+        self._event_counts = array("Q")
 
     def shutdown(self) -> None:
-        """Shutdown the event manager."""
+        """
+        Shutdown the event manager.
+
+        New fire calls return immediately. In-flight dispatches stop at
+        their next await; synchronous listeners already running finish the
+        chain they hold.
+        """
         self._running = False
         logger.info("Event manager shutdown")
 
@@ -477,9 +826,10 @@ class EventManager:
         Returns:
             性能统计信息
         """
+        event_counts = self.get_event_stats()
         stats = {
-            "total_events_fired": sum(self._event_stats.values()),
-            "event_counts": dict(self._event_stats),
+            "total_events_fired": sum(event_counts.values()),
+            "event_counts": event_counts,
             "timing_stats": {},
             "slow_events": [],
             "total_listeners": sum(
@@ -536,7 +886,8 @@ class EventManager:
 
         # 检查过滤器
         if not self.should_process_event(event):
-            logger.debug(f"Event {event.__class__.__name__} filtered out")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Event %s filtered out", event.__class__.__name__)
             return event
 
         # 调用原有的事件处理
@@ -575,9 +926,10 @@ class EventManager:
             "data": self._serialize_event_data(event),
         }
 
-        logger.debug(
-            f"Notifying {len(subscribers)} web subscribers of {event_type} event"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Notifying %d web subscribers of %s event", len(subscribers), event_type
+            )
 
         # 如果存在Web组件管理器，委托给它处理
         # 这将在Web组件中实现具体的通知逻辑
@@ -598,15 +950,43 @@ class EventManager:
         logger.info("Web notifier function set")
 
 
-# Global event manager instance
-_event_manager: EventManager | None = None
+def install_uvloop() -> bool:
+    """
+    Use uvloop for new event loops if requested via ``AETHERIUS_USE_UVLOOP=1``.
+
+    uvloop schedules callbacks in C (libuv), which makes every await in the
+    dispatch path cheaper. Must be called before the event loop is created.
+
+    Returns:
+        bool: True if the uvloop policy was installed
+    """
+    if os.environ.get("AETHERIUS_USE_UVLOOP") != "1":
+        return False
+
+    try:
+        import uvloop
+    except ImportError:
+        logger.warning("AETHERIUS_USE_UVLOOP is set but uvloop is not installed")
+        return False
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.debug("Installed uvloop event loop policy")
+    return True
+
+
+# Global event manager instance, built eagerly at import (thread-safe via the
+# import lock, and no None check on every convenience call)
+_event_manager: EventManager = EventManager()
 
 
 def get_event_manager() -> EventManager:
-    """Get the global event manager instance."""
-    global _event_manager
-    if _event_manager is None:
-        _event_manager = EventManager()
+    """
+    Get the global event manager instance.
+
+    Dispatch runs on the current asyncio loop; for lower per-await overhead
+    install uvloop (``pip install uvloop``) and set ``AETHERIUS_USE_UVLOOP=1``
+    so that the entry point calls install_uvloop() before starting the loop.
+    """
     return _event_manager
 
 
@@ -623,7 +1003,11 @@ def on_event(
     ignore_cancelled: bool = False,
 ) -> Callable[[Callable[[T], Any]], Callable[[T], Any]]:
     """
-    Decorator to register a function as an event listener.
+    Decorator to mark a function as an event listener.
+
+    The function is only tagged; it is registered when its module is passed
+    to EventManager.register_module (done by the plugin/component loader on
+    enable) or when it is passed to EventManager.register_decorated.
 
     Args:
         event_type: The type of event to listen for
@@ -637,12 +1021,9 @@ def on_event(
     """
 
     def decorator(func: Callable[[T], Any]) -> Callable[[T], Any]:
-        # Register the listener immediately
-        get_event_manager().register_listener(
-            event_type, func, priority, ignore_cancelled
-        )
+        _is_async_callback(func)
 
-        # Add metadata to the function for introspection
+        # Metadata picked up by EventManager.register_decorated
         func._event_listener = True
         func._event_type = event_type
         func._event_priority = priority
@@ -657,7 +1038,9 @@ def on_any_event(
     priority: EventPriority = EventPriority.NORMAL, ignore_cancelled: bool = False
 ) -> Callable[[Callable[[BaseEvent], Any]], Callable[[BaseEvent], Any]]:
     """
-    Decorator to register a function as a global event listener.
+    Decorator to mark a function as a global event listener.
+
+    Registration is deferred in the same way as for on_event.
 
     Args:
         priority: Priority level for the listener
@@ -670,10 +1053,9 @@ def on_any_event(
     """
 
     def decorator(func: Callable[[BaseEvent], Any]) -> Callable[[BaseEvent], Any]:
-        # Register the listener immediately
-        get_event_manager().register_global_listener(func, priority, ignore_cancelled)
+        _is_async_callback(func)
 
-        # Add metadata to the function for introspection
+        # Metadata picked up by EventManager.register_decorated
         func._global_event_listener = True
         func._event_priority = priority
         func._ignore_cancelled = ignore_cancelled
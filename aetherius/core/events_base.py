@@ -87,6 +87,13 @@ class ServerLogEvent(ServerLifecycleEvent):
     )
 
 
+class ServerLogBatchEvent(ServerLifecycleEvent):
+    """Event fired once per chunk of server output with all its complete lines."""
+
+    lines: list[str] = Field(description="Log lines, in output order")
+    level: str = Field(description="Log level of the stream (INFO, ERROR)")
+
+
 class ServerStateChangedEvent(ServerLifecycleEvent):
     """Event fired when the server state changes."""
 
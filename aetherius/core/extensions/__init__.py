@@ -105,6 +105,8 @@ class ExtensionContext:
         self.services = di_container
         self.logger = logger
         self.data_dir = data_dir
+        # 扩展模块中 @on_event 标记的监听器，加载时注册、卸载时注销
+        self.event_listeners: List[Any] = []
         
         # 扩展私有数据目录
         self.extension_data_dir = data_dir / "extensions" / extension_info.name
@@ -24,6 +24,7 @@ from . import (
     ExtensionError, ExtensionLoadError, ExtensionDependencyError,
     ExtensionPermission, ExtensionSandbox, VersionChecker
 )
+from ..event_manager import get_event_manager
 
 logger = logging.getLogger(__name__)
 
@@ -188,6 +189,12 @@ class ExtensionManager(IExtensionManager):
             await extension.unload()
             extension.state = ExtensionState.UNLOADED
             
+            # 注销扩展模块中的 @on_event 监听器
+            event_manager = get_event_manager()
+            for listener in extension.context.event_listeners:
+                event_manager.unregister_listener(listener)
+            extension.context.event_listeners.clear()
+            
             # 从注册表中移除
             with self._lock:
                 del self._extensions[name]
@@ -636,7 +643,7 @@ class PythonModuleLoader(IExtensionLoader):
             try:
                 # 尝试实例化以验证所有抽象方法都已实现
                 logger.debug(f"Attempting to instantiate {extension_class.__name__}")
-                return extension_class(context)
+                extension = extension_class(context)
             except TypeError as e:
                 if "abstract" in str(e):
                     logger.error(f"Abstract method error for {extension_class.__name__}: {e}")
@@ -650,6 +657,10 @@ class PythonModuleLoader(IExtensionLoader):
             except Exception as e:
                 logger.error(f"Unexpected error instantiating {extension_class.__name__}: {e}")
                 raise ExtensionLoadError(f"Failed to instantiate {extension_class.__name__}: {e}")
+            
+            # 注册模块中 @on_event 标记的监听器，卸载扩展时注销
+            context.event_listeners.extend(get_event_manager().register_module(module))
+            return extension
         
         except Exception as e:
             raise ExtensionLoadError(f"Failed to load module {path}: {e}")
@@ -733,7 +744,9 @@ class PythonPackageLoader(IExtensionLoader):
             if not extension_class:
                 raise ExtensionLoadError(f"No extension class found in package {path}")
             
-            return extension_class(context)
+            extension = extension_class(context)
+            context.event_listeners.extend(get_event_manager().register_module(module))
+            return extension
         
         except Exception as e:
             raise ExtensionLoadError(f"Failed to load package {path}: {e}")
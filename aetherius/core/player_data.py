@@ -1,27 +1,111 @@
 """Player data management and structured player information API."""
 
+import asyncio
+import atexit
+import hashlib
 import json
 import logging
+import mmap
+import threading
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, Optional
 
 from .config import get_config_manager
-from .event_manager import fire_event, get_event_manager
+from .event_manager import get_event_manager
 from .events_base import BaseEvent
 from .player_data_models import PlayerData, PlayerLocation, PlayerStats, PlayerInventory
 from .player_data_repository import PlayerDataRepository
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 logger = logging.getLogger(__name__)
 
+# update_player_data keyword -> PlayerData attribute. play_time has no
+# equivalent, ip_address/permissions/groups go to metadata and online is
+# applied through _set_online.
+_BASIC_FIELD_MAP = {
+    "last_seen": "last_logout",
+    "first_join": "first_join",
+    "uuid": "uuid",
+    "display_name": "display_name",
+}
+
+# set_player_stats keyword -> PlayerStats attribute (experience_total has no
+# equivalent)
+_STATS_FIELD_MAP = {
+    "health": "health",
+    "hunger": "food_level",
+    "experience_level": "xp_level",
+    "play_time": "play_time",
+    "deaths": "deaths",
+    "kills": "kills",
+    "blocks_broken": "blocks_broken",
+    "blocks_placed": "blocks_placed",
+    "distance_walked": "distance_walked",
+}
+
 
 class PlayerDataUpdatedEvent(BaseEvent):
     """Event fired when player data is updated."""
 
+    player_name: str
+    data: Any
+    source: str = "unknown"
+
     def __init__(self, player_name: str, data: PlayerData, source: str = "unknown"):
-        super().__init__()
-        self.player_name = player_name
-        self.data = data
-        self.source = source
+        super().__init__(player_name=player_name, data=data, source=source)
+
+
+def _location_from_helper(loc_data: dict[str, Any]) -> PlayerLocation:
+    """Decode a helper plugin location section."""
+    return PlayerLocation(
+        x=loc_data.get("x", 0.0),
+        y=loc_data.get("y", 0.0),
+        z=loc_data.get("z", 0.0),
+        dimension=loc_data.get("dimension", "overworld"),
+        yaw=loc_data.get("yaw", 0.0),
+        pitch=loc_data.get("pitch", 0.0),
+    )
+
+
+def _stats_from_helper(stats_data: dict[str, Any]) -> PlayerStats:
+    """Decode a helper plugin stats section."""
+    return PlayerStats(
+        health=stats_data.get("health", 20.0),
+        food_level=stats_data.get("hunger", 20),
+        xp_level=stats_data.get("experience_level", 0),
+        xp_progress=stats_data.get("experience_progress", 0.0),
+        play_time=stats_data.get("play_time", 0.0),
+        deaths=stats_data.get("deaths", 0),
+        kills=stats_data.get("kills", 0),
+        blocks_broken=stats_data.get("blocks_broken", 0),
+        blocks_placed=stats_data.get("blocks_placed", 0),
+        distance_walked=stats_data.get("distance_walked", 0.0),
+    )
+
+
+def _inventory_from_helper(inv_data: dict[str, Any]) -> PlayerInventory:
+    """Decode a helper plugin inventory section."""
+    return PlayerInventory(
+        items=inv_data.get("items", {}),
+        armor=inv_data.get("armor", {}),
+        ender_chest=inv_data.get("ender_chest", {}),
+    )
+
+
+# Helper plugin player sections (same name as the PlayerData attribute) and
+# their decoders, shared by every helper file parse
+_HELPER_SECTIONS = (
+    ("location", _location_from_helper),
+    ("stats", _stats_from_helper),
+    ("inventory", _inventory_from_helper),
+)
 
 
 class PlayerDataManager:
@@ -33,6 +117,9 @@ class PlayerDataManager:
     with helper plugins (like AetheriusHelper.jar) that can provide deep game data.
     """
 
+    # Seconds to coalesce player file writes before flushing them
+    SAVE_FLUSH_DELAY = 2.0
+
     def __init__(self, data_dir: Optional[Path] = None):
         """Initialize player data manager."""
         self.data_dir = data_dir or Path("data/players")
@@ -41,14 +128,32 @@ class PlayerDataManager:
         self.event_manager = get_event_manager()
         self.repository = PlayerDataRepository(self.data_dir)
 
-        # In-memory player data cache
+        # In-memory player data cache; players are loaded lazily from their
+        # files, the index lists every known player
         self._player_cache: dict[str, PlayerData] = {}
+        self._index: dict[str, dict[str, Any]] = {}
         self._online_players: set[str] = set()
 
         # Helper plugin integration
         self._helper_enabled = False
         self._helper_data_file = Path("data/aetherius_helper.json")
-        self._last_helper_update = 0.0
+        # (mtime_ns, size) and content digest of the last parsed helper file
+        self._last_helper_fingerprint: Optional[tuple[int, int]] = None
+        self._last_helper_digest: Optional[bytes] = None
+
+        # Players changed since the last flush; writes are coalesced and run
+        # off the event loop
+        self._dirty: set[str] = set()
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._flush_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._flush_task: Optional[asyncio.Future] = None
+        # Serialises batch writers: player and index files share fixed temp names
+        self._save_lock = threading.Lock()
+        # Sequence of the latest index snapshot taken / written, so a batch
+        # that gets the lock late never publishes an older index
+        self._index_seq = 0
+        self._saved_index_seq = 0
+        atexit.register(self.flush)
 
         # Load existing player data
         self._load_player_data()
@@ -79,22 +184,141 @@ class PlayerDataManager:
             logger.info("AetheriusHelper plugin integration disabled")
 
     def _load_player_data(self) -> None:
-        """Load existing player data from files."""
+        """Load the player index, or every player file if there is no index yet."""
         try:
+            index = self.repository.load_index()
+            if index is not None:
+                self._index = index
+                self._reconcile_index()
+                self._online_players.update(
+                    name for name, entry in self._index.items() if entry.get("is_online")
+                )
+                logger.info(f"Indexed {len(self._index)} players from repository.")
+                return
+
             self._player_cache = self.repository.load_all_players()
             for player_name, player_data in self._player_cache.items():
                 if player_data.is_online:
                     self._online_players.add(player_name)
+                self._index[player_name] = self.repository.make_index_entry(player_data)
+            self.repository.save_index(self._index)
             logger.info(f"Loaded {len(self._player_cache)} players from repository.")
         except Exception as e:
             logger.error(f"Error loading player data from repository: {e}")
 
-    def _save_player_data(self, player_name: str) -> None:
-        """Save player data to file."""
-        if player_name not in self._player_cache:
+    def _reconcile_index(self) -> None:
+        """
+        Bring the index in line with the player files on disk.
+
+        Files missing from the index (a crash between the player writes and
+        the index write, or files added externally) are loaded and indexed;
+        entries whose file is gone are dropped.
+        """
+        on_disk = set(self.repository.list_player_names())
+        stale = self._index.keys() - on_disk
+        missing = on_disk - self._index.keys()
+        if not stale and not missing:
+            return
+
+        for player_name in stale:
+            del self._index[player_name]
+        for player_name, player_data in self.repository.load_players(missing).items():
+            self._player_cache[player_name] = player_data
+            self._index[player_name] = self.repository.make_index_entry(player_data)
+
+        logger.info(
+            f"Player index reconciled: {len(missing)} added, {len(stale)} removed."
+        )
+        self.repository.save_index(self._index)
+
+    def _get_or_create(self, player_name: str) -> PlayerData:
+        """Get a player's data, creating an empty record for new players."""
+        player_data = self.get_player_data(player_name)
+        if player_data is None:
+            player_data = PlayerData(uuid="", username=player_name)
+            self._player_cache[player_name] = player_data
+        return player_data
+
+    def _set_online(self, player_name: str, player_data: PlayerData, online: bool) -> None:
+        """Set a player's online flag, keeping _online_players in sync."""
+        player_data.is_online = online
+        if online:
+            self._online_players.add(player_name)
+        else:
+            self._online_players.discard(player_name)
+
+    def _mark_dirty(self, player_name: str) -> None:
+        """Queue a player for saving and schedule a coalesced flush."""
+        self._dirty.add(player_name)
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.flush()
             return
 
-        self.repository.save_player_data(self._player_cache[player_name])
+        if self._flush_handle is not None:
+            if self._flush_loop is loop:
+                return
+            # Scheduled on a loop that has since gone away; it will never fire
+            self._flush_handle.cancel()
+
+        self._flush_loop = loop
+        self._flush_handle = loop.call_later(self.SAVE_FLUSH_DELAY, self._flush_in_thread)
+
+    def _take_dirty(self) -> list[PlayerData]:
+        """Take the pending players to save, clearing the dirty set."""
+        batch = [self._player_cache[name] for name in self._dirty if name in self._player_cache]
+        self._dirty.clear()
+        for player_data in batch:
+            self._index[player_data.username] = self.repository.make_index_entry(player_data)
+        self._index_seq += 1
+        return batch
+
+    def _save_many(
+        self, batch: list[PlayerData], index: dict[str, dict[str, Any]], seq: int
+    ) -> None:
+        """
+        Save a batch of players and the index.
+
+        Runs in a worker thread for timed flushes and inline for flush();
+        the lock makes a synchronous flush wait for an in-flight batch.
+        """
+        with self._save_lock:
+            for player_data in batch:
+                self.repository.save_player_data(player_data)
+            if seq > self._saved_index_seq:
+                self.repository.save_index(index)
+                self._saved_index_seq = seq
+
+    def _flush_in_thread(self) -> None:
+        """Timer callback: write the dirty players without blocking the loop."""
+        self._flush_handle = None
+        self._flush_loop = None
+        if self._flush_task is not None and not self._flush_task.done():
+            # Previous batch still writing; try again after another delay
+            loop = asyncio.get_running_loop()
+            self._flush_loop = loop
+            self._flush_handle = loop.call_later(self.SAVE_FLUSH_DELAY, self._flush_in_thread)
+            return
+
+        batch = self._take_dirty()
+        if batch:
+            self._flush_task = asyncio.ensure_future(
+                asyncio.to_thread(self._save_many, batch, dict(self._index), self._index_seq)
+            )
+
+    def flush(self) -> None:
+        """Write pending player data changes to disk immediately."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+            self._flush_loop = None
+
+        batch = self._take_dirty()
+        if batch:
+            # Snapshot like the threaded path; _save_many waits for any
+            # batch still being written
+            self._save_many(batch, dict(self._index), self._index_seq)
 
     async def update_from_helper_plugin(self) -> bool:
         """
@@ -109,27 +333,22 @@ class PlayerDataManager:
         try:
             # Check if file has been modified since last update
             stat = self._helper_data_file.stat()
-            if stat.st_mtime <= self._last_helper_update:
+            fingerprint = (stat.st_mtime_ns, stat.st_size)
+            if fingerprint == self._last_helper_fingerprint:
                 return False
 
-            with open(self._helper_data_file, encoding="utf-8") as f:
-                helper_data = json.load(f)
-
-            self._last_helper_update = stat.st_mtime
+            helper_data = self._read_helper_file()
+            self._last_helper_fingerprint = fingerprint
+            if helper_data is None:
+                # Rewritten with identical content
+                return False
 
             # Process helper data
             players_data = helper_data.get("players", {})
             updated_players = []
 
             for player_name, data in players_data.items():
-                if player_name not in self._player_cache:
-                    # Create new player data
-                    self._player_cache[player_name] = PlayerData(
-                        uuid=data.get("uuid", ""),
-                        username=player_name
-                    )
-
-                player_data = self._player_cache[player_name]
+                player_data = self._get_or_create(player_name)
 
                 # Update player data from helper
                 if "uuid" in data:
@@ -137,66 +356,34 @@ class PlayerDataManager:
                 if "display_name" in data:
                     player_data.display_name = data["display_name"]
                 if "online" in data:
-                    player_data.is_online = data["online"]
-
-                # Update location
-                if "location" in data:
-                    loc_data = data["location"]
-                    player_data.location = PlayerLocation(
-                        x=loc_data.get("x", 0.0),
-                        y=loc_data.get("y", 0.0),
-                        z=loc_data.get("z", 0.0),
-                        dimension=loc_data.get("dimension", "overworld"),
-                        yaw=loc_data.get("yaw", 0.0),
-                        pitch=loc_data.get("pitch", 0.0),
-                    )
-
-                # Update stats
-                if "stats" in data:
-                    stats_data = data["stats"]
-                    player_data.stats = PlayerStats(
-                        health=stats_data.get("health", 20.0),
-                        food_level=stats_data.get("hunger", 20),
-                        xp_level=stats_data.get("experience_level", 0),
-                        xp_progress=stats_data.get("experience_progress", 0.0),
-                        play_time=stats_data.get("play_time", 0.0),
-                        deaths=stats_data.get("deaths", 0),
-                        kills=stats_data.get("kills", 0),
-                        blocks_broken=stats_data.get("blocks_broken", 0),
-                        blocks_placed=stats_data.get("blocks_placed", 0),
-                        distance_walked=stats_data.get("distance_walked", 0.0),
-                    )
-
-                # Update inventory
-                if "inventory" in data:
-                    inv_data = data["inventory"]
-                    player_data.inventory = PlayerInventory(
-                        items=inv_data.get("items", {}),
-                        armor=inv_data.get("armor", {}),
-                        ender_chest=inv_data.get("ender_chest", {}),
-                    )
+                    self._set_online(player_name, player_data, data["online"])
+
+                # Decode the location/stats/inventory sections
+                for key, decode in _HELPER_SECTIONS:
+                    section = data.get(key)
+                    if section is not None:
+                        setattr(player_data, key, decode(section))
 
                 # Update custom data
                 if "custom" in data:
                     player_data.metadata.update(data["custom"])
 
-                # Track online status
-                if player_data.is_online:
-                    self._online_players.add(player_name)
-                else:
-                    self._online_players.discard(player_name)
-
                 updated_players.append(player_name)
 
-                # Fire update event
-                event = PlayerDataUpdatedEvent(
-                    player_name, player_data, "helper_plugin"
-                )
-                await fire_event(event)
-
-            # Save updated data
+            # Save updated data (coalesced, written off the event loop)
             for player_name in updated_players:
-                self._save_player_data(player_name)
+                self._mark_dirty(player_name)
+
+            # Fire update events in one batch, and only build them if anyone listens
+            if self.event_manager.has_listeners(PlayerDataUpdatedEvent):
+                await self.event_manager.fire_events(
+                    [
+                        PlayerDataUpdatedEvent(
+                            player_name, self._player_cache[player_name], "helper_plugin"
+                        )
+                        for player_name in updated_players
+                    ]
+                )
 
             logger.debug(f"Updated {len(updated_players)} players from helper plugin")
             return True
@@ -205,6 +392,29 @@ class PlayerDataManager:
             logger.error(f"Error updating from helper plugin: {e}")
             return False
 
+    def _read_helper_file(self) -> Optional[dict[str, Any]]:
+        """Parse the helper plugin data file, or return None if its content is unchanged."""
+        with open(self._helper_data_file, "rb") as f:
+            if HAS_ORJSON:
+                try:
+                    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except (ValueError, OSError):
+                    pass  # Empty file or mmap unsupported here
+                else:
+                    # Hash and parse straight from the page cache, without a bytes copy
+                    with mm, memoryview(mm) as view:
+                        return self._parse_helper_data(view)
+            return self._parse_helper_data(f.read())
+
+    def _parse_helper_data(self, raw: Any) -> Optional[dict[str, Any]]:
+        """Parse helper file content unless its digest matches the last parse."""
+        digest = hashlib.blake2b(raw, digest_size=16).digest()
+        if digest == self._last_helper_digest:
+            return None
+        helper_data = orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
+        self._last_helper_digest = digest
+        return helper_data
+
     def get_player_data(self, player_name: str) -> Optional[PlayerData]:
         """
         Get player data by name.
@@ -215,16 +425,29 @@ class PlayerDataManager:
         Returns:
             PlayerData object or None if not found
         """
-        return self._player_cache.get(player_name)
-
-    def get_all_players(self) -> dict[str, PlayerData]:
+        player_data = self._player_cache.get(player_name)
+        if player_data is None:
+            # Not loaded yet: fault in just this file. Players missing from
+            # the index are checked too, so an existing file is never
+            # shadowed by a new blank record.
+            player_data = self.repository.load_player(player_name)
+            if player_data is not None:
+                self._player_cache[player_name] = player_data
+                if player_name not in self._index:
+                    self._index[player_name] = self.repository.make_index_entry(player_data)
+        return player_data
+
+    def get_all_players(self) -> Mapping[str, PlayerData]:
         """
         Get all player data.
 
         Returns:
-            Dictionary mapping player names to PlayerData objects
+            Read-only live view mapping player names to PlayerData objects
         """
-        return self._player_cache.copy()
+        missing = [name for name in self._index if name not in self._player_cache]
+        if missing:
+            self._player_cache.update(self.repository.load_players(missing))
+        return MappingProxyType(self._player_cache)
 
     def get_online_players(self) -> dict[str, PlayerData]:
         """
@@ -233,12 +456,19 @@ class PlayerDataManager:
         Returns:
             Dictionary mapping online player names to PlayerData objects
         """
-        return {name: data for name, data in self._player_cache.items() if data.is_online}
+        # _online_players mirrors is_online exactly (see _set_online), so only
+        # the online players are visited
+        online = {}
+        for player_name in self._online_players:
+            player_data = self.get_player_data(player_name)
+            if player_data is not None:
+                online[player_name] = player_data
+        return online
 
     def get_player_count(self) -> int:
         """
         Get total number of known players."""
-        return len(self._player_cache)
+        return len(self._index.keys() | self._player_cache.keys())
 
     def get_online_count(self) -> int:
         """
@@ -257,32 +487,11 @@ class PlayerDataManager:
             True if updated successfully
         """
         try:
-            if player_name not in self._player_cache:
-                self._player_cache[player_name] = PlayerData(
-                    uuid="",
-                    username=player_name
-                )
+            player_data = self._get_or_create(player_name)
 
-            player_data = self._player_cache[player_name]
-
-            # Update basic fields - map old field names to new ones
-            field_mapping = {
-                "online": "is_online",
-                "last_seen": "last_logout", 
-                "first_join": "first_join",
-                "play_time": None,  # Handle separately
-                "ip_address": None,  # Handle via metadata
-            }
-            
-            for old_field, new_field in field_mapping.items():
-                if old_field in kwargs and new_field:
-                    setattr(player_data, new_field, kwargs[old_field])
-            
-            # Handle direct field updates
-            if "uuid" in kwargs:
-                player_data.uuid = kwargs["uuid"]
-            if "display_name" in kwargs:
-                player_data.display_name = kwargs["display_name"]
+            # Update basic fields (old field names mapped to new ones)
+            for field_name in kwargs.keys() & _BASIC_FIELD_MAP.keys():
+                setattr(player_data, _BASIC_FIELD_MAP[field_name], kwargs[field_name])
 
             # Update metadata
             if "ip_address" in kwargs:
@@ -296,14 +505,10 @@ class PlayerDataManager:
 
             # Update online status tracking
             if "online" in kwargs:
-                player_data.is_online = kwargs["online"]
-                if kwargs["online"]:
-                    self._online_players.add(player_name)
-                else:
-                    self._online_players.discard(player_name)
+                self._set_online(player_name, player_data, kwargs["online"])
 
             # Save data
-            self._save_player_data(player_name)
+            self._mark_dirty(player_name)
 
             return True
 
@@ -334,16 +539,10 @@ class PlayerDataManager:
             True if set successfully
         """
         try:
-            if player_name not in self._player_cache:
-                self._player_cache[player_name] = PlayerData(
-                    uuid="",
-                    username=player_name
-                )
-
-            player_data = self._player_cache[player_name]
+            player_data = self._get_or_create(player_name)
             player_data.location = PlayerLocation(x, y, z, dimension, yaw, pitch)
 
-            self._save_player_data(player_name)
+            self._mark_dirty(player_name)
             return True
 
         except Exception as e:
@@ -362,36 +561,16 @@ class PlayerDataManager:
             True if set successfully
         """
         try:
-            if player_name not in self._player_cache:
-                self._player_cache[player_name] = PlayerData(
-                    uuid="",
-                    username=player_name
-                )
-
-            player_data = self._player_cache[player_name]
+            player_data = self._get_or_create(player_name)
 
             if player_data.stats is None:
                 player_data.stats = PlayerStats()
 
-            # Update stats - map old field names to new ones
-            field_mapping = {
-                "health": "health",
-                "hunger": "food_level", 
-                "experience_level": "xp_level",
-                "experience_total": None,  # No direct equivalent
-                "play_time": "play_time",
-                "deaths": "deaths",
-                "kills": "kills",
-                "blocks_broken": "blocks_broken",
-                "blocks_placed": "blocks_placed",
-                "distance_walked": "distance_walked",
-            }
-            
-            for old_field, new_field in field_mapping.items():
-                if old_field in stats and new_field:
-                    setattr(player_data.stats, new_field, stats[old_field])
-
-            self._save_player_data(player_name)
+            # Update stats (old field names mapped to new ones)
+            for field_name in stats.keys() & _STATS_FIELD_MAP.keys():
+                setattr(player_data.stats, _STATS_FIELD_MAP[field_name], stats[field_name])
+
+            self._mark_dirty(player_name)
             return True
 
         except Exception as e:
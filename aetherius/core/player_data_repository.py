@@ -4,13 +4,33 @@ Repository for handling persistence of player data.
 
 import json
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
-from .player_data_models import PlayerData, PlayerLocation, PlayerStats, PlayerInventory
+from .player_data_models import PlayerData
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 logger = logging.getLogger(__name__)
 
+# Consolidated summary of every player file, read once at startup
+INDEX_FILE_NAME = "players.index.json"
+_INDEX_VERSION = 1
+
+# PlayerData fields kept in the index
+_INDEX_FIELDS = ("uuid", "username", "is_online", "last_join", "last_logout")
+_get_index_values = attrgetter(*_INDEX_FIELDS)
+
+# Player file loads are I/O bound, so use more threads than cores
+_LOAD_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
 class PlayerDataRepository:
     """
     Manages the loading and saving of PlayerData objects to/from persistent storage (JSON files).
@@ -24,83 +44,142 @@ class PlayerDataRepository:
 
     def load_all_players(self) -> Dict[str, PlayerData]:
         """Load all player data from files in the data directory."""
-        players_data: Dict[str, PlayerData] = {}
+        return self.load_players(self.list_player_names())
+
+    def list_player_names(self) -> List[str]:
+        """List the names of all players that have a data file (no parsing)."""
         try:
-            for player_file in self.data_dir.glob("*.json"):
-                player_name = player_file.stem
-                try:
-                    with open(player_file, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                    player_data = self._dict_to_player_data(data)
-                    players_data[player_name] = player_data
-                    logger.debug(f"Loaded player data for {player_name}")
-                except Exception as e:
-                    logger.error(f"Error loading player data from {player_file}: {e}")
+            return [
+                player_file.stem
+                for player_file in self.data_dir.glob("*.json")
+                if player_file.name != INDEX_FILE_NAME
+            ]
         except Exception as e:
             logger.error(f"Error scanning player data directory {self.data_dir}: {e}")
-        return players_data
+            return []
+
+    def load_players(self, player_names: Iterable[str]) -> Dict[str, PlayerData]:
+        """Load several players' data; players without a file are skipped."""
+        return self._load_player_files(
+            [self.data_dir / f"{player_name}.json" for player_name in player_names]
+        )
+
+    def _load_player_files(self, player_files: List[Path]) -> Dict[str, PlayerData]:
+        """Parse player files, in parallel when there are several."""
+        if len(player_files) <= 1:
+            results = map(self._parse_one, player_files)
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(_LOAD_WORKERS, len(player_files)),
+                thread_name_prefix="player-data-load",
+            ) as executor:
+                results = list(executor.map(self._parse_one, player_files))
+
+        return {
+            player_name: player_data
+            for player_name, player_data in results
+            if player_data is not None
+        }
+
+    def _parse_one(self, player_file: Path) -> Tuple[str, Optional[PlayerData]]:
+        """Parse one player file, keyed by player name (file stem)."""
+        if not player_file.exists():
+            return player_file.stem, None
+        return player_file.stem, self._load_player_file(player_file)
+
+    def load_player(self, player_name: str) -> Optional[PlayerData]:
+        """Load a single player's data, or None if it has no file."""
+        player_file = self.data_dir / f"{player_name}.json"
+        if not player_file.exists():
+            return None
+        return self._load_player_file(player_file)
+
+    def _load_player_file(self, player_file: Path) -> Optional[PlayerData]:
+        """Parse one player data file."""
+        try:
+            raw = player_file.read_bytes()
+            data = orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
+            player_data = PlayerData.from_dict(data)
+            logger.debug(f"Loaded player data for {player_file.stem}")
+            return player_data
+        except Exception as e:
+            logger.error(f"Error loading player data from {player_file}: {e}")
+            return None
+
+    @staticmethod
+    def make_index_entry(player_data: PlayerData) -> Dict[str, Any]:
+        """Build the index summary of a player."""
+        return dict(zip(_INDEX_FIELDS, _get_index_values(player_data)))
+
+    def load_index(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        Load the player index.
+
+        Returns None if there is no usable index, in which case the caller
+        should fall back to load_all_players and write a fresh one.
+        """
+        index_file = self.data_dir / INDEX_FILE_NAME
+        try:
+            raw = index_file.read_bytes()
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.error(f"Error reading player index {index_file}: {e}")
+            return None
+
+        try:
+            index = orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
+            if index.get("version") != _INDEX_VERSION:
+                return None
+            return index["players"]
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable player index {index_file}: {e}")
+            return None
+
+    def save_index(self, entries: Dict[str, Dict[str, Any]]) -> bool:
+        """Write the player index (atomically, like player files)."""
+        index_file = self.data_dir / INDEX_FILE_NAME
+        index = {"version": _INDEX_VERSION, "players": entries}
+        try:
+            if HAS_ORJSON:
+                payload = orjson.dumps(index)
+            else:
+                payload = json.dumps(index, ensure_ascii=False).encode('utf-8')
+            tmp_file = index_file.with_suffix('.json.tmp')
+            with open(tmp_file, 'wb', buffering=65536) as f:
+                f.write(payload)
+            os.replace(tmp_file, index_file)
+            return True
+        except Exception as e:
+            logger.error(f"Error saving player index {index_file}: {e}")
+            return False
 
     def save_player_data(self, player_data: PlayerData) -> bool:
         """Save a single PlayerData object to its corresponding file."""
-        if not player_data.name:
+        if not player_data.username:
             logger.error("Cannot save player data: Player name is missing.")
             return False
 
         try:
-            player_file = self.data_dir / f"{player_data.name}.json"
-            data = self._player_data_to_dict(player_data)
-            with open(player_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-            logger.debug(f"Saved player data for {player_data.name}")
+            player_file = self.data_dir / f"{player_data.username}.json"
+            if HAS_ORJSON:
+                # orjson serializes the dataclass natively, in field order
+                # (same layout as PlayerData.to_dict), straight to bytes
+                payload = orjson.dumps(
+                    player_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                )
+            else:
+                payload = json.dumps(
+                    player_data.to_dict(), indent=2, ensure_ascii=False
+                ).encode('utf-8')
+            # One write of the whole payload to a temp file, then an atomic
+            # rename so a crash never leaves a torn player file
+            tmp_file = player_file.with_suffix('.json.tmp')
+            with open(tmp_file, 'wb', buffering=65536) as f:
+                f.write(payload)
+            os.replace(tmp_file, player_file)
+            logger.debug(f"Saved player data for {player_data.username}")
             return True
         except Exception as e:
-            logger.error(f"Error saving player data for {player_data.name}: {e}")
+            logger.error(f"Error saving player data for {player_data.username}: {e}")
             return False
-
-    def _dict_to_player_data(self, data: Dict[str, Any]) -> PlayerData:
-        """Convert dictionary to PlayerData object."""
-        location = PlayerLocation(**data['location']) if 'location' in data else None
-        stats = PlayerStats(**data['stats']) if 'stats' in data else None
-        inventory = PlayerInventory(**data['inventory']) if 'inventory' in data else None
-
-        return PlayerData(
-            name=data['name'],
-            uuid=data.get('uuid'),
-            display_name=data.get('display_name'),
-            online=data.get('online', False),
-            last_seen=data.get('last_seen'),
-            first_join=data.get('first_join'),
-            play_time=data.get('play_time', 0.0),
-            location=location,
-            stats=stats,
-            inventory=inventory,
-            ip_address=data.get('ip_address'),
-            permissions=data.get('permissions', []),
-            groups=data.get('groups', []),
-            custom_data=data.get('custom_data', {})
-        )
-
-    def _player_data_to_dict(self, player_data: PlayerData) -> Dict[str, Any]:
-        """Convert PlayerData object to dictionary."""
-        data = {
-            'name': player_data.name,
-            'uuid': player_data.uuid,
-            'display_name': player_data.display_name,
-            'online': player_data.online,
-            'last_seen': player_data.last_seen,
-            'first_join': player_data.first_join,
-            'play_time': player_data.play_time,
-            'ip_address': player_data.ip_address,
-            'permissions': player_data.permissions,
-            'groups': player_data.groups,
-            'custom_data': player_data.custom_data
-        }
-
-        if player_data.location:
-            data['location'] = player_data.location.__dict__
-        if player_data.stats:
-            data['stats'] = player_data.stats.__dict__
-        if player_data.inventory:
-            data['inventory'] = player_data.inventory.__dict__
-
-        return data
@@ -14,6 +14,7 @@ from .config_models import ServerConfig
 from .event_manager import fire_event, get_event_manager
 from .events_base import (
     ServerCrashEvent,
+    ServerLogBatchEvent,
     ServerLogEvent,
     ServerStartedEvent,
     ServerStateChangedEvent,
@@ -22,6 +23,9 @@ from .events_base import (
 
 logger = logging.getLogger(__name__)
 
+# Bytes read from the server's output pipes per read call
+_READ_CHUNK_SIZE = 65536
+
 
 class ServerState(Enum):
     """Represents the lifecycle state of the server."""
@@ -172,37 +176,59 @@ class ServerController:
             await self._handle_crash()
             return False
 
-    async def _read_stdout(self):
-        """Continuously read and process stdout from the server."""
-        while self.process and self.process.stdout and not self.process.stdout.at_eof():
+    async def _fire_log_events(self, level: str, lines: list[str]):
+        """Fire a ServerLogBatchEvent plus one ServerLogEvent per line."""
+        manager = get_event_manager()
+        if manager.has_listeners(ServerLogBatchEvent):
+            await manager.fire_event(ServerLogBatchEvent(level=level, lines=lines))
+        if manager.has_listeners(ServerLogEvent):
+            # One batched dispatch; all-sync listener chains run without awaits
+            await manager.fire_events(
+                [ServerLogEvent(line=line, level=level, message=line) for line in lines]
+            )
+
+    async def _read_stream(self, stream: asyncio.StreamReader, level: str, name: str):
+        """Read a server output stream in chunks and fire its lines as log events."""
+        buffer = bytearray()
+        while True:
             try:
-                line_bytes = await self.process.stdout.readline()
-                if not line_bytes:
+                chunk = await stream.read(_READ_CHUNK_SIZE)
+                if not chunk:
                     break
-                line = line_bytes.decode("utf-8", errors="replace").strip()
-                if line:
-                    await fire_event(ServerLogEvent(level="INFO", message=line))
+                buffer += chunk
+                if b"\n" not in chunk:
+                    continue
+                # Keep the trailing partial line for the next chunk
+                *complete, buffer = buffer.split(b"\n")
+                lines = [
+                    line
+                    for line in (
+                        raw.decode("utf-8", errors="replace").strip() for raw in complete
+                    )
+                    if line
+                ]
+                if lines:
+                    await self._fire_log_events(level, lines)
             except asyncio.CancelledError:
-                break
+                return
             except Exception as e:
-                logger.error(f"Error reading stdout: {e}")
-                break
+                logger.error(f"Error reading {name}: {e}")
+                return
+
+        # Output ended without a final newline
+        line = buffer.decode("utf-8", errors="replace").strip()
+        if line:
+            await self._fire_log_events(level, [line])
+
+    async def _read_stdout(self):
+        """Continuously read and process stdout from the server."""
+        if self.process and self.process.stdout:
+            await self._read_stream(self.process.stdout, "INFO", "stdout")
 
     async def _read_stderr(self):
         """Continuously read and process stderr from the server."""
-        while self.process and self.process.stderr and not self.process.stderr.at_eof():
-            try:
-                line_bytes = await self.process.stderr.readline()
-                if not line_bytes:
-                    break
-                line = line_bytes.decode("utf-8", errors="replace").strip()
-                if line:
-                    await fire_event(ServerLogEvent(level="ERROR", message=line))
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                logger.error(f"Error reading stderr: {e}")
-                break
+        if self.process and self.process.stderr:
+            await self._read_stream(self.process.stderr, "ERROR", "stderr")
 
     async def _monitor_process(self):
         """Wait for the process to exit and handle the result."""
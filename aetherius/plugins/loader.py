@@ -85,8 +85,8 @@ class PluginManager(AssetManager):
                     return plugin_class()
 
         # Look for any Plugin subclass
-        for name, obj in inspect.getmembers(module, inspect.isclass):
-            if issubclass(obj, Plugin) and obj is not Plugin:
+        for obj in vars(module).values():
+            if isinstance(obj, type) and obj is not Plugin and issubclass(obj, Plugin):
                 return obj()
 
         # Look for entry point function
@@ -99,8 +99,8 @@ class PluginManager(AssetManager):
 
         # Look for lifecycle functions with decorators
         lifecycle_hooks = {}
-        for name, obj in inspect.getmembers(module, inspect.isfunction):
-            if hasattr(obj, "_plugin_hook"):
+        for obj in vars(module).values():
+            if inspect.isfunction(obj) and hasattr(obj, "_plugin_hook"):
                 hook_name = obj._plugin_hook
                 lifecycle_hooks[hook_name] = obj
 